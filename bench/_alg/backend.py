@@ -0,0 +1,49 @@
+"""Benchmark NumPy vs. SymPy Algebra Backends on Identical Constructions."""
+
+
+from __future__ import annotations
+
+from random import Random
+from timeit import repeat
+from typing import TYPE_CHECKING
+
+from g._alg import NumPyBackend, SymPyBackend
+from g.session import Session
+
+if TYPE_CHECKING:
+    from g._alg.abc import _AlgBackendABC
+
+
+N: int = 100
+
+
+def construct(backend: _AlgBackendABC, coords: list[tuple[int, int]], /) -> None:  # noqa: E501
+    """Intersect, project & measure across consecutive point quadruples."""
+    points: list = [backend.point(c) for c in coords]
+
+    for p, q, r, t in zip(points, points[1:], points[2:], points[3:]):
+        backend.line_coefficients(p, q)
+
+        if (x := backend.intersect_lines(p, q, r, t)) is not None:
+            backend.distance(x, p)
+
+        backend.norm(backend.sub(backend.project(r, p, backend.sub(q, p)), r))  # noqa: E501
+
+
+if __name__ == '__main__':
+    rng: Random = Random(0)
+    coords: list[tuple[int, int]] = [(rng.randint(-99, 99), rng.randint(-99, 99))  # noqa: E501
+                                     for _ in range(N + 3)]
+
+    ms: dict[str, float] = {}
+
+    for backend in (SymPyBackend(), NumPyBackend()):
+        s: Session = Session(alg_backend=backend)
+        label: str = type(s.alg_backend).__name__
+
+        ms[label] = min(repeat(lambda s=s: construct(s.alg_backend, coords),
+                               number=1, repeat=3)) * 1e3
+
+        print(f'{label:<20} {ms[label]:>10.2f} ms / {N} constructions')
+
+    print(f"\nspeed-up: {ms['SymPyBackend'] / ms['NumPyBackend']:.0f}x")
@@ -0,0 +1,81 @@
+"""Benchmark Import Times with Cold vs. Warm Decoration Plan Cache."""
+
+
+from collections.abc import Sequence
+import os
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+
+from g._util.persistent_cache import CACHE_DIR_ENV_VAR
+
+
+# importable (sub-)packages, as legacy Euclidean entity modules are not
+SUB_PACKAGES: Sequence[str] = (
+    'g._core',
+    'g._core.point',
+    'g.session',
+    'g',
+    'g.euclid',
+    'g.euclid.r2.intersect',
+)
+
+N_RUNS: int = 5
+
+
+# print wall-clock import time & time spent planning decorations, in ms
+_SNIPPET: str = """
+import cProfile, pstats, time
+
+t = time.perf_counter()
+__import__({sub_package!r})
+import_ms = (time.perf_counter() - t) * 1e3
+
+for name in [m for m in __import__('sys').modules if m == 'g' or m.startswith('g.')]:
+    del __import__('sys').modules[name]
+
+profiler = cProfile.Profile()
+profiler.runcall(__import__, {sub_package!r})
+plan_ms = sum(ct for (_, _, func), (_, _, _, ct, _) in pstats.Stats(profiler).stats.items()
+              if func == '_decoration_plan') * 1e3
+
+print(import_ms, plan_ms)
+"""
+
+
+def import_and_plan_times(sub_package: str, cache_dir: str, /) -> tuple[float, float] | None:  # noqa: E501
+    """Return import & decoration planning times (ms), or None if failed."""
+    completed_process: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-c', _SNIPPET.format(sub_package=sub_package)],
+        env=os.environ | {CACHE_DIR_ENV_VAR: cache_dir},
+        capture_output=True, text=True, check=False)
+
+    if completed_process.returncode:
+        return None
+
+    import_ms, plan_ms = map(float, completed_process.stdout.split())
+    return import_ms, plan_ms
+
+
+if __name__ == '__main__':
+    print(f"{'sub-package':<20} {'import cold':>12} {'import warm':>12} "
+          f"{'plan cold':>10} {'plan warm':>10}  (ms)")
+
+    for sub_package in SUB_PACKAGES:
+        cold_times: list[tuple[float, float] | None] = []
+        warm_times: list[tuple[float, float] | None] = []
+
+        for _ in range(N_RUNS):
+            with TemporaryDirectory() as cache_dir:
+                cold_times.append(import_and_plan_times(sub_package, cache_dir))  # noqa: E501
+                warm_times.append(import_and_plan_times(sub_package, cache_dir))  # noqa: E501
+
+        if None in cold_times:
+            print(f'{sub_package:<20} (import error)')
+            continue
+
+        print(f'{sub_package:<20} '
+              f'{min(t[0] for t in cold_times):>12.1f} '
+              f'{min(t[0] for t in warm_times):>12.1f} '
+              f'{min(t[1] for t in cold_times):>10.2f} '
+              f'{min(t[1] for t in warm_times):>10.2f}')
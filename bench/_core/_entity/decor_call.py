@@ -0,0 +1,121 @@
+"""Benchmark Per-Call Overhead of Entity-Producing Method Wrappers."""
+
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import wraps
+from inspect import isfunction
+from timeit import repeat
+from typing import Any, Self
+
+from g._core import ANonGeomEntity, assign_entity_dependencies_and_name
+from g._core._entity.decor import _decorate, _INIT, _INSTANCE_METHOD, _PROPERTY  # noqa: E501
+
+
+N: int = 10 ** 5
+
+
+def legacy_decorate(function: Callable, /) -> Callable:
+    """Replicate previous generic wrapper, for comparison."""
+    @wraps(wrapped=function)
+    def func_w_deps_and_name_assignment(*args: Any, name: Any = None,
+                                        **kwargs: Any) -> Any:
+        dependencies: set = {i
+                             for i in (args + tuple(kwargs.values()))
+                             if isinstance(i, ANonGeomEntity)}
+
+        if isfunction(object=name):
+            name: str = name()
+
+        result: Any = function(*args, **kwargs)
+
+        if function.__name__ == '__new__':
+            return result
+
+        if function.__name__ == '__init__':
+            self: Any = args[0]
+
+            if not hasattr(self, self._DEPS_ATTR_KEY):
+                self.dependencies = dependencies - {self}
+
+            return None
+
+        if not hasattr(result, result._DEPS_ATTR_KEY):
+            result.dependencies = dependencies
+
+        return result
+
+    return func_w_deps_and_name_assignment
+
+
+class Line(ANonGeomEntity):
+    """Minimal entity standing in for geometric lines."""
+
+    _short_repr: str = 'Ln'
+
+    def __init__(self: Self, point: Line | None = None,
+                 direction: Line | None = None, /,
+                 *, slope: float = 0.0) -> None:
+        self.point: Line | None = point
+        self.direction: Line | None = direction
+        self.slope: float = slope
+
+    def perpendicular_line(self: Self, point: Line, /) -> Line:
+        line: Line = object.__new__(Line)
+        line.point, line.direction, line.slope = point, self, -self.slope
+        return line
+
+    @property
+    def parallel(self: Self, /) -> Line:
+        line: Line = object.__new__(Line)
+        line.point, line.direction, line.slope = self, self, self.slope
+        return line
+
+
+def bench(label: str, stmt: Callable[[], Any], /) -> float:
+    """Print & return best per-call time in nanoseconds."""
+    ns_per_call: float = min(repeat(stmt=stmt, number=N, repeat=5)) / N * 1e9
+    print(f'{label:<40} {ns_per_call:>10.0f} ns/call')
+    return ns_per_call
+
+
+if __name__ == '__main__':
+    ln: Line = Line()
+    pt: Line = Line()
+
+    raw_init: Callable = Line.__init__
+    raw_perpendicular_line: Callable = Line.perpendicular_line
+    raw_parallel: Callable = Line.parallel.fget
+
+    legacy_init: Callable = legacy_decorate(raw_init)
+    legacy_perpendicular_line: Callable = legacy_decorate(raw_perpendicular_line)  # noqa: E501
+    legacy_parallel: Callable = legacy_decorate(raw_parallel)
+
+    fast_init: Callable = _decorate(raw_init, kind=_INIT, assign_name=False)
+    fast_perpendicular_line: Callable = _decorate(raw_perpendicular_line,
+                                                  kind=_INSTANCE_METHOD)
+    fast_parallel: Callable = _decorate(raw_parallel, kind=_PROPERTY,
+                                        assign_name=False)
+
+    def fresh() -> Line:
+        return object.__new__(Line)
+
+    for label, raw, legacy, fast in (
+            ('__init__(point, direction, slope=)',
+             lambda: raw_init(fresh(), pt, ln, slope=1.0),
+             lambda: legacy_init(fresh(), pt, ln, slope=1.0),
+             lambda: fast_init(fresh(), pt, ln, slope=1.0)),
+            ('perpendicular_line(point)',
+             lambda: raw_perpendicular_line(ln, pt),
+             lambda: legacy_perpendicular_line(ln, pt),
+             lambda: fast_perpendicular_line(ln, pt)),
+            ('property getter',
+             lambda: raw_parallel(ln),
+             lambda: legacy_parallel(ln),
+             lambda: fast_parallel(ln))):
+        print(label)
+        raw_ns: float = bench('  undecorated', raw)
+        legacy_overhead: float = bench('  legacy generic wrapper', legacy) - raw_ns  # noqa: E501
+        fast_overhead: float = bench('  specialized wrapper', fast) - raw_ns
+        print(f'  overhead: {legacy_overhead:.0f} -> {fast_overhead:.0f} ns/call\n')  # noqa: E501
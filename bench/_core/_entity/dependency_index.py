@@ -0,0 +1,46 @@
+"""Benchmark Downstream Queries of Reverse Dependency Index."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+from typing import Self
+
+from g._core import ANonGeomEntity, assign_entity_dependencies_and_name, Var
+from g.session import Session
+
+
+@assign_entity_dependencies_and_name
+class Node(ANonGeomEntity):
+    """Minimal entity standing in for derived geometric entities."""
+
+    _short_repr: str = 'Node'
+
+    def __init__(self: Self, *parents: Node | Var) -> None:
+        self.parents: tuple[Node | Var, ...] = parents
+
+
+def scan_dependents(entities: list[ANonGeomEntity], entity: ANonGeomEntity, /) -> list[ANonGeomEntity]:  # noqa: E501
+    """Find direct dependents by scanning all entities, for comparison."""
+    return [i for i in entities
+            if any(j is entity for j in i.dependencies)]
+
+
+if __name__ == '__main__':
+    for n in (10 ** 3, 10 ** 4, 10 ** 5):
+        s: Session = Session()
+        s.x = x = Var('x')
+
+        # chain of n nodes, with one small branch off the root
+        nodes: list[ANonGeomEntity] = [Node(x)]
+        nodes.extend(Node(nodes[-1]) for _ in range(n - 1))
+        leaf: Node = Node(nodes[0])
+        nodes.append(leaf)
+
+        scan_us: float = min(repeat(lambda: scan_dependents(nodes, leaf),
+                                    number=10, repeat=3)) / 10 * 1e6
+        index_us: float = min(repeat(lambda: s.dependents(leaf),
+                                     number=1000, repeat=3)) / 1000 * 1e6
+
+        print(f'{n:>7} entities: scan {scan_us:>10.1f} µs,'
+              f' index {index_us:>6.2f} µs')
@@ -0,0 +1,45 @@
+"""Benchmark Numeric Fast Path of Concrete Point Arithmetic."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+from sympy.geometry.point import Point3D
+
+from g import Pt, Var, Vec
+
+
+N: int = 10 ** 3
+
+
+def bench(label: str, stmt, /) -> float:
+    """Print & return best per-call time in microseconds."""
+    us_per_call: float = min(repeat(stmt=stmt, number=N, repeat=5)) / N * 1e6
+    print(f'{label:<44} {us_per_call:>8.2f} µs/call')
+    return us_per_call
+
+
+if __name__ == '__main__':
+    p, q, v = Pt(1.5, -2.5, .5), Pt(.25, 4., 1.), Vec(1., 2., 3.)
+    assert p.numeric and q.numeric
+
+    # symbolic counterparts
+    sp, sq = Point3D(1.5, -2.5, .5, evaluate=False), Point3D(.25, 4., 1., evaluate=False)  # noqa: E501
+    x: Var = Var('x')
+    xp: Pt = Pt(x, -2.5, .5)
+
+    slow: float = bench('Point3D(x, y, z, evaluate=False)',
+                        lambda: Point3D(1.5, -2.5, .5, evaluate=False))
+    fast: float = bench('Pt(x, y, z), numeric', lambda: Pt(1.5, -2.5, .5))
+    print(f'construction speed-up: {slow / fast:.1f}x\n')
+
+    slow: float = bench('Point3D + Point3D', lambda: sp + sq)
+    symbolic: float = bench('Pt + Vec, with Variable', lambda: xp + v)
+    fast: float = bench('Pt + Vec, numeric', lambda: p + v)
+    print(f'translation speed-up: {slow / fast:.1f}x vs. SymPy, '
+          f'{symbolic / fast:.1f}x vs. symbolic\n')
+
+    slow: float = bench('Point3D - Point3D', lambda: sp - sq)
+    fast: float = bench('Pt - Pt, numeric', lambda: p - q)
+    print(f'displacement speed-up: {slow / fast:.1f}x')
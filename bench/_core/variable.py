@@ -0,0 +1,69 @@
+"""Benchmark Variable Rebinding with Incremental Cache Invalidation."""
+
+
+from __future__ import annotations
+
+from functools import cached_property
+from timeit import repeat
+from typing import Self
+
+from g._core import ANonGeomEntity, assign_entity_dependencies_and_name, Var
+from g.session import Session
+
+
+AFFECTED_SUBGRAPH_SIZE: int = 100
+
+
+@assign_entity_dependencies_and_name
+class Sum(ANonGeomEntity):
+    """Minimal entity with cached property standing in for geometric ones."""
+
+    _short_repr: str = 'Sum'
+
+    def __init__(self: Self, *terms: Sum | Var) -> None:
+        self.terms: tuple[Sum | Var, ...] = terms
+
+    @cached_property
+    def value(self: Self, /) -> int:
+        return sum(term.expr if isinstance(term, Var) else term.value
+                   for term in self.terms)
+
+
+def chain(var: Var, n: int, /) -> list[Sum]:
+    """Build chain of n sums downstream of variable."""
+    sums: list[Sum] = [Sum(var)]
+    sums.extend(Sum(sums[-1]) for _ in range(n - 1))
+    return sums
+
+
+def invalidate_all(entities: list[ANonGeomEntity], /) -> None:
+    """Clear all cached properties in session, for comparison."""
+    for entity in entities:
+        entity._invalidate_cached_properties()
+
+
+if __name__ == '__main__':
+    for n_unaffected in (10 ** 3, 10 ** 4, 10 ** 5):
+        s: Session = Session()
+        s.x = x = Var('x', expr=0)
+        s.y = y = Var('y', expr=0)
+
+        affected: list[Sum] = chain(x, AFFECTED_SUBGRAPH_SIZE)
+        unaffected: list[Sum] = chain(y, n_unaffected)
+        everything: list[Sum] = affected + unaffected
+
+        for i in everything:
+            i.value  # noqa: B018
+
+        exprs = iter(range(1, 10 ** 9))
+
+        def edit() -> None:
+            x.expr = next(exprs)
+
+        edit_us: float = min(repeat(edit, number=100, repeat=5)) / 100 * 1e6
+        full_us: float = min(repeat(lambda: invalidate_all(everything),
+                                    number=3, repeat=3)) / 3 * 1e6
+
+        print(f'{AFFECTED_SUBGRAPH_SIZE} affected + {n_unaffected:>6} unaffected:'  # noqa: E501
+              f' incremental {edit_us:>8.1f} µs,'
+              f' invalidate all {full_us:>10.1f} µs')
@@ -0,0 +1,70 @@
+"""Benchmark Per-Instance Caching & Slots Layout of Vectors."""
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+import gc
+from timeit import repeat
+import tracemalloc
+from typing import Self
+
+from g._core import ANonGeomEntity, Vector, assign_entity_dependencies_and_name
+
+
+N: int = 10 ** 5
+
+
+@assign_entity_dependencies_and_name
+@dataclass(unsafe_hash=True, order=True)
+class LegacyVector(ANonGeomEntity):
+    """Replicate previous globally-cached, dict-based layout, for comparison."""
+
+    x: float = 0
+    y: float = 0
+    z: float = 0
+
+    @cache
+    def __len__(self: Self) -> float:
+        return (self.x ** 2 + self.y ** 2 + self.z ** 2) ** .5
+
+    @cache
+    def unit(self: Self) -> Self:
+        m: float = self.__len__()
+        return type(self)(x=self.x / m, y=self.y / m, z=self.z / m)
+
+
+def traced_mib(make: type, /) -> tuple[float, float]:
+    """Return memory held by N vectors, before & after measuring & discarding them."""  # noqa: E501
+    gc.collect()
+    tracemalloc.start()
+
+    vectors: list = [make(i, i + 1., i + 2.) for i in range(N)]
+    held_mib: float = tracemalloc.get_traced_memory()[0] / 2 ** 20
+
+    for v in vectors:
+        v.unit()
+
+    del vectors
+    gc.collect()
+    leaked_mib: float = tracemalloc.get_traced_memory()[0] / 2 ** 20
+
+    tracemalloc.stop()
+    return held_mib, leaked_mib
+
+
+if __name__ == '__main__':
+    for cls in (LegacyVector, Vector):
+        held_mib, leaked_mib = traced_mib(cls)
+        print(f'{cls.__name__:<14} {N} vectors: {held_mib:>6.1f} MiB held,'
+              f' {leaked_mib:>6.1f} MiB retained after discarding')
+
+    print()
+
+    for cls in (LegacyVector, Vector):
+        v = cls(1., 2., 3.)
+        len_ns: float = min(repeat(v.__len__, number=N, repeat=5)) / N * 1e9
+        unit_ns: float = min(repeat(v.unit, number=N, repeat=5)) / N * 1e9
+        print(f'{cls.__name__:<14} repeated __len__ {len_ns:>6.0f} ns,'
+              f' unit {unit_ns:>6.0f} ns')
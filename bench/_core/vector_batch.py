@@ -0,0 +1,41 @@
+"""Benchmark Vectorized Vector Batches vs. Loops over Vectors."""
+
+
+from __future__ import annotations
+
+from random import Random
+from timeit import repeat
+
+from g import Vector, VectorBatch, Ux
+
+
+N: int = 10 ** 4
+
+
+# loops compute magnitudes afresh, as Vectors cache them per instance
+if __name__ == '__main__':
+    rng: Random = Random(0)
+    vectors: list[Vector] = [Vector(rng.random(), rng.random(), rng.random())
+                             for _ in range(N)]
+    batch: VectorBatch = VectorBatch.from_vectors(vectors)
+
+    for label, loop, vectorized in (
+            ('dot',
+             lambda: [v.x * Ux.x + v.y * Ux.y + v.z * Ux.z for v in vectors],
+             lambda: batch.dot(Ux)),
+            ('cross',
+             lambda: [Vector(v.y * Ux.z - v.z * Ux.y,
+                             v.z * Ux.x - v.x * Ux.z,
+                             v.x * Ux.y - v.y * Ux.x) for v in vectors],
+             lambda: batch.cross(Ux)),
+            ('norm',
+             lambda: [(v.x ** 2 + v.y ** 2 + v.z ** 2) ** .5 for v in vectors],  # noqa: E501
+             batch.norm),
+            ('unit',
+             lambda: [Vector(v.x / (m := (v.x ** 2 + v.y ** 2 + v.z ** 2) ** .5),  # noqa: E501
+                             v.y / m, v.z / m) for v in vectors],
+             batch.unit)):
+        loop_ms: float = min(repeat(loop, number=1, repeat=3)) * 1e3
+        batch_ms: float = min(repeat(vectorized, number=1, repeat=3)) * 1e3
+        print(f'{label:<6} {N} Vectors: loop {loop_ms:>8.2f} ms,'
+              f' VectorBatch {batch_ms:>6.3f} ms ({loop_ms / batch_ms:,.0f}x)')
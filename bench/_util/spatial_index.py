@@ -0,0 +1,46 @@
+"""Benchmark KD-Tree Spatial Index vs. Linear Scans."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+
+from g._util.spatial_index import SpatialIndex
+
+
+N_QUERIES: int = 100
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    for n in (10 ** 3, 10 ** 4, 10 ** 5):
+        coords: np.ndarray = rng.random((n, 2))
+        keys: list[int] = list(range(n))
+        queries: np.ndarray = rng.random((N_QUERIES, 2))
+
+        build_ms: float = min(repeat(lambda: SpatialIndex(2, zip(keys, coords)),  # noqa: E501
+                                     number=1, repeat=3)) * 1e3
+        index: SpatialIndex = SpatialIndex(2, zip(keys, coords))
+
+        def scan_nearest() -> None:
+            for q in queries:
+                np.argpartition(((coords - q) ** 2).sum(axis=1), 4)[:5]
+
+        scan_us: float = min(repeat(scan_nearest, number=1, repeat=3)) / N_QUERIES * 1e6  # noqa: E501
+        tree_us: float = min(repeat(lambda: [index.nearest(q, k=5) for q in queries],  # noqa: E501
+                                    number=1, repeat=3)) / N_QUERIES * 1e6
+        batch_us: float = min(repeat(lambda: index.nearest_batch(queries, k=5),  # noqa: E501
+                                     number=1, repeat=3)) / N_QUERIES * 1e6
+
+        radius_us: float = min(repeat(lambda: [index.within_radius(q, .01) for q in queries],  # noqa: E501
+                                      number=1, repeat=3)) / N_QUERIES * 1e6
+        radius_batch_us: float = min(repeat(lambda: index.within_radius_batch(queries, .01),  # noqa: E501
+                                            number=1, repeat=3)) / N_QUERIES * 1e6
+
+        print(f'{n:>7} points: build {build_ms:>7.1f} ms;'
+              f' 5-nearest scan {scan_us:>7.1f} µs vs. KD-tree {tree_us:>6.1f} µs'  # noqa: E501
+              f' (batch {batch_us:>5.1f} µs);'
+              f' radius {radius_us:>6.1f} µs (batch {radius_batch_us:>5.1f} µs)')  # noqa: E501
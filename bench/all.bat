@@ -0,0 +1,8 @@
+@echo off
+
+
+for /r "%~dp0" %%f in (*.py) do (
+  echo %%f
+  python "%%f"
+  echo.
+)
@@ -0,0 +1,54 @@
+"""Benchmark Blocked Pairwise Distances vs. Naive Broadcasting."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+import tracemalloc
+
+import numpy as np
+
+from g.euclid.distance import pairwise_distance_blocks, pairwise_distances
+
+
+def naive(a: np.ndarray, b: np.ndarray, /) -> np.ndarray:
+    """Broadcast all coordinate differences at once, for comparison."""
+    return np.sqrt(((a[:, np.newaxis] - b) ** 2).sum(axis=2))
+
+
+def peak_mib(f, /) -> float:
+    """Return peak traced memory of call, in MiB."""
+    tracemalloc.start()
+    f()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    for n in (1000, 3000):
+        a: np.ndarray = rng.random((n, 3))
+
+        naive_ms: float = min(repeat(lambda a=a: naive(a, a), number=1, repeat=3)) * 1e3  # noqa: E501
+        blocked_ms: float = min(repeat(lambda a=a: pairwise_distances(a), number=1, repeat=3)) * 1e3  # noqa: E501
+
+        print(f'{n} x {n}: naive {naive_ms:>7.1f} ms, {peak_mib(lambda a=a: naive(a, a)):>6.0f} MiB peak;'  # noqa: E501
+              f' blocked {blocked_ms:>6.1f} ms, {peak_mib(lambda a=a: pairwise_distances(a)):>6.0f} MiB peak')  # noqa: E501
+
+    # streaming a 100k x 100k matrix (80 GB as float64) in bounded memory,
+    # e.g., counting close pairs, over its first 10 row blocks only
+    a: np.ndarray = rng.random((10 ** 5, 3))
+    blocks = pairwise_distance_blocks(a)
+
+    def stream_row_blocks() -> int:
+        n_close: int = 0
+        for i, (*_, block) in enumerate(blocks):
+            n_close += int((block < .01).sum())
+            if i == 10 * 98 - 1:
+                break
+        return n_close
+
+    print(f'100k x 100k streamed (first 10 row blocks):'
+          f' {peak_mib(stream_row_blocks):.0f} MiB peak')
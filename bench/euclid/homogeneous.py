@@ -0,0 +1,36 @@
+"""Benchmark Homogeneous Joins & Meets vs. SymPy Line2D Construction."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+from sympy.geometry.line import Line2D
+
+from g.euclid.homogeneous import join, meet
+
+
+N: int = 10 ** 6
+N_SYMPY: int = 100
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    # finite points, & equally many points at infinity, mixed freely
+    p: np.ndarray = np.concatenate((rng.random((N, 2)), np.ones((N, 1))), axis=1)  # noqa: E501
+    q: np.ndarray = np.concatenate((rng.random((N, 2)), rng.integers(0, 2, (N, 1))), axis=1)  # noqa: E501
+
+    join_us: float = min(repeat(lambda: join(p, q), number=1, repeat=3)) / N * 1e6  # noqa: E501
+
+    lines: np.ndarray = join(p, q)
+    meet_us: float = min(repeat(lambda: meet(lines[:-1], lines[1:]), number=1, repeat=3)) / N * 1e6  # noqa: E501
+
+    pairs: list[tuple] = [(tuple(a), tuple(b))
+                          for a, b in rng.integers(-99, 99, (N_SYMPY, 2, 2)).tolist()]  # noqa: E501
+    sympy_us: float = min(repeat(lambda: [Line2D(a, b) for a, b in pairs],
+                                 number=1, repeat=3)) / N_SYMPY * 1e6
+
+    print(f'join: {join_us:.4f} µs/line vs. SymPy Line2D {sympy_us:.1f} µs/line'
+          f' ({sympy_us / join_us:,.0f}x); meet: {meet_us:.4f} µs/point')
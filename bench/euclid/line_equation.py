@@ -0,0 +1,38 @@
+"""Benchmark Vectorized Line Equations vs. Substitution into SymPy Equation."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+from sympy.core.symbol import Symbol
+from sympy.geometry.line import Line2D
+
+from g.euclid.line_equation import (evaluate, line_coefficients,
+                                    signed_distances, sides)
+
+
+N: int = 10 ** 6
+N_SUBS: int = 10 ** 3
+
+
+if __name__ == '__main__':
+    point_0, point_1 = (1.5, -2.5), (.25, 4.0)
+    points: np.ndarray = np.random.default_rng(0).normal(size=(N, 2))
+
+    x, y = Symbol('x'), Symbol('y')
+    equation = Line2D(point_0, point_1).equation(x, y)
+    subs_us: float = min(repeat(lambda: [equation.subs({x: px, y: py})
+                                         for px, py in points[:N_SUBS].tolist()],  # noqa: E501
+                                number=1, repeat=3)) / N_SUBS * 1e6
+
+    coefficients: np.ndarray = line_coefficients(point_0, point_1)
+
+    for name, method in (('evaluate', lambda: evaluate(coefficients, points)),
+                         ('signed_distances', lambda: signed_distances(coefficients, points)),  # noqa: E501
+                         ('sides', lambda: sides(point_0, point_1, points))):
+        us: float = min(repeat(method, number=1, repeat=3)) / N * 1e6
+
+        print(f'{name:>16}: {us:.4f} µs/point vs. '
+              f'equation.subs {subs_us:.1f} µs/point ({subs_us / us:,.0f}x)')
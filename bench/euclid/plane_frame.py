@@ -0,0 +1,50 @@
+"""Benchmark Plane Frame Queries vs. SymPy Plane Projections & Distances."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+from sympy.geometry.plane import Plane
+from sympy.geometry.point import Point3D
+
+from g.euclid.plane_frame import PlaneFrame
+
+
+N: int = 10 ** 6
+N_SYMPY: int = 10
+
+
+if __name__ == '__main__':
+    a, b, c = (0., 0., 1.), (1., 0., 1.5), (0., 1., 2.)
+    points: np.ndarray = np.random.default_rng(0).normal(size=(N, 3))
+
+    frame_us: float = min(repeat(lambda: PlaneFrame.from_points(a, b, c),
+                                 number=100, repeat=3)) / 100 * 1e6
+    print(f'frame construction: {frame_us:.1f} µs')
+
+    frame: PlaneFrame = PlaneFrame.from_points(a, b, c)
+    plane: Plane = Plane(a, b, c)
+    sympy_points: list[Point3D] = [Point3D(*p) for p in points[:N_SYMPY].tolist()]  # noqa: E501
+
+    for name, method, sympy_method in (
+            ('signed_distances', frame.signed_distances, plane.distance),
+            ('projections', frame.projections, plane.projection),
+            ('reflections', frame.reflections, None),
+            ('line_intersections',
+             lambda points: frame.line_intersections(points, (1., 1., 1.)),
+             None)):
+        us: float = min(repeat(lambda method=method: method(points),
+                               number=1, repeat=3)) / N * 1e6
+
+        print(f'{name:>18}: {us:.4f} µs/point', end='')
+
+        if sympy_method:
+            sympy_us: float = min(repeat(lambda sympy_method=sympy_method: [sympy_method(p) for p in sympy_points],  # noqa: E501
+                                         number=1, repeat=3)) / N_SYMPY * 1e6
+
+            print(f' vs. SymPy Plane.{sympy_method.__name__} {sympy_us:.1f} µs/point ({sympy_us / us:,.0f}x)')  # noqa: E501
+
+        else:
+            print()
@@ -0,0 +1,50 @@
+"""Benchmark Filtered Predicates vs. Exact Arithmetic, & Filter Hit Rates."""
+
+
+from __future__ import annotations
+
+from fractions import Fraction
+from timeit import repeat
+
+import numpy as np
+
+from g.euclid.predicates import (_incircle, _insphere, _orient2d, _orient3d,
+                                 filter_stats, incircle, insphere,
+                                 orient2d, orient3d)
+
+
+N: int = 10 ** 5
+N_EXACT: int = 10 ** 3
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    for predicate, determinant, n_dims, n_points in (
+            (orient2d, _orient2d, 2, 3), (incircle, _incircle, 2, 4),
+            (orient3d, _orient3d, 3, 4), (insphere, _insphere, 3, 5)):
+        for inputs, points in (
+                ('random', [rng.random((N, n_dims)) for _ in range(n_points)]),  # noqa: E501
+                # points on coarse grid, nudged by single ulps: near-degenerate
+                ('near-degenerate', [np.round(rng.random((N, n_dims)) * 4) / 4 +  # noqa: E501
+                                     rng.integers(0, 2, (N, n_dims)) * 2. ** -50  # noqa: E501
+                                     for _ in range(n_points)])):
+            filter_stats.reset()
+            predicate(*points)
+            fast_fraction: float = filter_stats.fast_fraction
+
+            filtered_us: float = min(repeat(lambda predicate=predicate, points=points: predicate(*points),  # noqa: E501
+                                            number=1, repeat=3)) / N * 1e6
+
+            # exact arithmetic only, as without filter
+            fractions: list = [[tuple(map(Fraction, p)) for p in points_i[:N_EXACT].tolist()]  # noqa: E501
+                               for points_i in points]
+            exact_us: float = min(repeat(lambda determinant=determinant, fractions=fractions:  # noqa: E501
+                                         [determinant(*(c for p in ps for c in p))
+                                          for ps in zip(*fractions)],
+                                         number=1, repeat=3)) / N_EXACT * 1e6
+
+            print(f'{predicate.__name__:>8} {inputs:>15}: '
+                  f'fast path {fast_fraction:6.1%}, '
+                  f'filtered {filtered_us:.3f} µs, exact-only {exact_us:.1f} µs'
+                  f' ({exact_us / filtered_us:,.0f}x)')
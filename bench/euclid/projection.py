@@ -0,0 +1,39 @@
+"""Benchmark Batch Projections vs. Per-Point SymPy Projections."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+from sympy.geometry.line import Line3D
+from sympy.geometry.plane import Plane as Plane3D
+from sympy.geometry.point import Point3D
+
+from g.euclid.projection import project_onto_line, project_onto_plane
+
+
+N: int = 10 ** 6
+N_SYMPY: int = 100
+
+
+if __name__ == '__main__':
+    points: np.ndarray = np.random.default_rng(0).normal(size=(N, 3))
+    sympy_points: list[Point3D] = [Point3D(*p) for p in points[:N_SYMPY].tolist()]  # noqa: E501
+
+    line: Line3D = Line3D((0, 0, 0), (1, 2, 3))
+    plane: Plane3D = Plane3D((0, 0, 0), normal_vector=(1, 2, 3))
+
+    unit: np.ndarray = np.array((1., 2., 3.)) / np.sqrt(14)
+
+    for label, sympy_entity, batch in (
+            ('line', line, lambda: project_onto_line(points, (0, 0, 0), unit)),  # noqa: E501
+            ('plane', plane, lambda: project_onto_plane(points, (0, 0, 0), unit))):  # noqa: E501
+        sympy_us: float = min(repeat(lambda sympy_entity=sympy_entity:
+                                     [(sympy_entity.projection(p), sympy_entity.distance(p))  # noqa: E501
+                                      for p in sympy_points],
+                                     number=1, repeat=3)) / N_SYMPY * 1e6
+        batch_us: float = min(repeat(batch, number=1, repeat=3)) / N * 1e6
+
+        print(f'{label:>5}: batch {batch_us:.4f} µs/point vs. SymPy '
+              f'{sympy_us:,.1f} µs/point ({sympy_us / batch_us:,.0f}x)')
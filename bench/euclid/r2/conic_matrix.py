@@ -0,0 +1,42 @@
+"""Benchmark Batch Conic Matrix Classification vs. Per-Conic SymPy."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+from sympy.geometry.ellipse import Circle, Ellipse
+from sympy.geometry.point import Point2D
+
+from g.euclid.r2.conic_matrix import (classify, from_focus_vertex_eccentricity,
+                                      to_focus_vertex_eccentricity)
+
+
+N: int = 10 ** 6
+N_SYMPY: int = 100
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+    foci: np.ndarray = rng.normal(size=(N, 2))
+    vertices: np.ndarray = rng.normal(size=(N, 2))
+    eccentricities: np.ndarray = rng.uniform(0, 2, N)
+
+    matrices: np.ndarray = from_focus_vertex_eccentricity(foci, vertices, eccentricities)  # noqa: E501
+
+    ellipses: list[Ellipse] = [Ellipse(Point2D(*c), hradius=2, vradius=1)
+                               for c in foci[:N_SYMPY].tolist()]
+
+    for label, sympy_func, batch in (
+            ('to matrix', lambda: [e.equation() for e in ellipses],
+             lambda: from_focus_vertex_eccentricity(foci, vertices, eccentricities)),  # noqa: E501
+            ('classify', lambda: [isinstance(e, Circle) or e.eccentricity < 1 for e in ellipses],  # noqa: E501
+             lambda: classify(matrices)),
+            ('from matrix', lambda: [(e.foci, e.center) for e in ellipses],
+             lambda: to_focus_vertex_eccentricity(matrices))):
+        sympy_us: float = min(repeat(sympy_func, number=1, repeat=3)) / N_SYMPY * 1e6  # noqa: E501
+        batch_us: float = min(repeat(batch, number=1, repeat=3)) / N * 1e6
+
+        print(f'{label:>11}: batch {batch_us:.4f} µs/conic vs. SymPy '
+              f'{sympy_us:,.1f} µs/conic ({sympy_us / batch_us:,.0f}x)')
@@ -0,0 +1,36 @@
+"""Benchmark Grid-Pruned Circle Intersections vs. All-Pairs Ones."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+
+from g.euclid.r2.intersect import CircleBatch
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    for n in (10 ** 3, 3 * 10 ** 3, 10 ** 4, 10 ** 5):
+        # sparse circles, with constant expected numbers of neighbors
+        circles: CircleBatch = CircleBatch.from_arrays(
+            rng.uniform(0, np.sqrt(10 * n), (n, 2)), rng.uniform(.1, 1, n))
+
+        grid_ms: float = min(repeat(lambda circles=circles: circles.intersect_all(),  # noqa: E501
+                                    number=1, repeat=3)) * 1e3
+
+        print(f'{n:>7} circles: grid-pruned {grid_ms:>8.1f} ms, '
+              f'{len(circles.candidate_pairs()):,} overlapping pairs', end='')
+
+        if n <= 3 * 10 ** 3:
+            pairs: np.ndarray = np.stack(np.triu_indices(n, 1), axis=-1)
+
+            all_pairs_ms: float = min(repeat(lambda circles=circles, pairs=pairs: circles.intersect_pairs(pairs),  # noqa: E501
+                                             number=1, repeat=3)) * 1e3
+
+            print(f', all pairs {all_pairs_ms:>8.1f} ms ({all_pairs_ms / grid_ms:,.0f}x)')  # noqa: E501
+
+        else:
+            print()
@@ -0,0 +1,50 @@
+"""Benchmark Batched Conic Intersections vs. SymPy Circle.intersection."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+from sympy.geometry.ellipse import Circle
+from sympy.geometry.line import Line2D
+
+from g.euclid.r2.conic_matrix import (from_coefficients,
+                                      from_focus_vertex_eccentricity)
+from g.euclid.r2.intersect import (LinearEntityBatch, intersect_conic_lines,
+                                   intersect_conics)
+
+
+N_SYMPY: int = 20
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+    ints: np.ndarray = rng.integers(-9, 9, size=(N_SYMPY, 2, 2))
+
+    circle: Circle = Circle((0, 0), 5)
+    circles: list[Circle] = [Circle(tuple(c), 5) for c, _ in ints.tolist()]
+    lines: list[Line2D] = [Line2D(tuple(p), tuple(p + d + 1)) for p, d in ints]
+
+    sympy_line_us: float = min(repeat(lambda: [circle.intersection(line) for line in lines],  # noqa: E501
+                                      number=1, repeat=3)) / N_SYMPY * 1e6
+    sympy_conic_us: float = min(repeat(lambda: [circle.intersection(other) for other in circles],  # noqa: E501
+                                       number=1, repeat=3)) / N_SYMPY * 1e6
+
+    matrix: np.ndarray = from_coefficients(1, 0, 1, 0, 0, -25)
+
+    for n in (10 ** 3, 10 ** 5):
+        batch: LinearEntityBatch = LinearEntityBatch.from_arrays(rng.normal(size=(n, 2)), rng.normal(size=(n, 2)))  # noqa: E501
+        conics: np.ndarray = from_focus_vertex_eccentricity(rng.normal(size=(2, n, 2)),  # noqa: E501
+                                                            rng.normal(size=(2, n, 2)),  # noqa: E501
+                                                            rng.uniform(0, 2, (2, n)))  # noqa: E501
+
+        line_us: float = min(repeat(lambda batch=batch: intersect_conic_lines(matrix, batch),  # noqa: E501
+                                    number=1, repeat=3)) / n * 1e6
+        conic_us: float = min(repeat(lambda conics=conics: intersect_conics(*conics),  # noqa: E501
+                                     number=1, repeat=3)) / n * 1e6
+
+        print(f'{n:>7} conic-line pairs: SymPy {sympy_line_us:>9.1f} µs/pair, '
+              f'batched {line_us:.4f} µs/pair ({sympy_line_us / line_us:,.0f}x)')  # noqa: E501
+        print(f'{n:>7} conic-conic pairs: SymPy {sympy_conic_us:>8.1f} µs/pair, '  # noqa: E501
+              f'batched {conic_us:.4f} µs/pair ({sympy_conic_us / conic_us:,.0f}x)')  # noqa: E501
@@ -0,0 +1,40 @@
+"""Benchmark Bulk Line Intersections vs. SymPy Line2D.intersection."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+from sympy.geometry.line import Line2D
+
+from g.euclid.r2.intersect import LinearEntityBatch, intersect_all, intersect_pairwise  # noqa: E501
+
+
+N_SYMPY: int = 50
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+    ints: np.ndarray = rng.integers(-99, 99, size=(N_SYMPY, 2, 2, 2))
+
+    pairs: list[tuple[Line2D, Line2D]] = [
+        (Line2D(*map(tuple, a)), Line2D(*map(tuple, b)))
+        for a, b in ints.tolist()]
+
+    sympy_us: float = min(repeat(lambda: [a.intersection(b) for a, b in pairs],  # noqa: E501
+                                 number=1, repeat=3)) / N_SYMPY * 1e6
+
+    for n in (10 ** 3, 10 ** 5):
+        a: LinearEntityBatch = LinearEntityBatch.from_arrays(rng.random((n, 2)), rng.random((n, 2)))  # noqa: E501
+        b: LinearEntityBatch = LinearEntityBatch.from_arrays(rng.random((n, 2)), rng.random((n, 2)))  # noqa: E501
+
+        batch_us: float = min(repeat(lambda a=a, b=b: intersect_pairwise(a, b),  # noqa: E501
+                                     number=1, repeat=3)) / n * 1e6
+
+        print(f'{n:>7} pairs: SymPy Line2D.intersection {sympy_us:>8.1f} µs/pair,'  # noqa: E501
+              f' batched {batch_us:.4f} µs/pair ({sympy_us / batch_us:,.0f}x)')
+
+    lines: LinearEntityBatch = LinearEntityBatch.from_arrays(rng.random((1000, 2)), rng.random((1000, 2)))  # noqa: E501
+    all_ms: float = min(repeat(lambda: intersect_all(lines), number=1, repeat=3)) * 1e3  # noqa: E501
+    print(f'all pairs among 1000 lines: {all_ms:.1f} ms')
@@ -0,0 +1,32 @@
+"""Benchmark Sweep-Line Segment Intersections vs. All-Pairs Intersections."""
+
+
+from __future__ import annotations
+
+from timeit import repeat
+
+import numpy as np
+
+from g.euclid.r2.intersect import SEGMENT, LinearEntityBatch, intersect_all, segment_intersections  # noqa: E501
+
+
+if __name__ == '__main__':
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    for n in (10 ** 3, 4 * 10 ** 3):
+        # short segments, as in road networks: few intersections per segment
+        starts: np.ndarray = rng.random((n, 2))
+        directions: np.ndarray = rng.normal(scale=.01, size=(n, 2))
+        segments: list = np.stack((starts, starts + directions), axis=1).tolist()  # noqa: E501
+
+        n_intersections: int = sum(1 for _ in segment_intersections(segments))
+
+        sweep_ms: float = min(repeat(lambda segments=segments: list(segment_intersections(segments)),  # noqa: E501
+                                     number=1, repeat=3)) * 1e3
+
+        batch: LinearEntityBatch = LinearEntityBatch.from_arrays(starts, directions, SEGMENT)  # noqa: E501
+        all_pairs_ms: float = min(repeat(lambda batch=batch: intersect_all(batch),  # noqa: E501
+                                         number=1, repeat=3)) * 1e3
+
+        print(f'{n:>5} segments, {n_intersections} intersections: '
+              f'sweep {sweep_ms:,.0f} ms, all pairs {all_pairs_ms:,.0f} ms')
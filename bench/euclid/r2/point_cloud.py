@@ -0,0 +1,59 @@
+"""Benchmark Array-backed Point Clouds vs. Lists of Points."""
+
+
+from __future__ import annotations
+
+from random import Random
+from timeit import repeat
+import tracemalloc
+
+import numpy as np
+
+from g import Pt
+from g.euclid.r2.point_cloud import PointCloudR2
+
+
+N: int = 10 ** 5
+
+
+if __name__ == '__main__':
+    rng: Random = Random(0)
+    coords: list[tuple[float, float]] = [(rng.random(), rng.random())
+                                         for _ in range(N)]
+
+    tracemalloc.start()
+    points: list[Pt] = [Pt(x, y) for x, y in coords]
+    list_mb: float = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    cloud: PointCloudR2 = PointCloudR2(coords)
+    cloud_mb: float = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    tracemalloc.stop()
+
+    print(f'memory for {N} points: list of Pt {list_mb:.1f} MiB,'
+          f' PointCloudR2 {cloud_mb:.1f} MiB')
+
+    for label, listwise, vectorized in (
+            ('translate',
+             lambda: [Pt(p.x + 1, p.y - 1) for p in points],
+             lambda: cloud.translate((1, -1))),
+            ('distances',
+             lambda: [((p.x - .5) ** 2 + (p.y - .5) ** 2) ** .5 for p in points],  # noqa: E501
+             lambda: cloud.distances((.5, .5))),
+            ('centroid',
+             lambda: (sum(p.x for p in points) / N, sum(p.y for p in points) / N),  # noqa: E501
+             lambda: cloud.centroid),
+            ('bounding box',
+             lambda: ((min(p.x for p in points), min(p.y for p in points)),
+                      (max(p.x for p in points), max(p.y for p in points))),
+             lambda: cloud.bounding_box)):
+        list_ms: float = min(repeat(listwise, number=1, repeat=3)) * 1e3
+        cloud_ms: float = min(repeat(vectorized, number=1, repeat=3)) * 1e3
+        print(f'{label:<14} list of Pt {list_ms:>9.2f} ms,'
+              f' PointCloudR2 {cloud_ms:>7.3f} ms'
+              f' ({list_ms / cloud_ms:,.0f}x)')
+
+    np.testing.assert_allclose(cloud.centroid,
+                               (sum(p.x for p in points) / N,
+                                sum(p.y for p in points) / N))
@@ -0,0 +1,79 @@
+"""Benchmark Compiled Parametric Sampling vs. Per-Sample Substitution,
+and Adaptive vs. Uniform Sampling at Equal Screen-Space Tolerance."""
+
+
+from __future__ import annotations
+
+from math import pi
+from timeit import repeat
+
+import numpy as np
+from sympy.core.symbol import Symbol
+from sympy.functions.elementary.trigonometric import cos, sin
+
+from g.euclid.sampling import sample_adaptive, sample_parametric
+
+
+N: int = 10 ** 5
+N_SUBS: int = 100
+
+# screen-space tolerance: quarter pixel at 100 pixels per unit
+TOLERANCE: float = .25
+SCALE: float = 100.
+
+
+def _max_deviation(polylines: list[np.ndarray], dense: np.ndarray, /) -> float:  # noqa: E501
+    """Return max distance of dense curve points from polylines' segments."""
+    starts: np.ndarray = np.concatenate([polyline[:-1] for polyline in polylines])  # noqa: E501
+    chords: np.ndarray = np.concatenate([np.diff(polyline, axis=0) for polyline in polylines])  # noqa: E501
+
+    offsets: np.ndarray = dense[:, np.newaxis] - starts
+    fractions: np.ndarray = np.clip((offsets * chords).sum(axis=-1) / np.maximum((chords * chords).sum(axis=-1), 1e-300), 0, 1)  # noqa: E501
+
+    return np.linalg.norm(offsets - fractions[..., np.newaxis] * chords, axis=-1).min(axis=-1).max()  # noqa: E501
+
+if __name__ == '__main__':
+    x, y, theta = Symbol('x', real=True), Symbol('y', real=True), Symbol('θ', real=True)  # noqa: E501
+    e, p = Symbol('e', positive=True), Symbol('p', positive=True)
+
+    # ellipse in focus-centered polar form, with variable eccentricity
+    r = p / (1 - e * cos(theta))
+    residuals = x - r * cos(theta), y - r * sin(theta)
+
+    thetas: np.ndarray = np.linspace(-pi, pi, N_SUBS)
+    subs_us: float = min(repeat(lambda: [(float((x - residuals[0]).subs({theta: t, e: .5, p: 1})),  # noqa: E501
+                                          float((y - residuals[1]).subs({theta: t, e: .5, p: 1})))  # noqa: E501
+                                         for t in thetas.tolist()],
+                                number=1, repeat=3)) / N_SUBS * 1e6
+
+    # first call compiles; later ones, under new bindings, reuse compilation
+    sample_parametric(residuals, (x, y), (theta,), N, ((-pi, pi),), bindings={e: .1, p: 1})  # noqa: E501
+    sample_us: float = min(repeat(lambda: [sample_parametric(residuals, (x, y), (theta,), N, ((-pi, pi),),  # noqa: E501
+                                                             bindings={e: ecc, p: 1})  # noqa: E501
+                                           for ecc in (.2, .5, .8)],
+                                  number=1, repeat=3)) / (3 * N) * 1e6
+
+    print(f'subs: {subs_us:.1f} µs/sample; compiled: {sample_us:.4f} µs/sample'
+          f' ({subs_us / sample_us:,.0f}x)')
+
+    # uniform sampling needs as many points as required by sharpest turns
+    for ecc in (.5, .9, .99):
+        bindings: dict[Symbol, float] = {e: ecc, p: 1}
+
+        adaptive: list[np.ndarray] = list(sample_adaptive(residuals, (x, y), theta, (-pi, pi), TOLERANCE,  # noqa: E501
+                                                          scale=SCALE, bindings=bindings))  # noqa: E501
+        n_adaptive: int = sum(len(chunk) for chunk in adaptive)
+        adaptive_ms: float = min(repeat(lambda bindings=bindings: list(sample_adaptive(
+            residuals, (x, y), theta, (-pi, pi), TOLERANCE, scale=SCALE, bindings=bindings)),  # noqa: E501
+            number=1, repeat=3)) * 1e3
+
+        dense: np.ndarray = sample_parametric(residuals, (x, y), (theta,), 2000, ((-pi, pi),), bindings=bindings)  # noqa: E501
+
+        n_uniform: int = 16
+        while _max_deviation([sample_parametric(residuals, (x, y), (theta,), n_uniform, ((-pi, pi),), bindings=bindings)],  # noqa: E501
+                             dense) * SCALE > TOLERANCE:
+            n_uniform *= 2
+
+        print(f'e = {ecc}: adaptive {n_adaptive} points in {adaptive_ms:.1f} ms '
+              f'(max deviation {_max_deviation(adaptive, dense) * SCALE:.3f} px) '  # noqa: E501
+              f'vs. uniform {n_uniform} points for {TOLERANCE} px')
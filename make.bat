@@ -8,6 +8,7 @@ SET TARGET=%1
 IF "%TARGET%"=="install-editable" GOTO install-editable
 IF "%TARGET%"=="lint-all" GOTO lint-all
 IF "%TARGET%"=="test-all" GOTO test-all
+IF "%TARGET%"=="bench-all" GOTO bench-all
 
 
 :: INSTALLATION
@@ -31,6 +32,13 @@ IF "%TARGET%"=="test-all" GOTO test-all
   GOTO end
 
 
+:: BENCHMARKING
+:: ============
+:bench-all
+  bench\all
+  GOTO end
+
+
 :: END
 :: ===
 :end
@@ -15,6 +15,7 @@ from ._core import (
     Variable, Var,
 
     Vector, Vec, V, Ux, Uy, Uz, V0,
+    VectorBatch,
 )
 
 from .session import Session, DEFAULT_SESSION
@@ -40,6 +41,7 @@ __all__: Sequence[LiteralString] = (
     'Variable', 'Var',
 
     'Vector', 'Vec', 'V', 'Ux', 'Uy', 'Uz', 'V0',
+    'VectorBatch',
 
     'CyclicTuple',
 
@@ -4,7 +4,8 @@
 from collections.abc import Sequence
 from typing import LiteralString
 
+from .numpy import NumPyBackend
 from .sympy import SymPyBackend
 
 
-__all__: Sequence[LiteralString] = ('SymPyBackend',)
+__all__: Sequence[LiteralString] = ('NumPyBackend', 'SymPyBackend')
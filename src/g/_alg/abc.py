@@ -1,13 +1,89 @@
 """Abstract Algebra Backend."""
 
 
-from abc import ABC
-from collections.abc import Sequence
-from typing import LiteralString
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString, Self
 
 
 __all__: Sequence[LiteralString] = ('_AlgBackendABC',)
 
 
 class _AlgBackendABC(ABC):
-    """Abstract Algebra Backend."""
+    """Abstract Algebra Backend.
+
+    Backends represent points & vectors natively (e.g., as SymPy points or
+    NumPy arrays) and implement coordinate operations on such
+    representations; lines in the plane are given by 2 distinct points.
+
+    A Session's backend is available to code computing with its session's
+    coordinates, as `session.alg_backend`; entities do not dispatch their
+    own constructions to it.
+    """
+
+    @abstractmethod
+    def point(self: Self, coords: Sequence[Any], /) -> Any:
+        """Return native point/vector of given coordinates."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def coords(self: Self, point: Any, /) -> tuple[Any, ...]:
+        """Return coordinates of native point/vector."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self: Self, point: Any, vector: Any, /) -> Any:
+        """Return point/vector plus vector."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def sub(self: Self, point: Any, other_point: Any, /) -> Any:
+        """Return vector from other point to point."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def scale(self: Self, vector: Any, factor: Any, /) -> Any:
+        """Return vector scaled by factor."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def dot(self: Self, vector: Any, other_vector: Any, /) -> Any:
+        """Return dot product."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def norm(self: Self, vector: Any, /) -> Any:
+        """Return Euclidean length."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def distance(self: Self, point: Any, other_point: Any, /) -> Any:
+        """Return Euclidean distance."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def project(self: Self, point: Any, line_point: Any, line_direction: Any, /) -> Any:  # noqa: E501
+        """Return orthogonal projection of point onto line."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def line_coefficients(self: Self, point: Any, other_point: Any, /) -> tuple[Any, Any, Any]:  # noqa: E501
+        """Return (a, b, c) of line `ax + by + c = 0` through 2 points.
+
+        Coefficients are not normalized: (a, b, c) = (y0 - y1, x1 - x0,
+        x0 y1 - x1 y0), so that `ax + by + c` is positive left of the
+        direction from point to other point, for all backends alike.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def intersect_lines(self: Self,
+                        point_0: Any, other_point_0: Any,
+                        point_1: Any, other_point_1: Any, /) -> Any | None:
+        """Return intersection point of 2 lines, or None if parallel."""
+        raise NotImplementedError
@@ -0,0 +1,87 @@
+"""NumPy Algebra Backend."""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .abc import _AlgBackendABC
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString, Self
+
+    from numpy.typing import NDArray
+
+
+__all__: Sequence[LiteralString] = ('NumPyBackend',)
+
+
+class NumPyBackend(_AlgBackendABC):
+    """NumPy Algebra Backend, representing points & vectors as float64 arrays.
+
+    No symbolic expressions are built, so coordinates must be numeric.
+    Parallelism is decided up to given relative tolerance on the sine of the
+    angle between lines, so independently of coordinates' scale.
+    """
+
+    def __init__(self: Self, /, *, rtol: float = 1e-12) -> None:
+        """Initialize NumPy algebra backend."""
+        self.rtol: float = rtol
+
+    def point(self: Self, coords: Sequence[Any], /) -> NDArray[np.float64]:
+        """Return float64 array of given coordinates."""
+        return np.asarray(coords, dtype=np.float64)
+
+    def coords(self: Self, point: NDArray[np.float64], /) -> tuple[float, ...]:  # noqa: E501
+        """Return coordinates of float64 array."""
+        return tuple(point.tolist())
+
+    def add(self: Self, point: NDArray[np.float64], vector: NDArray[np.float64], /) -> NDArray[np.float64]:  # noqa: E501
+        """Return point/vector plus vector."""
+        return point + vector
+
+    def sub(self: Self, point: NDArray[np.float64], other_point: NDArray[np.float64], /) -> NDArray[np.float64]:  # noqa: E501
+        """Return vector from other point to point."""
+        return point - other_point
+
+    def scale(self: Self, vector: NDArray[np.float64], factor: float, /) -> NDArray[np.float64]:  # noqa: E501
+        """Return vector scaled by factor."""
+        return vector * factor
+
+    def dot(self: Self, vector: NDArray[np.float64], other_vector: NDArray[np.float64], /) -> float:  # noqa: E501
+        """Return dot product."""
+        return float(vector @ other_vector)
+
+    def norm(self: Self, vector: NDArray[np.float64], /) -> float:
+        """Return Euclidean length."""
+        return float(np.sqrt(vector @ vector))
+
+    def distance(self: Self, point: NDArray[np.float64], other_point: NDArray[np.float64], /) -> float:  # noqa: E501
+        """Return Euclidean distance."""
+        return self.norm(point - other_point)
+
+    def project(self: Self, point: NDArray[np.float64], line_point: NDArray[np.float64], line_direction: NDArray[np.float64], /) -> NDArray[np.float64]:  # noqa: E501
+        """Return orthogonal projection of point onto line."""
+        return line_point + (((point - line_point) @ line_direction) /
+                             (line_direction @ line_direction)) * line_direction  # noqa: E501
+
+    def line_coefficients(self: Self, point: NDArray[np.float64], other_point: NDArray[np.float64], /) -> tuple[float, float, float]:  # noqa: E501
+        """Return (a, b, c) of line `ax + by + c = 0` through 2 points."""
+        (x0, y0), (x1, y1) = point.tolist(), other_point.tolist()
+        return y0 - y1, x1 - x0, x0 * y1 - x1 * y0
+
+    def intersect_lines(self: Self,
+                        point_0: NDArray[np.float64], other_point_0: NDArray[np.float64],  # noqa: E501
+                        point_1: NDArray[np.float64], other_point_1: NDArray[np.float64], /) -> NDArray[np.float64] | None:  # noqa: E501
+        """Return intersection point of 2 lines, or None if parallel."""
+        a0, b0, c0 = self.line_coefficients(point_0, other_point_0)
+        a1, b1, c1 = self.line_coefficients(point_1, other_point_1)
+
+        # determinant is cross product of directions, |d0| |d1| sin(angle)
+        if abs(det := a0 * b1 - a1 * b0) <= self.rtol * np.hypot(a0, b0) * np.hypot(a1, b1):  # noqa: E501
+            return None
+
+        return np.array(((b0 * c1 - b1 * c0) / det, (a1 * c0 - a0 * c1) / det))  # noqa: E501
@@ -1,14 +1,77 @@
 """SymPy Algebra Backend."""
 
 
-from collections.abc import Sequence
-from typing import LiteralString
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sympy.geometry.line import Line
+from sympy.geometry.point import Point
 
 from .abc import _AlgBackendABC
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString, Self
+
+    from sympy.core.expr import Expr
+
 
 __all__: Sequence[LiteralString] = ('SymPyBackend',)
 
 
 class SymPyBackend(_AlgBackendABC):
-    """SymPy Algebra Backend."""
+    """SymPy Algebra Backend, representing points & vectors symbolically."""
+
+    def point(self: Self, coords: Sequence[Any], /) -> Point:
+        """Return SymPy point of given coordinates."""
+        return Point(*coords, evaluate=False)
+
+    def coords(self: Self, point: Point, /) -> tuple[Expr, ...]:
+        """Return coordinates of SymPy point."""
+        return point.args
+
+    def add(self: Self, point: Point, vector: Point, /) -> Point:
+        """Return point/vector plus vector."""
+        return point + vector
+
+    def sub(self: Self, point: Point, other_point: Point, /) -> Point:
+        """Return vector from other point to point."""
+        return point - other_point
+
+    def scale(self: Self, vector: Point, factor: Expr, /) -> Point:
+        """Return vector scaled by factor."""
+        return vector * factor
+
+    def dot(self: Self, vector: Point, other_vector: Point, /) -> Expr:
+        """Return dot product."""
+        return vector.dot(other_vector)
+
+    def norm(self: Self, vector: Point, /) -> Expr:
+        """Return Euclidean length."""
+        return abs(vector)
+
+    def distance(self: Self, point: Point, other_point: Point, /) -> Expr:
+        """Return Euclidean distance."""
+        return point.distance(other_point)
+
+    def project(self: Self, point: Point, line_point: Point, line_direction: Point, /) -> Point:  # noqa: E501
+        """Return orthogonal projection of point onto line."""
+        return line_point + Point.project(point - line_point, line_direction)
+
+    def line_coefficients(self: Self, point: Point, other_point: Point, /) -> tuple[Expr, Expr, Expr]:  # noqa: E501
+        """Return (a, b, c) of line `ax + by + c = 0` through 2 points."""
+        # not Line.coefficients, normalized differently for axis-parallel lines
+        (x0, y0), (x1, y1) = point.args, other_point.args
+        return y0 - y1, x1 - x0, x0 * y1 - x1 * y0
+
+    def intersect_lines(self: Self,
+                        point_0: Point, other_point_0: Point,
+                        point_1: Point, other_point_1: Point, /) -> Point | None:  # noqa: E501
+        """Return intersection point of 2 lines, or None if parallel."""
+        match Line(point_0, other_point_0).intersection(Line(point_1, other_point_1)):  # noqa: E501
+            case [Point() as intersection_point]:
+                return intersection_point
+
+            case _:
+                return None
@@ -39,6 +39,7 @@ from .variable import (Variable, Var,
 from .vector import (Vector, Vec, V,
                      OptionalVec,
                      Ux, Uy, Uz, V0)
+from .vector_batch import VectorBatch
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -79,4 +80,5 @@ __all__: Sequence[LiteralString] = (
     'Vector', 'Vec', 'V',
     'OptionalVec',
     'Ux', 'Uy', 'Uz', 'V0',
+    'VectorBatch',
 )
@@ -4,10 +4,15 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from functools import cache
 from typing import TYPE_CHECKING
 
+from g._util.inspect import is_cached_property
+
+from .dependency_index import DEPENDENCY_INDEX
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from typing import LiteralString, Self
 
     from g.session import Session
@@ -16,9 +21,20 @@ if TYPE_CHECKING:
 __all__: Sequence[LiteralString] = ('AnEntity',)
 
 
+@cache
+def _cached_property_names(cls: type, /) -> tuple[str, ...]:
+    """Return names of class's cached properties."""
+    return tuple({name: None
+                  for klass in cls.__mro__
+                  for name, member in vars(klass).items()
+                  if is_cached_property(member)})
+
+
 class AnEntity:
     """Abstract Entity."""
 
+    __slots__: Sequence[LiteralString] = ()
+
     _SESS_ATTR_KEY: LiteralString = '_session'
 
     @property
@@ -39,8 +55,14 @@ class AnEntity:
         assert isinstance(session, Session), \
             TypeError(f'*** {session} NOT OF TYPE {Session.__name__} ***')
 
+        if getattr(self, self._SESS_ATTR_KEY, None) is session:
+            return
+
         setattr(self, self._SESS_ATTR_KEY, session)
 
+        # (re-)index entity, keeping edges from & to it across sessions
+        DEPENDENCY_INDEX.add(self)
+
     _DEPS_ATTR_KEY: LiteralString = '_dependencies'
 
     @property
@@ -57,6 +79,32 @@ class AnEntity:
         """Set dependencies."""
         setattr(self, self._DEPS_ATTR_KEY, dependencies)
 
+        if (session := getattr(self, self._SESS_ATTR_KEY, None)) is None:
+            # free entities need not be indexed until assigned to a session
+            if not dependencies:
+                return
+
+            # derived entities join their dependencies' session
+            setattr(self, self._SESS_ATTR_KEY, self._joined_session(dependencies))  # noqa: E501
+
+        DEPENDENCY_INDEX.add(self)
+
+    @staticmethod
+    def _joined_session(entities: Iterable[AnEntity], /) -> Session:
+        """Return first non-default session of entities, else default one."""
+        from g.session import DEFAULT_SESSION
+
+        return next((s
+                     for entity in entities
+                     if (s := entity.session) is not DEFAULT_SESSION),
+                    DEFAULT_SESSION)
+
+    def _invalidate_cached_properties(self: Self, /) -> None:
+        """Clear cached property values, to be lazily recomputed."""
+        if (instance_dict := getattr(self, '__dict__', None)) is not None:
+            for name in _cached_property_names(type(self)):
+                instance_dict.pop(name, None)
+
     _NAME_ATTR_KEY: LiteralString = '_name'
     _NAME_NULLABLE: bool = True
 
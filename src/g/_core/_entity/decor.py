@@ -4,25 +4,23 @@
 from __future__ import annotations
 
 from functools import cached_property, wraps
-from inspect import (getmembers,
-                     isabstract, isclass, isfunction, ismethoddescriptor,
+from inspect import (isabstract, isclass, isfunction, ismethoddescriptor,
                      Parameter,
                      Signature, signature)
+import os
 from pprint import pprint
 import sys
-from typing import TYPE_CHECKING
+from types import UnionType
+from typing import TYPE_CHECKING, Union, get_args, get_origin
 
+from sympy.core.numbers import Number
 from sympy.core.symbol import Symbol
 
 from g._util import debug
-from g._util.inspect import (is_static_method,
-                             is_class_method,
-                             is_instance_method,
-                             is_property,
-                             is_cached_property,
-                             describe)
+from g._util.inspect import is_property, is_cached_property, describe
+from g._util.persistent_cache import (CACHE_DIR_ENV_VAR, PersistentCache,
+                                      source_mtimes)
 from g._util.type import OptionalStrOrCallableReturningStr
-from g._util.unique_name import UNIQUE_NAME_FACTORY
 
 from .abc import AnEntity
 
@@ -31,6 +29,7 @@ if TYPE_CHECKING:
     from typing import Any, LiteralString
 
     from g._util.type import CallableReturningStr
+    from g.session import Session
 
 
 __all__: Sequence[LiteralString] = ('assign_entity_dependencies_and_name',)
@@ -43,50 +42,262 @@ _G_MODULE_NAME: LiteralString = 'g'
 _NEW_METHOD_NAME: LiteralString = '__new__'
 _INIT_METHOD_NAME: LiteralString = '__init__'
 
+_DEPS_ATTR_KEY: LiteralString = AnEntity._DEPS_ATTR_KEY
+
 _ALREADY_DECORATED_ATTR_KEY: LiteralString = '_DECORATED_WITH_DEPENDENCIES_AND_NAME_ASSIGNMENT'  # noqa: E501
 _NAME_ATTR_KEY: LiteralString = 'name'
 
 
-def _decorable(function: Callable, /) -> bool:
-    """Check if function should be decorated."""
+# kinds of class members to decorate
+_NEW: LiteralString = 'new'
+_INIT: LiteralString = 'init'
+_STATIC_METHOD: LiteralString = 'static method'
+_CLASS_METHOD: LiteralString = 'class method'
+_INSTANCE_METHOD: LiteralString = 'unbound instance method'
+_FUNCTION: LiteralString = 'function'
+_PROPERTY: LiteralString = "instance property's getter function"
+_CACHED_PROPERTY: LiteralString = "instance cached property's underlying function"  # noqa: E501
+
+
+_NON_ENTITY_TYPES: tuple[type, ...] = (bool, bytes, complex, float, int, str,
+                                      dict, frozenset, list, set, tuple,
+                                      type, type(None), Number)
+
+
+def _annotation_id(value: Any, /) -> str:
+    """Return identifier of evaluated annotation, stable across sessions."""
+    return (f'{value.__module__}.{value.__qualname__}'
+            if isclass(object=value)
+            else repr(value))
+
+
+def _g_annotation_id(annotation: str, /) -> str | None:
+    """Return identifier of annotation evaluated in `g`, or None if unresolvable."""  # noqa: E501
+    try:
+        return _annotation_id(eval(annotation,  # noqa: S307
+                                   globals=sys.modules[_G_MODULE_NAME].__dict__,  # noqa: E501
+                                   locals=None))
+
+    except NameError:
+        return None
+
+
+def _eval_annotation(annotation: str, function: Callable, /,
+                     fallbacks: dict[str, str | None] | None = None) -> Any:
+    """Evaluate string annotation in function's module, else in `g`.
+
+    Identifiers of annotations evaluated in `g` (None if unresolvable) are
+    recorded into fallbacks, if given.
+    """
+    try:
+        return eval(annotation,  # noqa: S307
+                    globals=sys.modules[function.__module__].__dict__,
+                    locals=None)
+
+    except NameError as err0:
+        if debug.ON:
+            print(f'{function.__module__.upper()}: {err0}\n')
+
+        try:
+            value: Any = eval(annotation,  # noqa: S307
+                              globals=sys.modules[_G_MODULE_NAME].__dict__,
+                              locals=None)
+
+        except NameError:
+            if fallbacks is not None:
+                fallbacks[annotation] = None
+
+            raise
+
+        if fallbacks is not None:
+            fallbacks[annotation] = _annotation_id(value)
+
+        return value
+
+
+def _decorable(function: Callable, owner_class: type, /,
+               fallbacks: dict[str, str | None] | None = None) -> bool:
+    """Check if function defined in owner class returns entities.
+
+    Whether function is already decorated is checked separately, upon
+    decoration, as it is runtime state rather than derived from sources.
+    """
     assert isfunction(object=function), \
         TypeError(f'*** {function} NOT A FUNCTION ***')
 
-    if (not getattr(function, _ALREADY_DECORATED_ATTR_KEY, False)) and \
-            isinstance(return_annotation :=
-                       signature(obj=function, follow_wrapped=False,
-                                 globals=None, locals=None,
-                                 eval_str=False).return_annotation, str):
-        if (len(qual_name_parts :=
-                function.__qualname__.split('.')) == 2) and \
-                (return_annotation in (_SELF_TYPE_STR, qual_name_parts[0])):
-            return True
+    if isinstance(return_annotation :=
+                  signature(obj=function, follow_wrapped=False,
+                            globals=None, locals=None,
+                            eval_str=False).return_annotation, str):
+        if return_annotation in (_SELF_TYPE_STR, owner_class.__name__):
+            return issubclass(owner_class, AnEntity)
 
         try:
-            return_type: type = eval(return_annotation,  # noqa: S307
-                                     globals=sys.modules[function.__module__].__dict__,  # noqa: E501
-                                     locals=None)
+            return_type: type = _eval_annotation(return_annotation, function,
+                                                 fallbacks)
 
-        except NameError as err0:
+        except NameError as err:
             if debug.ON:
-                print(f'{function.__module__.upper()}: {err0}\n')
-
-            try:
-                return_type: type = eval(return_annotation,  # noqa: S307
-                                         globals=sys.modules[_G_MODULE_NAME].__dict__,  # noqa: E501
-                                         locals=None)
-
-            except NameError as err1:
-                if debug.ON:
-                    print(f'{err1}\n')
+                print(f'{err}\n')
 
-                return False
+            return False
 
         return (isclass(object=return_type) and issubclass(return_type, AnEntity))  # noqa: E501
 
     return False
 
 
+def _may_be_entity(annotation: Any, function: Callable, /) -> bool:
+    """Check if parameter annotated as such may receive an entity.
+
+    Unannotated or unresolvable parameters conservatively may.
+    """
+    if annotation is Parameter.empty:
+        return True
+
+    if isinstance(annotation, str):
+        if annotation == _SELF_TYPE_STR:
+            return True
+
+        try:
+            annotation: Any = _eval_annotation(annotation, function)
+
+        except Exception:  # noqa: BLE001
+            return True
+
+    if isinstance(annotation, UnionType) or \
+            (get_origin(annotation) is Union):
+        return any(_may_be_entity(arg, function)
+                   for arg in get_args(annotation))
+
+    if (origin := get_origin(annotation)) is not None:
+        annotation: Any = origin
+
+    if annotation is None:
+        return False
+
+    if isclass(object=annotation):
+        return (issubclass(annotation, AnEntity) or
+                not issubclass(annotation, _NON_ENTITY_TYPES))
+
+    return True
+
+
+def _no_dependencies(args: tuple, kwargs: dict, /) -> set[AnEntity]:  # noqa: ARG001
+    return set()
+
+
+def _all_dependencies(args: tuple, kwargs: dict, /) -> set[AnEntity]:
+    return {i for i in (*args, *kwargs.values()) if isinstance(i, AnEntity)}
+
+
+def _dependency_collector(function: Callable, func_sig: Signature, /,
+                          *, skip_first: bool, always_first: bool) -> Callable[[tuple, dict], set[AnEntity]]:  # noqa: C901,E501
+    """Return collector of entity arguments, specialized to signature shape.
+
+    Only parameters annotated as (possibly) entities are scanned; the first
+    parameter is skipped (e.g., `cls` or `self` being initialized) or always
+    scanned (e.g., `self` of instance methods) as specified.
+    """
+    positional: list[tuple[int, str]] = []
+    keyword_only: list[str] = []
+
+    for i, parameter in enumerate(func_sig.parameters.values()):
+        if i == 0 and skip_first:
+            continue
+
+        if not (i == 0 and always_first) and \
+                not _may_be_entity(parameter.annotation, function):
+            continue
+
+        match parameter.kind:
+            case Parameter.POSITIONAL_ONLY | Parameter.POSITIONAL_OR_KEYWORD:
+                positional.append((i, parameter.name))
+
+            case Parameter.KEYWORD_ONLY:
+                keyword_only.append(parameter.name)
+
+            case _:
+                # variadic parameters possibly receiving entities
+                return _all_dependencies
+
+    match positional, keyword_only:
+        case [], []:
+            return _no_dependencies
+
+        case [(0, _)], [] if always_first:
+            def dependencies(args: tuple, kwargs: dict, /) -> set[AnEntity]:  # noqa: ARG001
+                return {args[0]} if isinstance(args[0], AnEntity) else set()
+
+        case [(i0, n0)], []:
+            def dependencies(args: tuple, kwargs: dict, /) -> set[AnEntity]:
+                a0: Any = args[i0] if len(args) > i0 else kwargs.get(n0)
+                return {a0} if isinstance(a0, AnEntity) else set()
+
+        case [(i0, n0), (i1, n1)], []:
+            def dependencies(args: tuple, kwargs: dict, /) -> set[AnEntity]:
+                n_args: int = len(args)
+                a0: Any = args[i0] if n_args > i0 else kwargs.get(n0)
+                a1: Any = args[i1] if n_args > i1 else kwargs.get(n1)
+
+                deps: set[AnEntity] = set()
+
+                if isinstance(a0, AnEntity):
+                    deps.add(a0)
+
+                if isinstance(a1, AnEntity):
+                    deps.add(a1)
+
+                return deps
+
+        case _:
+            def dependencies(args: tuple, kwargs: dict, /) -> set[AnEntity]:
+                n_args: int = len(args)
+
+                deps: set[AnEntity] = {
+                    a
+                    for i, n in positional
+                    if isinstance(a := (args[i] if n_args > i else kwargs.get(n)),  # noqa: E501
+                                  AnEntity)}
+
+                deps.update(a
+                            for n in keyword_only
+                            if isinstance(a := kwargs.get(n), AnEntity))
+
+                return deps
+
+    return dependencies
+
+
+def _assign_constructed_entity_name(entity: AnEntity, name: str, /) -> None:
+    if isinstance(entity, Symbol):
+        entity.name: str = name
+
+    elif not hasattr(entity, entity._NAME_ATTR_KEY):
+        setattr(entity, entity._NAME_ATTR_KEY, name)
+
+
+def _session_unique_name() -> str:
+    """Return new name unique within default session.
+
+    As constructors' default name factory, it is instead resolved to the
+    factory of constructed entities' own sessions, once known.
+    """
+    from g.session import DEFAULT_SESSION
+
+    return DEFAULT_SESSION.unique_name()
+
+
+def _owning_session_unique_name(entity: AnEntity, /) -> str:
+    """Return new name unique within entity's (joined) session."""
+    from g.session import DEFAULT_SESSION
+
+    if (session := getattr(entity, entity._SESS_ATTR_KEY, None)) is None:
+        session: Session = DEFAULT_SESSION
+
+    return session.unique_name()
+
+
 def _func_qualname_and_signature(function: Callable, /) -> str:
     return f'{function.__qualname__}{signature(obj=function,
                                                follow_wrapped=False,
@@ -95,8 +306,13 @@ def _func_qualname_and_signature(function: Callable, /) -> str:
 
 
 def _decorate(function: Callable, /,  # noqa: C901,PLR0915
-              *, assign_name: bool | CallableReturningStr = True) -> Callable:
-    """Decorate function with dependencies & name assignment."""
+              *, kind: str = _FUNCTION,
+              assign_name: bool | CallableReturningStr = True) -> Callable:
+    """Decorate function with dependencies & name assignment.
+
+    A dedicated wrapper is generated for each kind of function (`__new__`,
+    `__init__`, method, property getter) so calls do no more than needed.
+    """
     assert isfunction(object=function), \
         TypeError(f'*** {function} NOT A FUNCTION ***')
 
@@ -112,96 +328,152 @@ def _decorate(function: Callable, /,  # noqa: C901,PLR0915
                underscore_numbers=False)
         print('==>')
 
-    name_already_in_arg_spec: bool = \
-        (_NAME_ATTR_KEY in signature(obj=function, follow_wrapped=False,
-                                     globals=None, locals=None, eval_str=False).parameters)  # noqa: E501
+    func_sig: Signature = signature(obj=function, follow_wrapped=False,
+                                    globals=None, locals=None, eval_str=False)
+
+    name_already_in_arg_spec: bool = _NAME_ATTR_KEY in func_sig.parameters
+
+    getter: bool = kind in (_PROPERTY, _CACHED_PROPERTY)
 
     assign_name: bool | CallableReturningStr = \
-        assign_name and (not name_already_in_arg_spec)
+        assign_name and (not name_already_in_arg_spec) and (not getter)
 
     default_name_factory: CallableReturningStr | None = (assign_name
-                                                         if isfunction(object=assign_name)  # noqa: E501
+                                                         if callable(assign_name)  # noqa: E501
                                                          else None)
 
-    @wraps(wrapped=function)
-    def func_w_deps_and_name_assignment(  # noqa: C901
-            *args: Any,
-            name: OptionalStrOrCallableReturningStr = default_name_factory,
-            **kwargs: Any) -> AnEntity | None:
-        dependencies: set[AnEntity] = {i
-                                       for i in (args + tuple(kwargs.values()))
-                                       if isinstance(i, AnEntity)}
+    dependencies: Callable[[tuple, dict], set[AnEntity]] = \
+        _dependency_collector(function, func_sig,
+                              skip_first=kind in (_NEW, _INIT, _CLASS_METHOD),
+                              always_first=kind in (_INSTANCE_METHOD, _PROPERTY, _CACHED_PROPERTY))  # noqa: E501
 
-        if isfunction(object=name):
-            name: str = name()
+    if getter:
+        @wraps(wrapped=function)
+        def func_w_deps_and_name_assignment(self: AnEntity, /) -> AnEntity:
+            result: AnEntity = function(self)
 
-            # validate name
-            AnEntity._validate_name(name)
+            assert isinstance(result, AnEntity), \
+                TypeError(f'*** RESULT {result} NOT OF TYPE {AnEntity.__name__} ***')  # noqa: E501
 
-        if name_already_in_arg_spec:
-            kwargs[_NAME_ATTR_KEY]: str = name
+            # assign dependencies
+            if getattr(result, _DEPS_ATTR_KEY, None) is None:
+                result.dependencies: set[AnEntity] = {self}
 
-        result: AnEntity | None = function(*args, **kwargs)
+            return result
 
-        if function.__name__ == _NEW_METHOD_NAME:
-            # assign dependencies
-            if not hasattr(result, result._DEPS_ATTR_KEY):
-                result.dependencies: set[AnEntity] = dependencies
+    elif name_already_in_arg_spec:
+        init: bool = kind == _INIT
 
-            # assign name
-            if assign_name:
-                if isinstance(result, Symbol):
-                    result.name: str = name
+        @wraps(wrapped=function)
+        def func_w_deps_and_name_assignment(*args: Any, **kwargs: Any) -> AnEntity | None:  # noqa: E501
+            if callable(name := kwargs.get(_NAME_ATTR_KEY)):
+                name: str = name()
+
+                # validate name
+                AnEntity._validate_name(name)
+
+                kwargs[_NAME_ATTR_KEY]: str = name
+
+            result: AnEntity | None = function(*args, **kwargs)
+
+            entity: AnEntity = args[0] if init else result
 
-                elif not hasattr(result, result._NAME_ATTR_KEY):
-                    setattr(result, result._NAME_ATTR_KEY, name)
+            # assign dependencies
+            if getattr(entity, _DEPS_ATTR_KEY, None) is None:
+                (deps := dependencies(args, kwargs)).discard(entity)
+                entity.dependencies: set[AnEntity] = deps
 
             return result
 
-        if function.__name__ == _INIT_METHOD_NAME:
-            self: AnEntity = args[0]
-            assert isinstance(self, AnEntity)
+    elif kind == _NEW:
+        @wraps(wrapped=function)
+        def func_w_deps_and_name_assignment(
+                *args: Any,
+                name: OptionalStrOrCallableReturningStr = default_name_factory,  # noqa: E501
+                **kwargs: Any) -> AnEntity:
+            if callable(name) and (name is not _session_unique_name):
+                name: str = name()
+
+                # validate name
+                AnEntity._validate_name(name)
 
-            assert result is None
+            result: AnEntity = function(*args, **kwargs)
 
             # assign dependencies
-            if not hasattr(self, self._DEPS_ATTR_KEY):
-                self.dependencies: set[AnEntity] = dependencies - {self}
+            if getattr(result, _DEPS_ATTR_KEY, None) is None:
+                result.dependencies: set[AnEntity] = dependencies(args, kwargs)  # noqa: E501
 
-            # assign name
+            # assign name, unique within session joined through dependencies
             if assign_name:
-                if isinstance(self, Symbol):
-                    self.name: str = name
+                _assign_constructed_entity_name(
+                    result,
+                    _owning_session_unique_name(result)
+                    if name is _session_unique_name
+                    else name)
+
+            return result
+
+    elif kind == _INIT:
+        @wraps(wrapped=function)
+        def func_w_deps_and_name_assignment(
+                *args: Any,
+                name: OptionalStrOrCallableReturningStr = default_name_factory,  # noqa: E501
+                **kwargs: Any) -> None:
+            if callable(name) and (name is not _session_unique_name):
+                name: str = name()
+
+                # validate name
+                AnEntity._validate_name(name)
+
+            function(*args, **kwargs)
+
+            self: AnEntity = args[0]
 
-                elif not hasattr(self, self._NAME_ATTR_KEY):
-                    setattr(self, self._NAME_ATTR_KEY, name)
+            # assign dependencies
+            if getattr(self, _DEPS_ATTR_KEY, None) is None:
+                (deps := dependencies(args, kwargs)).discard(self)
+                self.dependencies: set[AnEntity] = deps
 
-            return None
+            # assign name, unique within session joined through dependencies
+            if assign_name:
+                _assign_constructed_entity_name(
+                    self,
+                    _owning_session_unique_name(self)
+                    if name is _session_unique_name
+                    else name)
+
+    else:
+        @wraps(wrapped=function)
+        def func_w_deps_and_name_assignment(
+                *args: Any,
+                name: OptionalStrOrCallableReturningStr = default_name_factory,  # noqa: E501
+                **kwargs: Any) -> AnEntity:
+            result: AnEntity = function(*args, **kwargs)
+
+            assert isinstance(result, AnEntity), \
+                TypeError(f'*** RESULT {result} NOT OF TYPE {AnEntity.__name__} ***')  # noqa: E501
 
-        assert isinstance(result, AnEntity), \
-            TypeError(f'*** RESULT {result} NOT OF TYPE {AnEntity.__name__} ***')  # noqa: E501
+            # assign dependencies
+            if getattr(result, _DEPS_ATTR_KEY, None) is None:
+                result.dependencies: set[AnEntity] = dependencies(args, kwargs)  # noqa: E501
 
-        # assign dependencies
-        if not hasattr(result, result._DEPS_ATTR_KEY):
-            result.dependencies: set[AnEntity] = dependencies
+            # assign name
+            if assign_name and name:
+                if callable(name):
+                    name: str = name()
 
-        # assign name
-        if assign_name and name:
-            # validate name
-            AnEntity._validate_name(name)
+                # validate name
+                AnEntity._validate_name(name)
 
-            result.name: str = name
+                result.name: str = name
 
-        return result
+            return result
 
     setattr(func_w_deps_and_name_assignment, _ALREADY_DECORATED_ATTR_KEY, True)
 
-    if not name_already_in_arg_spec:
+    if not (name_already_in_arg_spec or getter):
         func_w_deps_and_name_assignment.__annotations__[_NAME_ATTR_KEY] = OptionalStrOrCallableReturningStr  # noqa: E501
 
-        func_sig: Signature = signature(obj=function, follow_wrapped=False,
-                                        globals=None, locals=None, eval_str=False)  # noqa: E501
-
         func_params: list[Any] = list(func_sig.parameters.values())
 
         name_param: Parameter = Parameter(name=_NAME_ATTR_KEY,
@@ -237,7 +509,158 @@ def _decorate(function: Callable, /,  # noqa: C901,PLR0915
     return func_w_deps_and_name_assignment
 
 
-def assign_entity_dependencies_and_name(entity_related_callable: Callable, /) -> Callable:  # noqa: C901,E501,PLR0915
+# version of decoration plans' format, to bump whenever plans change in ways
+# not reflected by source files (e.g., new member kinds)
+_DECORATION_PLAN_FORMAT_VERSION: int = 2
+
+# keys of cached plans & of identifiers of annotations they evaluated in `g`
+_PLAN_KEY: LiteralString = 'plan'
+_FALLBACKS_KEY: LiteralString = 'fallbacks'
+
+# decoration plans by class full name, persisted across interpreter sessions
+# only if opted into by setting cache directory environment variable
+_DECORATION_PLAN_CACHE: PersistentCache | None = (
+    PersistentCache(f'decoration-plans-v{_DECORATION_PLAN_FORMAT_VERSION}')
+    if os.environ.get(CACHE_DIR_ENV_VAR)
+    else None)
+
+
+def _lookup(cls: type, member_name: str, /) -> tuple[type | None, Any]:
+    """Return class in MRO defining member, and member's raw descriptor."""
+    for owner_class in cls.__mro__:
+        if member_name in (class_dict := vars(owner_class)):
+            return owner_class, class_dict[member_name]
+
+    return None, None
+
+
+def _unwrap_static(member: Any, /) -> Any:
+    """Return function underlying static method, if applicable."""
+    return member.__func__ if isinstance(member, staticmethod) else member
+
+
+def _compute_decoration_plan(cls: type, /) -> tuple[list[tuple[str, str]], dict[str, str | None]]:  # noqa: C901,E501
+    """Introspect class for members to decorate.
+
+    Return plan, together with identifiers of annotations evaluated in `g`,
+    whose namespace is runtime state rather than derived from source files.
+    """
+    plan: list[tuple[str, str]] = []
+    fallbacks: dict[str, str | None] = {}
+
+    for member_name in dir(cls):
+        owner_class, member = _lookup(cls, member_name)
+
+        if owner_class is None or isclass(object=member):
+            continue
+
+        # if __new__ is implemented somewhere in __mro__
+        if member_name == _NEW_METHOD_NAME:
+            if isfunction(object=_unwrap_static(member)):
+                plan.append((member_name, _NEW))
+
+        # if __init__ is implemented somewhere in __mro__
+        elif member_name == _INIT_METHOD_NAME:
+            if isfunction(object=_unwrap_static(member)):
+                plan.append((member_name, _INIT))
+
+            else:
+                assert ismethoddescriptor(object=member), \
+                    (f'??? {cls.__name__} MRO '
+                     f'MISSING __init__ METHOD: {describe(member)} ???')
+
+        elif isinstance(member, staticmethod):
+            if isfunction(object=member.__func__) and \
+                    _decorable(member.__func__, owner_class, fallbacks):
+                plan.append((member_name, _STATIC_METHOD))
+
+        elif isinstance(member, classmethod):
+            if isfunction(object=member.__func__) and \
+                    _decorable(member.__func__, owner_class, fallbacks):
+                plan.append((member_name, _CLASS_METHOD))
+
+        elif isfunction(object=member):
+            if _decorable(member, owner_class, fallbacks):
+                plan.append((member_name, _INSTANCE_METHOD))
+
+        elif is_property(member):
+            if isfunction(object=member.fget) and \
+                    _decorable(member.fget, owner_class, fallbacks):
+                plan.append((member_name, _PROPERTY))
+
+        elif is_cached_property(member):
+            if isfunction(object=member.func) and \
+                    _decorable(member.func, owner_class, fallbacks):
+                plan.append((member_name, _CACHED_PROPERTY))
+
+    return plan, fallbacks
+
+
+def _decoration_plan_sources(cls: type, /) -> dict[str, int] | None:
+    """Return modification times of source files that plans derive from.
+
+    These are the source files of all classes in the MRO & of this module,
+    which computes plans.
+    """
+    # classes defined inside functions cannot be identified across sessions
+    if '<locals>' in cls.__class_full_name__():
+        return None
+
+    return source_mtimes(({c.__module__ for c in cls.__mro__} | {__name__}) - {'builtins'})  # noqa: E501
+
+
+def _decoration_plan(cls: type, /) -> Sequence[tuple[str, str]]:
+    """Return (cached) plan of class members to decorate.
+
+    Plans are keyed by class module & qualified name, and are invalidated
+    whenever the source file of any class in the MRO or of this module is
+    modified, or whenever plans' format version changes. Plans are also
+    recomputed whenever any annotation they evaluated in `g` resolves
+    differently.
+    """
+    if _DECORATION_PLAN_CACHE is None or \
+            (sources := _decoration_plan_sources(cls)) is None:
+        plan, _ = _compute_decoration_plan(cls)
+        return plan
+
+    key: str = cls.__class_full_name__()
+
+    if ((cached := _DECORATION_PLAN_CACHE.get(key, sources)) is not None) and \
+            all(_g_annotation_id(annotation) == annotation_id
+                for annotation, annotation_id in cached[_FALLBACKS_KEY].items()):  # noqa: E501
+        return cached[_PLAN_KEY]
+
+    plan, fallbacks = _compute_decoration_plan(cls)
+
+    _DECORATION_PLAN_CACHE.set(key, sources, {_PLAN_KEY: plan,
+                                              _FALLBACKS_KEY: fallbacks})
+
+    return plan
+
+
+def _already_decorated(member: Any, kind: str, /) -> bool:
+    """Check if function underlying class member is already decorated."""
+    function: Any = (member.__func__ if kind in (_STATIC_METHOD, _CLASS_METHOD)
+                     else member.fget if kind == _PROPERTY
+                     else member.func if kind == _CACHED_PROPERTY
+                     else member)
+
+    return getattr(function, _ALREADY_DECORATED_ATTR_KEY, False)
+
+
+def _print_debug_description(label: str, function: Callable, /) -> None:
+    print(f'{label} {_func_qualname_and_signature(function)}')
+    pprint(describe(function).__dict__,
+           stream=None,
+           indent=2,
+           width=80,
+           depth=None,
+           compact=False,
+           sort_dicts=False,
+           underscore_numbers=False)
+
+
+def assign_entity_dependencies_and_name(entity_related_callable: Callable, /) -> Callable:  # noqa: C901,E501
     """Assign Name & Dependencies to Newly-Created Entity."""
     if isclass(object=entity_related_callable):
         assert issubclass(entity_related_callable, AnEntity), \
@@ -248,176 +671,68 @@ def assign_entity_dependencies_and_name(entity_related_callable: Callable, /) ->
             TypeError(f'*** {entity_related_callable} ABSTRACT '
                       'AND NOT _decorable( ***')
 
-        class_members: dict[LiteralString, Any] = \
-            dict(getmembers(object=entity_related_callable,
-                            predicate=lambda member: not (isabstract(object=member) or  # noqa: E501
-                                                          isclass(object=member))))  # noqa: E501,RUF100
+        constructor_name_assignment: bool | CallableReturningStr = \
+            (True
+             if entity_related_callable._NAME_NULLABLE
+             else _session_unique_name)
 
-        # if __new__ is implemented somewhere in __mro__
-        if isfunction(object=(__new__ := class_members.pop(_NEW_METHOD_NAME))):
-            entity_related_callable.__new__: Callable[..., AnEntity] = \
-                _decorate(__new__,
-                          assign_name=(True
-                                       if entity_related_callable._NAME_NULLABLE  # noqa: E501
-                                       else UNIQUE_NAME_FACTORY))
+        for class_member_name, kind in _decoration_plan(entity_related_callable):  # noqa: E501
+            _, class_member = _lookup(entity_related_callable,
+                                      class_member_name)
 
-            if debug.ON:
-                print()
+            # inherited members may already be decorated
+            if kind not in (_NEW, _INIT) and \
+                    _already_decorated(class_member, kind):
+                continue
 
-        # if __init__ is implemented somewhere in __mro__
-        if isfunction(object=(__init__ := class_members.pop(_INIT_METHOD_NAME))):  # noqa: E501
-            entity_related_callable.__init__: Callable[..., None] = \
-                _decorate(__init__,
-                          assign_name=(True
-                                       if entity_related_callable._NAME_NULLABLE  # noqa: E501
-                                       else UNIQUE_NAME_FACTORY))
+            if debug.ON and kind not in (_NEW, _INIT):
+                print(f'DECORATING {kind.upper()}...')
 
-            if debug.ON:
-                print()
+            if kind == _NEW:
+                entity_related_callable.__new__: Callable[..., AnEntity] = \
+                    _decorate(_unwrap_static(class_member), kind=kind,
+                              assign_name=constructor_name_assignment)
 
-        else:
-            assert ismethoddescriptor(object=__init__), \
-                (f'??? {entity_related_callable.__name__} MRO '
-                 f'MISSING __init__ METHOD: {describe(__init__)} ???')
-
-        for class_member_name, class_member in class_members.items():
-            if isfunction(object=class_member) and _decorable(class_member):
-                # Static Method
-                if is_static_method(class_member):
-                    if debug.ON:
-                        print(f'DECORATING STATIC METHOD '
-                              f'{_func_qualname_and_signature(class_member)}')
-                        pprint(describe(class_member).__dict__,
-                               stream=None,
-                               indent=2,
-                               width=80,
-                               depth=None,
-                               compact=False,
-                               sort_dicts=False,
-                               underscore_numbers=False)
-                        print('==>')
-
-                    setattr(entity_related_callable, class_member_name,
-                            staticmethod(_decorate(class_member,
-                                                   assign_name=True)))
-
-                    if debug.ON:
-                        decorated_class_member: Callable[..., AnEntity] = \
-                            getattr(entity_related_callable, class_member_name)
-
-                        print('==>')
-                        print(f'DECORATED STATIC METHOD '
-                              f'{_func_qualname_and_signature(decorated_class_member)}')  # noqa: E501
-                        pprint(describe(decorated_class_member).__dict__,
-                               stream=None,
-                               indent=2,
-                               width=80,
-                               depth=None,
-                               compact=False,
-                               sort_dicts=False,
-                               underscore_numbers=False)
-                        print()
-
-                # Unbound Instance Method
-                else:
-                    assert is_instance_method(class_member, bound=False)
-
-                    if debug.ON:
-                        print(f'DECORATING UNBOUND INSTANCE METHOD '
-                              f'{_func_qualname_and_signature(class_member)}')
-                        pprint(describe(class_member).__dict__,
-                               stream=None,
-                               indent=2,
-                               width=80,
-                               depth=None,
-                               compact=False,
-                               sort_dicts=False,
-                               underscore_numbers=False)
-                        print('==>')
-
-                    setattr(entity_related_callable, class_member_name,
-                            _decorate(class_member, assign_name=True))
-
-                    if debug.ON:
-                        decorated_class_member: Callable[..., AnEntity] = \
-                            getattr(entity_related_callable, class_member_name)
-
-                        print('==>')
-                        print(f'DECORATED UNBOUND INSTANCE METHOD '
-                              f'{_func_qualname_and_signature(decorated_class_member)}')  # noqa: E501
-                        pprint(describe(decorated_class_member).__dict__,
-                               stream=None,
-                               indent=2,
-                               width=80,
-                               depth=None,
-                               compact=False,
-                               sort_dicts=False,
-                               underscore_numbers=False)
-                        print()
-
-            # Class Method
-            elif is_class_method(class_member) and _decorable(class_member.__func__):  # noqa: E501
-                if debug.ON:
-                    print(f'DECORATING CLASS METHOD '
-                          f'{_func_qualname_and_signature(class_member)}')
-                    pprint(describe(class_member).__dict__,
-                           stream=None,
-                           indent=2,
-                           width=80,
-                           depth=None,
-                           compact=False,
-                           sort_dicts=False,
-                           underscore_numbers=False)
-                    print('==>')
+            elif kind == _INIT:
+                entity_related_callable.__init__: Callable[..., None] = \
+                    _decorate(_unwrap_static(class_member), kind=kind,
+                              assign_name=constructor_name_assignment)
+
+            elif kind == _STATIC_METHOD:
+                setattr(entity_related_callable, class_member_name,
+                        staticmethod(_decorate(class_member.__func__,
+                                               kind=kind, assign_name=True)))
 
+            elif kind == _CLASS_METHOD:
                 setattr(entity_related_callable, class_member_name,
                         classmethod(_decorate(class_member.__func__,
-                                              assign_name=True)))
-
-                if debug.ON:
-                    decorated_class_member: Callable[..., AnEntity] = \
-                        getattr(entity_related_callable, class_member_name)
-
-                    print('==>')
-                    print(f'DECORATED CLASS METHOD '
-                          f'{_func_qualname_and_signature(decorated_class_member)}')  # noqa: E501
-                    pprint(describe(decorated_class_member).__dict__,
-                           stream=None,
-                           indent=2,
-                           width=80,
-                           depth=None,
-                           compact=False,
-                           sort_dicts=False,
-                           underscore_numbers=False)
-                    print()
-
-            # Property's Underlying Getter Function
-            elif is_property(class_member):
-                if debug.ON:
-                    print("DECORATING INSTANCE PROPERTY'S GETTER FUNCTION...")
+                                              kind=kind, assign_name=True)))
+
+            elif kind == _INSTANCE_METHOD:
+                setattr(entity_related_callable, class_member_name,
+                        _decorate(class_member, kind=kind, assign_name=True))
 
+            elif kind == _PROPERTY:
                 setattr(entity_related_callable, class_member_name,
-                        property(fget=_decorate(class_member.fget,
+                        property(fget=_decorate(class_member.fget, kind=kind,
                                                 assign_name=False),
                                  fset=class_member.fset,
                                  fdel=class_member.fdel,
                                  doc=class_member.__doc__))
 
-                if debug.ON:
-                    print()
-
-            # Cached Property's Underlying Function
-            elif is_cached_property(class_member):
-                if debug.ON:
-                    print("DECORATING INSTANCE CACHED PROPERTY'S "
-                          'UNDERLYING FUNCTION...')
-
+            elif kind == _CACHED_PROPERTY:
                 setattr(entity_related_callable, class_member_name,
                         cached_property(func=_decorate(class_member.func,
+                                                       kind=kind,
                                                        assign_name=False)))
 
-                if debug.ON:
-                    print()
+            if debug.ON:
+                if kind in (_STATIC_METHOD, _CLASS_METHOD, _INSTANCE_METHOD):
+                    _print_debug_description(
+                        f'DECORATED {kind.upper()}',
+                        getattr(entity_related_callable, class_member_name))
+
+                print()
 
         return entity_related_callable
 
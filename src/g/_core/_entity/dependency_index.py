@@ -0,0 +1,249 @@
+"""Reverse Dependency Index.
+
+Entities only record their upstream dependencies. A reverse index maps each
+entity to its downstream dependents, so the sub-graph affected by an edit can
+be found without scanning all entities.
+
+Entities are keyed by identity rather than equality (as equal Points or
+Vectors are nonetheless distinct entities), and held by weak references so
+that indexing never keeps entities alive.
+
+As dependencies may span sessions, and entities may move between sessions,
+a single index is shared by all sessions.
+
+Constructions merely queue their entities, so that they pay neither for
+locking nor for index updates; queued entities are indexed with their
+then-current dependencies upon the next query.
+"""
+
+
+from __future__ import annotations
+
+from collections import deque
+from threading import RLock
+from typing import TYPE_CHECKING
+from weakref import ref
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from typing import LiteralString, Self
+
+    from .abc import AnEntity
+
+
+# number of queued entities beyond which they are indexed without a query,
+# so that the queue stays bounded
+_MAX_N_PENDING_ADDITIONS: int = 2 ** 12
+
+
+__all__: Sequence[LiteralString] = 'DependencyIndex', 'DEPENDENCY_INDEX'
+
+
+class DependencyIndex:
+    """Identity-keyed, weakly-referencing Reverse Dependency Index."""
+
+    def __init__(self: Self, /) -> None:
+        """Initialize reverse dependency index."""
+        # weak references to indexed entities, by entity ID
+        self._refs: dict[int, Callable[[], AnEntity | None]] = {}
+
+        # dependency ID -> dependent IDs
+        self._dependents: dict[int, set[int]] = {}
+
+        # dependent ID -> dependency IDs
+        self._dependencies: dict[int, tuple[int, ...]] = {}
+
+        # IDs of garbage-collected entities, removed lazily
+        self._pending_removals: list[int] = []
+
+        # weak references to entities to (re-)index, added lazily
+        self._pending_additions: deque[Callable[[], AnEntity | None]] = deque()
+
+        self._lock: RLock = RLock()
+
+    def __len__(self: Self, /) -> int:
+        """Return number of indexed entities."""
+        with self._lock:
+            self._update()
+            return len(self._refs)
+
+    def __contains__(self: Self, entity: AnEntity, /) -> bool:
+        """Check if entity is indexed."""
+        with self._lock:
+            self._update()
+            return id(entity) in self._refs
+
+    def _ref(self: Self, entity: AnEntity, /) -> int:
+        """Register weak reference to entity & return its ID."""
+        if (entity_id := id(entity)) not in self._refs:
+            try:
+                self._refs[entity_id] = ref(
+                    entity,
+                    lambda _, entity_id=entity_id:
+                        self._pending_removals.append(entity_id))
+
+            # entities not supporting weak references are held strongly
+            except TypeError:
+                self._refs[entity_id] = lambda entity=entity: entity
+
+        return entity_id
+
+    def _unlink(self: Self, entity_id: int, /) -> None:
+        """Remove edges from entity's dependencies to entity."""
+        for dependency_id in self._dependencies.pop(entity_id, ()):
+            if dependents := self._dependents.get(dependency_id):
+                dependents.discard(entity_id)
+
+                if not dependents:
+                    del self._dependents[dependency_id]
+
+    def _purge(self: Self, /) -> None:
+        """Remove garbage-collected entities."""
+        while self._pending_removals:
+            entity_id: int = self._pending_removals.pop()
+
+            self._unlink(entity_id)
+            self._dependents.pop(entity_id, None)
+            self._refs.pop(entity_id, None)
+
+    def _index(self: Self, entity: AnEntity, /) -> None:
+        """Index entity with its (replacing any previous) dependencies."""
+        entity_id: int = self._ref(entity)
+
+        self._unlink(entity_id)
+
+        if dependency_ids := tuple({self._ref(dependency): None
+                                    for dependency in entity.dependencies}):
+            self._dependencies[entity_id] = dependency_ids
+
+            for dependency_id in dependency_ids:
+                self._dependents.setdefault(dependency_id, set()).add(entity_id)  # noqa: E501
+
+    def _update(self: Self, /) -> None:
+        """Index queued entities & remove garbage-collected ones."""
+        while self._pending_additions:
+            if (entity := self._pending_additions.popleft()()) is not None:
+                self._index(entity)
+
+        self._purge()
+
+    def add(self: Self, entity: AnEntity, /) -> None:
+        """Queue entity for (re-)indexing with its current dependencies."""
+        try:
+            self._pending_additions.append(ref(entity))
+
+        # entities not supporting weak references are held strongly
+        except TypeError:
+            self._pending_additions.append(lambda entity=entity: entity)
+
+        if len(self._pending_additions) > _MAX_N_PENDING_ADDITIONS:
+            with self._lock:
+                self._update()
+
+    def remove(self: Self, entity: AnEntity, /) -> None:
+        """Un-index entity, unless still depended upon."""
+        with self._lock:
+            self._update()
+
+            self._unlink(entity_id := id(entity))
+
+            if entity_id not in self._dependents:
+                self._refs.pop(entity_id, None)
+
+    def _entities(self: Self, entity_ids: Iterable[int], /) -> list[AnEntity]:
+        """Return live entities by IDs."""
+        return [entity
+                for entity_id in entity_ids
+                if (entity := self._refs[entity_id]()) is not None]
+
+    def dependents(self: Self, entity: AnEntity, /) -> list[AnEntity]:
+        """Return direct dependents of entity."""
+        with self._lock:
+            self._update()
+            return self._entities(self._dependents.get(id(entity), ()))
+
+    def transitive_dependents(self: Self, entity: AnEntity, /) -> list[AnEntity]:  # noqa: E501
+        """Return direct & indirect dependents of entity, breadth-first."""
+        with self._lock:
+            self._update()
+
+            visited_ids: dict[int, None] = {}
+            queue: deque[int] = deque((id(entity),))
+
+            while queue:
+                for dependent_id in self._dependents.get(queue.popleft(), ()):
+                    if dependent_id not in visited_ids:
+                        visited_ids[dependent_id] = None
+                        queue.append(dependent_id)
+
+            return self._entities(visited_ids)
+
+    def topological_order(self: Self, entities: Iterable[AnEntity] | None = None, /) -> list[AnEntity]:  # noqa: E501
+        """Return indexed (or given) entities, each after all its dependencies.
+
+        Given entities are ordered by depth-first search of their upstream
+        sub-graph only, also through dependencies not among them.
+        """
+        with self._lock:
+            self._update()
+
+            if entities is not None:
+                return self._upstream_order({id(entity): entity for entity in entities})  # noqa: E501
+
+            n_pending_dependencies: dict[int, int] = {
+                entity_id: n
+                for entity_id, dependency_ids in self._dependencies.items()
+                if (n := sum(dependency_id in self._refs
+                             for dependency_id in dependency_ids))}
+
+            queue: deque[int] = deque(entity_id
+                                      for entity_id in self._refs
+                                      if entity_id not in n_pending_dependencies)  # noqa: E501
+            ordered_ids: list[int] = []
+
+            while queue:
+                ordered_ids.append(entity_id := queue.popleft())
+
+                for dependent_id in self._dependents.get(entity_id, ()):
+                    if not (n := n_pending_dependencies[dependent_id] - 1):
+                        queue.append(dependent_id)
+
+                    n_pending_dependencies[dependent_id] = n
+
+            assert len(ordered_ids) == len(self._refs), \
+                ValueError('*** CYCLIC DEPENDENCIES ***')
+
+            return self._entities(ordered_ids)
+
+    def _upstream_order(self: Self, entities: dict[int, AnEntity], /) -> list[AnEntity]:  # noqa: E501
+        """Return entities by IDs in post-order of upstream depth-first search."""
+        ordered: list[AnEntity] = []
+        visited_ids: set[int] = set()
+
+        for root_id in entities:
+            if root_id in visited_ids:
+                continue
+
+            visited_ids.add(root_id)
+            stack: list[tuple[int, Iterator[int]]] = [(root_id, iter(self._dependencies.get(root_id, ())))]  # noqa: E501
+
+            while stack:
+                entity_id, dependency_ids = stack[-1]
+
+                for dependency_id in dependency_ids:
+                    if dependency_id not in visited_ids:
+                        visited_ids.add(dependency_id)
+                        stack.append((dependency_id, iter(self._dependencies.get(dependency_id, ()))))  # noqa: E501
+                        break
+
+                else:
+                    stack.pop()
+
+                    if entity_id in entities:
+                        ordered.append(entities[entity_id])
+
+        return ordered
+
+
+# index shared by all sessions
+DEPENDENCY_INDEX: DependencyIndex = DependencyIndex()
@@ -22,3 +22,5 @@ __all__: Sequence[LiteralString] = ('ANonGeomEntity',)
 
 class ANonGeomEntity(AnEntity):
     """Abstract Non-Geometric Entity."""
+
+    __slots__: Sequence[LiteralString] = ()
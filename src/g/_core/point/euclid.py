@@ -1,4 +1,10 @@
-"""Euclidean Point classes."""
+"""Euclidean Point classes.
+
+Arithmetic of concrete points with plain Python numbers as coordinates
+takes a numeric fast path, never touching SymPy; results are only promoted
+to symbolic form, as Variables bound to SymPy expressions, once Variables
+are involved.
+"""
 
 
 from __future__ import annotations
@@ -8,11 +14,13 @@ from typing import TYPE_CHECKING
 
 from sympy.core.numbers import oo
 
+from ..variable import Variable
+from ..vector import Vector
 from .abc import APoint, AConcretePoint, APointAtInf
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
-    from typing import LiteralString
+    from typing import Any, LiteralString, Self
 
     from ..variable import RealNumOrVar, OptionalRealNumOrVar
     from ..vector import Vec, OptionalVec
@@ -23,6 +31,18 @@ __all__: Sequence[LiteralString] = ('EuclidPoint',
                                     'EUCLID_ORIG')
 
 
+# plain Python numbers, for which arithmetic takes numeric fast path
+_RAW_NUM_TYPES: tuple[type, ...] = int, float
+
+
+def _symbolic_coord(value: Any, /) -> RealNumOrVar:
+    """Promote symbolic arithmetic result to Variable, unless number."""
+    if isinstance(value, Variable) or getattr(value, 'is_number', True):
+        return value
+
+    return Variable(value)
+
+
 @dataclass
 class EuclidPoint(APoint):
     """Euclidean Point."""
@@ -44,6 +64,49 @@ class EuclidConcretePoint(EuclidPoint, AConcretePoint):
 
     inf_dir: OptionalVec = None
 
+    @property
+    def homogeneous(self) -> tuple[RealNumOrVar, ...]:
+        """Return homogeneous coordinates (x, y, z, 1)."""
+        return self.x, self.y, self.z, 1
+
+    @property
+    def numeric(self) -> bool:
+        """Check whether coordinates are all plain Python numbers."""
+        return (isinstance(self.x, _RAW_NUM_TYPES) and
+                isinstance(self.y, _RAW_NUM_TYPES) and
+                isinstance(self.z, _RAW_NUM_TYPES))
+
+    def __add__(self, vector: Vec, /) -> Self:
+        """Translate by vector."""
+        if not isinstance(vector, Vector):
+            return NotImplemented
+
+        # numeric fast path
+        if (self.numeric and isinstance(vector.x, _RAW_NUM_TYPES) and
+                isinstance(vector.y, _RAW_NUM_TYPES) and
+                isinstance(vector.z, _RAW_NUM_TYPES)):
+            return type(self)(self.x + vector.x, self.y + vector.y, self.z + vector.z)  # noqa: E501
+
+        return type(self)(_symbolic_coord(self.x + vector.x),
+                          _symbolic_coord(self.y + vector.y),
+                          _symbolic_coord(self.z + vector.z))
+
+    def __sub__(self, other: EuclidConcretePoint | Vec, /) -> Vec | Self:
+        """Return displacement vector from other point, or translate back."""
+        if isinstance(other, Vector):
+            return self + Vector(-other.x, -other.y, -other.z)
+
+        if not isinstance(other, EuclidConcretePoint):
+            return NotImplemented
+
+        # numeric fast path
+        if self.numeric and other.numeric:
+            return Vector(self.x - other.x, self.y - other.y, self.z - other.z)  # noqa: E501
+
+        return Vector(_symbolic_coord(self.x - other.x),
+                      _symbolic_coord(self.y - other.y),
+                      _symbolic_coord(self.z - other.z))
+
 
 @dataclass
 class EuclidPointAtInf(EuclidPoint, APointAtInf):
@@ -55,6 +118,11 @@ class EuclidPointAtInf(EuclidPoint, APointAtInf):
     y: RealNumOrVar = oo
     z: RealNumOrVar = oo
 
+    @property
+    def homogeneous(self) -> tuple[RealNumOrVar, ...]:
+        """Return homogeneous coordinates (direction x, y, z, 0)."""
+        return self.inf_dir.x, self.inf_dir.y, self.inf_dir.z, 0
+
 
 # origin
 EUCLID_ORIG: EuclidConcretePoint = EuclidConcretePoint()
@@ -13,7 +13,6 @@ from sympy.core.symbol import Symbol
 from g._util.type import (Num, RealNum,
                           OptionalStrOrCallableReturningStr,
                           OptionalSymPyExpr, OptionalStrOrSymPyExpr)
-from g._util.unique_name import UNIQUE_NAME_FACTORY
 
 from ._entity import ANonGeomEntity, assign_entity_dependencies_and_name
 
@@ -51,11 +50,19 @@ class Variable(ANonGeomEntity, Symbol):
 
             name: str = expr_or_name
 
-        # generate name if not already given as string
+        # generate name if not already given as string, unique within
+        # session of Variables of bound expression, if any
         if callable(name):
             name: str = name()
         elif not name:
-            name: str = UNIQUE_NAME_FACTORY()
+            bound_expr: OptionalSymPyExpr = (expr_or_name
+                                             if isinstance(expr_or_name, Expr)
+                                             else expr)
+
+            name: str = cls._joined_session(
+                symbol
+                for symbol in getattr(bound_expr, 'free_symbols', ())
+                if isinstance(symbol, Variable)).unique_name()
 
         # validate name
         cls._validate_name(name)
@@ -81,6 +88,27 @@ class Variable(ANonGeomEntity, Symbol):
 
         self.expr: Expr = expr
 
+    _EXPR_ATTR_KEY: LiteralString = '_expr'
+
+    @property
+    def expr(self: Self, /) -> OptionalSymPyExpr:
+        """Get bound expression."""
+        return getattr(self, self._EXPR_ATTR_KEY, None)
+
+    @expr.setter
+    def expr(self: Self, expr: OptionalSymPyExpr, /) -> None:
+        """(Re)bind expression, invalidating downstream cached properties."""
+        rebinding: bool = hasattr(self, self._EXPR_ATTR_KEY)
+
+        if rebinding and (expr == getattr(self, self._EXPR_ATTR_KEY)):
+            return
+
+        setattr(self, self._EXPR_ATTR_KEY, expr)
+
+        # dependents are indexed across sessions
+        if rebinding:
+            self.session.propagate_change(self)
+
     @property
     def _short_repr(self: Self, /) -> str:
         """Return short string representation."""
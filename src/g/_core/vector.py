@@ -26,8 +26,7 @@ characteristic vectors.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ._entity import ANonGeomEntity, assign_entity_dependencies_and_name
 from .variable import RealNumOrVar
@@ -42,6 +41,19 @@ __all__: Sequence[LiteralString] = ('Vector', 'Vec', 'V',
                                     'Ux', 'Uy', 'Uz', 'V0')
 
 
+_COORD_NAMES: frozenset[str] = frozenset(('x', 'y', 'z'))
+
+
+class _VectorSlots(ANonGeomEntity):
+    """Non-field slots of Vectors: entity attributes & per-instance caches.
+
+    Declared outside Vector's dataclass, so that only coordinates are fields.
+    """
+
+    __slots__: Sequence[LiteralString] = ('_session', '_dependencies', '_name',
+                                          '_length', '_unit')
+
+
 @assign_entity_dependencies_and_name
 @dataclass(init=True,
            repr=True,
@@ -51,25 +63,44 @@ __all__: Sequence[LiteralString] = ('Vector', 'Vec', 'V',
            frozen=False,
            match_args=True,
            kw_only=False,
-           slots=False,
-           weakref_slot=False)
-class Vector(ANonGeomEntity):
-    """(3-Dimensional) Vector."""
+           slots=True,
+           weakref_slot=True)
+class Vector(_VectorSlots):
+    """(3-Dimensional) Vector.
+
+    Magnitude & unit vector are cached per instance, and invalidated upon
+    coordinate changes.
+    """
 
     x: RealNumOrVar = 0
     y: RealNumOrVar = 0
     z: RealNumOrVar = 0
 
-    @cache
+    def __setattr__(self: Self, name: str, value: Any, /) -> None:
+        """Set attribute, invalidating caches upon coordinate changes."""
+        object.__setattr__(self, name, value)
+
+        if name in _COORD_NAMES:
+            object.__setattr__(self, '_length', None)
+            object.__setattr__(self, '_unit', None)
+
     def __len__(self: Self) -> RealNumOrVar:
         """Return length/magnitude/modulus."""
-        return (self.x ** 2 + self.y ** 2 + self.z ** 2) ** .5
+        if (length := self._length) is None:
+            length: RealNumOrVar = (self.x ** 2 + self.y ** 2 + self.z ** 2) ** .5  # noqa: E501
+            object.__setattr__(self, '_length', length)
+
+        return length
 
-    @cache
     def unit(self) -> Self:
         """Return unit vector."""
-        m: RealNumOrVar = len(self)
-        return type(self)(x=self.x / m, y=self.y / m, z=self.z / m)
+        if (unit := self._unit) is None:
+            # call __len__ directly, as len() only accepts integer results
+            m: RealNumOrVar = self.__len__()
+            unit: Self = type(self)(x=self.x / m, y=self.y / m, z=self.z / m)  # noqa: E501
+            object.__setattr__(self, '_unit', unit)
+
+        return unit
 
 
 # aliases
@@ -0,0 +1,167 @@
+"""Vector Batch.
+
+Vector Batches hold many 3-dimensional Vectors as one structure-of-arrays
+(N, 3)-shaped NumPy array, of float64 if all components are numeric, else of
+objects (e.g., Variables), so bulk direction computations are vectorized
+rather than looping through Vector objects.
+"""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.functions.elementary.trigonometric import acos
+
+from .vector import Vector
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import Any, LiteralString, Self
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('VectorBatch',)
+
+
+_N_DIMS: int = 3
+
+_symbolic_acos: np.ufunc = np.frompyfunc(acos, 1, 1)
+
+
+def _array(components: ArrayLike, /) -> NDArray:
+    """Return float64 array if components are all numeric, else object one."""
+    try:
+        return np.asarray(components, dtype=np.float64)
+
+    except (TypeError, ValueError):
+        return np.asarray(components, dtype=object)
+
+
+class VectorBatch:
+    """Batch of (3-Dimensional) Vectors."""
+
+    __slots__: Sequence[LiteralString] = ('components',)
+
+    def __init__(self: Self, components: ArrayLike, /) -> None:
+        """Initialize vector batch from (N, 3)-shaped components."""
+        components: NDArray = _array(components)
+
+        if components.size == 0:
+            components: NDArray = components.reshape(0, _N_DIMS)
+
+        assert components.ndim == 2 and components.shape[1] == _N_DIMS, \
+            ValueError(f'*** COMPONENTS OF SHAPE {components.shape} '
+                       f'NOT OF SHAPE (N, {_N_DIMS}) ***')
+
+        self.components: NDArray = components
+
+    @classmethod
+    def from_vectors(cls: type[Self], vectors: Iterable[Vector], /) -> Self:
+        """Create vector batch from Vectors."""
+        return cls([(v.x, v.y, v.z) for v in vectors])
+
+    def to_vectors(self: Self, /) -> list[Vector]:
+        """Return list of Vectors."""
+        return [Vector(*components) for components in self.components.tolist()]  # noqa: E501
+
+    @property
+    def symbolic(self: Self, /) -> bool:
+        """Check if components are symbolic (object) rather than float64."""
+        return self.components.dtype == object
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self)} '
+                f"{'symbolic' if self.symbolic else 'numeric'} vectors)")
+
+    def __len__(self: Self, /) -> int:
+        """Return number of vectors."""
+        return len(self.components)
+
+    def __getitem__(self: Self, index: int | slice | NDArray, /) -> Vector | Self:  # noqa: E501
+        """Return individual Vector by integer index, else sub-batch."""
+        if isinstance(index, int | np.integer):
+            return Vector(*self.components[index].tolist())
+
+        return type(self)(self.components[index])
+
+    def __iter__(self: Self, /) -> Iterator[Vector]:
+        """Iterate through individual Vectors."""
+        return iter(self.to_vectors())
+
+    def _operand(self: Self, other: VectorBatch | Vector | ArrayLike, /) -> NDArray:  # noqa: E501
+        """Return other vector(s) as array broadcastable against batch.
+
+        Against symbolic batches, exact numeric components are kept as such.
+        """
+        if isinstance(other, VectorBatch):
+            return other.components
+
+        if isinstance(other, Vector):
+            other: tuple[Any, ...] = other.x, other.y, other.z
+
+        return (np.asarray(other, dtype=object)
+                if self.symbolic
+                else _array(other))
+
+    def __add__(self: Self, other: VectorBatch | Vector | ArrayLike, /) -> Self:  # noqa: E501
+        """Add vector(s)."""
+        return type(self)(self.components + self._operand(other))
+
+    def __sub__(self: Self, other: VectorBatch | Vector | ArrayLike, /) -> Self:  # noqa: E501
+        """Subtract vector(s)."""
+        return type(self)(self.components - self._operand(other))
+
+    def __mul__(self: Self, factors: ArrayLike, /) -> Self:
+        """Scale by factor(s), one per vector if array."""
+        factors: NDArray = _array(factors)
+        return type(self)(self.components *
+                          (factors[:, np.newaxis] if factors.ndim else factors))  # noqa: E501
+
+    __rmul__ = __mul__
+
+    def __neg__(self: Self, /) -> Self:
+        """Return opposite vectors."""
+        return type(self)(-self.components)
+
+    def dot(self: Self, other: VectorBatch | Vector | ArrayLike, /) -> NDArray:  # noqa: E501
+        """Return row-wise dot products."""
+        return (self.components * self._operand(other)).sum(axis=1)
+
+    def cross(self: Self, other: VectorBatch | Vector | ArrayLike, /) -> Self:  # noqa: E501
+        """Return row-wise cross products."""
+        a, b = np.broadcast_arrays(self.components, self._operand(other))
+        return type(self)(np.stack((a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
+                                    a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
+                                    a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]),
+                                   axis=1))
+
+    def norm(self: Self, /) -> NDArray:
+        """Return lengths/magnitudes/moduli."""
+        return self.dot(self) ** .5
+
+    def unit(self: Self, /) -> Self:
+        """Return unit vectors."""
+        return type(self)(self.components / self.norm()[:, np.newaxis])
+
+    def project(self: Self, onto: VectorBatch | Vector | ArrayLike, /) -> Self:  # noqa: E501
+        """Return orthogonal projections onto other vector(s)."""
+        onto: NDArray = np.broadcast_to(self._operand(onto),
+                                        self.components.shape)
+        return type(self)(onto * ((self.components * onto).sum(axis=1) /
+                                  (onto * onto).sum(axis=1))[:, np.newaxis])
+
+    def angle(self: Self, other: VectorBatch | Vector | ArrayLike, /) -> NDArray:  # noqa: E501
+        """Return row-wise angles (in radians) with other vector(s)."""
+        other: VectorBatch = type(self)(np.broadcast_to(self._operand(other),
+                                                        self.components.shape))  # noqa: E501
+        cosines: NDArray = self.dot(other) / (self.norm() * other.norm())
+
+        if cosines.dtype == object:
+            return _symbolic_acos(cosines)
+
+        # clip rounding errors beyond [-1, 1]
+        return np.arccos(np.clip(cosines, -1, 1))
@@ -0,0 +1,128 @@
+"""Persistent (On-Disk) Cache keyed by Source File Modification Times."""
+
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+from pathlib import Path
+import sys
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Any, LiteralString, Self
+
+
+__all__: Sequence[LiteralString] = ('CACHE_DIR_ENV_VAR', 'cache_dir',
+                                    'source_mtimes',
+                                    'PersistentCache')
+
+
+CACHE_DIR_ENV_VAR: LiteralString = 'ART_OF_GEOMETRY_CACHE_DIR'
+
+_SOURCES_KEY: LiteralString = 'sources'
+_VALUE_KEY: LiteralString = 'value'
+
+
+def cache_dir() -> Path:
+    """Return cache directory."""
+    if d := os.environ.get(CACHE_DIR_ENV_VAR):
+        return Path(d)
+
+    return (Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') /
+            'Art-of-Geometry')
+
+
+def source_mtimes(module_names: Iterable[str], /) -> dict[str, int] | None:
+    """Return modification times of modules' source files.
+
+    Return None if any module has no source file, in which case there is
+    nothing to invalidate cached values against.
+    """
+    mtimes: dict[str, int] = {}
+
+    for module_name in module_names:
+        if not (file := getattr(sys.modules.get(module_name), '__file__', None)):  # noqa: E501
+            return None
+
+        try:
+            mtimes[file] = os.stat(file).st_mtime_ns
+
+        except OSError:
+            return None
+
+    return mtimes
+
+
+class PersistentCache:
+    """JSON-Serializable Cache persisted on disk at interpreter exit.
+
+    Each cached value is stored together with the modification times of the
+    source files it was derived from, and is discarded once any of those
+    source files changes.
+    """
+
+    def __init__(self: Self, name: str, /) -> None:
+        """Initialize persistent cache."""
+        self.path: Path = cache_dir() / (f'{name}-py{sys.version_info.major}'
+                                         f'{sys.version_info.minor}.json')
+
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty: bool = False
+        self._lock: Lock = Lock()
+
+        atexit.register(self.save)
+
+    def _load(self: Self, /) -> dict[str, dict[str, Any]]:
+        """Load entries from disk, once."""
+        if self._entries is None:
+            try:
+                with self.path.open(encoding='utf-8') as f:
+                    self._entries = json.load(f)
+
+            except (OSError, ValueError):
+                self._entries = {}
+
+        return self._entries
+
+    def get(self: Self, key: str, sources: dict[str, int], /) -> Any:
+        """Return cached value if still valid, else None."""
+        with self._lock:
+            if (((entry := self._load().get(key)) is not None) and
+                    (entry[_SOURCES_KEY] == sources)):
+                return entry[_VALUE_KEY]
+
+        return None
+
+    def set(self: Self, key: str, sources: dict[str, int], value: Any, /) -> None:  # noqa: E501
+        """Cache value."""
+        with self._lock:
+            self._load()[key] = {_SOURCES_KEY: sources, _VALUE_KEY: value}
+            self._dirty = True
+
+    def save(self: Self, /) -> None:
+        """Persist entries to disk if changed, ignoring unwritable locations."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+
+                # write atomically, never exposing partially-written files
+                with NamedTemporaryFile(mode='w', encoding='utf-8',
+                                        dir=self.path.parent,
+                                        suffix='.tmp',
+                                        delete=False) as f:
+                    json.dump(self._entries, f)
+
+                os.replace(f.name, self.path)
+
+            except OSError:
+                return
+
+            self._dirty = False
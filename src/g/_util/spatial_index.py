@@ -0,0 +1,438 @@
+"""Spatial Index.
+
+KD-tree over keyed points' numeric coordinates, supporting k-nearest, radius &
+bounding-box queries.
+
+The tree is built once over a snapshot of points, stored as an implicit
+balanced tree (median splits over a permuted contiguous coordinates array).
+Inserts go to a small buffer scanned by brute force, and deletes mark tree
+entries dead; the tree is lazily rebuilt once these outgrow a fraction of it.
+
+Batch queries traverse the tree for all query points together, level by
+level, with array operations.
+"""
+
+
+from __future__ import annotations
+
+import heapq
+from threading import RLock
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Sequence
+    from typing import LiteralString, Self
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('SpatialIndex',)
+
+
+_LEAF_SIZE: int = 16
+
+# rebuild once buffered inserts & dead entries exceed this fraction of tree
+_REBUILD_FRACTION: float = .25
+_MIN_REBUILD_THRESHOLD: int = 64
+
+
+class SpatialIndex:
+    """KD-Tree Spatial Index of Keyed Points."""
+
+    def __init__(self: Self, n_dims: int, /,
+                 items: Iterable[tuple[Hashable, ArrayLike]] = ()) -> None:
+        """Initialize spatial index of n-dimensional points."""
+        assert isinstance(n_dims, int) and n_dims > 0, \
+            ValueError(f'*** NUMBER OF DIMENSIONS {n_dims} NOT POSITIVE INT ***')  # noqa: E501
+
+        self.n_dims: int = n_dims
+
+        # tree entries, permuted so that each node spans a contiguous range
+        self._keys: list[Hashable] = []
+        self._coords: NDArray[np.float64] = np.empty((0, n_dims))
+        self._alive: NDArray[np.bool_] = np.empty(0, dtype=bool)
+        self._positions: dict[Hashable, int] = {}
+        self._n_dead: int = 0
+
+        # points inserted since last (re)build
+        self._buffer: dict[Hashable, NDArray[np.float64]] = {}
+
+        self._lock: RLock = RLock()
+
+        for key, coords in items:
+            self._buffer[key] = self._point(coords)
+
+        self._rebuild()
+
+    def _point(self: Self, coords: ArrayLike, /) -> NDArray[np.float64]:
+        point: NDArray[np.float64] = np.asarray(coords, dtype=np.float64)
+
+        assert point.shape == (self.n_dims,), \
+            ValueError(f'*** COORDINATES {coords} NOT {self.n_dims}-DIMENSIONAL ***')  # noqa: E501
+
+        return point
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({self.n_dims}D, {len(self)} points)'
+
+    def __len__(self: Self, /) -> int:
+        """Return number of indexed points."""
+        return len(self._positions) + len(self._buffer)
+
+    def __contains__(self: Self, key: Hashable, /) -> bool:
+        """Check if key is indexed."""
+        return (key in self._buffer) or (key in self._positions)
+
+    # BUILDING & UPDATING
+    # ===================
+
+    def _rebuild(self: Self, /) -> None:
+        """(Re)build tree over all live points."""
+        keys: list[Hashable] = [*self._positions, *self._buffer]
+        coords: NDArray[np.float64] = np.concatenate(
+            (self._coords[list(self._positions.values())],
+             np.reshape(list(self._buffer.values()), (-1, self.n_dims))))
+
+        perm: NDArray[np.intp] = np.arange(len(keys))
+        self._partition(coords, perm, 0, len(keys), 0)
+
+        self._keys: list[Hashable] = [keys[i] for i in perm]
+        self._coords: NDArray[np.float64] = np.ascontiguousarray(coords[perm])
+        self._alive: NDArray[np.bool_] = np.ones(len(keys), dtype=bool)
+        self._positions: dict[Hashable, int] = {key: i for i, key in enumerate(self._keys)}  # noqa: E501
+        self._n_dead: int = 0
+        self._buffer.clear()
+
+    def _partition(self: Self, coords: NDArray[np.float64], perm: NDArray[np.intp],  # noqa: E501
+                   lo: int, hi: int, depth: int, /) -> None:
+        """Recursively order range around medians, alternating axes."""
+        while hi - lo > _LEAF_SIZE:
+            mid: int = (lo + hi) // 2
+            axis: int = depth % self.n_dims
+
+            sub: NDArray[np.intp] = perm[lo:hi]
+            perm[lo:hi] = sub[np.argpartition(coords[sub, axis], mid - lo)]
+
+            self._partition(coords, perm, lo, mid, depth + 1)
+            lo, depth = mid + 1, depth + 1
+
+    def _maybe_rebuild(self: Self, /) -> None:
+        if (len(self._buffer) + self._n_dead) > \
+                max(_MIN_REBUILD_THRESHOLD, _REBUILD_FRACTION * len(self._keys)):  # noqa: E501
+            self._rebuild()
+
+    def insert(self: Self, key: Hashable, coords: ArrayLike, /) -> None:
+        """Index (or re-index) point by key."""
+        point: NDArray[np.float64] = self._point(coords)
+
+        with self._lock:
+            self.remove(key)
+            self._buffer[key] = point
+            self._maybe_rebuild()
+
+    def remove(self: Self, key: Hashable, /) -> None:
+        """Un-index point by key, if indexed."""
+        with self._lock:
+            if self._buffer.pop(key, None) is None and \
+                    (i := self._positions.pop(key, None)) is not None:
+                self._alive[i] = False
+                self._n_dead += 1
+
+    # QUERYING
+    # ========
+
+    def nearest(self: Self, point: ArrayLike, /, k: int = 1) -> list[tuple[Hashable, float]]:  # noqa: E501
+        """Return k nearest (key, distance) pairs, nearest first."""
+        q: NDArray[np.float64] = self._point(point)
+
+        with self._lock:
+            self._maybe_rebuild()
+
+            # max-heap of k best (negated squared distance, position) so far
+            best: list[tuple[float, int]] = []
+
+            coords: NDArray[np.float64] = self._coords
+            alive: NDArray[np.bool_] = self._alive
+
+            def visit(lo: int, hi: int, depth: int) -> None:
+                if hi - lo <= _LEAF_SIZE:
+                    d2s: NDArray[np.float64] = ((coords[lo:hi] - q) ** 2).sum(axis=1)  # noqa: E501
+
+                    for i in np.flatnonzero(alive[lo:hi]).tolist():
+                        if len(best) < k:
+                            heapq.heappush(best, (-d2s[i], lo + i))
+                        elif d2s[i] < -best[0][0]:
+                            heapq.heapreplace(best, (-d2s[i], lo + i))
+
+                    return
+
+                mid: int = (lo + hi) // 2
+                axis: int = depth % self.n_dims
+                diff: float = q[axis] - coords[mid, axis]
+
+                near, far = (((lo, mid), (mid + 1, hi))
+                             if diff < 0
+                             else ((mid + 1, hi), (lo, mid)))
+
+                visit(*near, depth + 1)
+
+                if alive[mid]:
+                    d2: float = float(((coords[mid] - q) ** 2).sum())
+
+                    if len(best) < k:
+                        heapq.heappush(best, (-d2, mid))
+                    elif d2 < -best[0][0]:
+                        heapq.heapreplace(best, (-d2, mid))
+
+                if len(best) < k or diff * diff < -best[0][0]:
+                    visit(*far, depth + 1)
+
+            visit(0, len(coords), 0)
+
+            results: list[tuple[float, Hashable]] = [(-neg_d2, self._keys[i])
+                                                     for neg_d2, i in best]
+
+            # brute-force scan of buffered points
+            results.extend((float(((c - q) ** 2).sum()), key)
+                           for key, c in self._buffer.items())
+
+        return [(key, float(np.sqrt(d2)))
+                for d2, key in heapq.nsmallest(k, results, key=lambda i: i[0])]  # noqa: E501
+
+    def within_radius(self: Self, point: ArrayLike, radius: float, /) -> list[Hashable]:  # noqa: E501
+        """Return keys of points within (inclusive) radius."""
+        q: NDArray[np.float64] = self._point(point)
+        r2: float = radius * radius
+
+        with self._lock:
+            self._maybe_rebuild()
+
+            coords: NDArray[np.float64] = self._coords
+            alive: NDArray[np.bool_] = self._alive
+            positions: list[int] = []
+
+            def visit(lo: int, hi: int, depth: int) -> None:
+                if hi - lo <= _LEAF_SIZE:
+                    positions.extend((lo + np.flatnonzero(
+                        alive[lo:hi] &
+                        (((coords[lo:hi] - q) ** 2).sum(axis=1) <= r2))).tolist())  # noqa: E501
+                    return
+
+                mid: int = (lo + hi) // 2
+                axis: int = depth % self.n_dims
+                diff: float = q[axis] - coords[mid, axis]
+
+                if alive[mid] and ((coords[mid] - q) ** 2).sum() <= r2:
+                    positions.append(mid)
+
+                if diff <= radius:
+                    visit(lo, mid, depth + 1)
+
+                if diff >= -radius:
+                    visit(mid + 1, hi, depth + 1)
+
+            visit(0, len(coords), 0)
+
+            return ([self._keys[i] for i in positions] +
+                    [key
+                     for key, c in self._buffer.items()
+                     if ((c - q) ** 2).sum() <= r2])
+
+    def within_box(self: Self, lo_corner: ArrayLike, hi_corner: ArrayLike, /) -> list[Hashable]:  # noqa: E501
+        """Return keys of points within (inclusive) axis-aligned box."""
+        box_lo: NDArray[np.float64] = self._point(lo_corner)
+        box_hi: NDArray[np.float64] = self._point(hi_corner)
+
+        with self._lock:
+            self._maybe_rebuild()
+
+            coords: NDArray[np.float64] = self._coords
+            alive: NDArray[np.bool_] = self._alive
+            positions: list[int] = []
+
+            def inside(c: NDArray[np.float64]) -> NDArray[np.bool_]:
+                return ((c >= box_lo) & (c <= box_hi)).all(axis=-1)
+
+            def visit(lo: int, hi: int, depth: int) -> None:
+                if hi - lo <= _LEAF_SIZE:
+                    positions.extend((lo + np.flatnonzero(
+                        alive[lo:hi] & inside(coords[lo:hi]))).tolist())
+                    return
+
+                mid: int = (lo + hi) // 2
+                axis: int = depth % self.n_dims
+                split: float = coords[mid, axis]
+
+                if alive[mid] and inside(coords[mid]):
+                    positions.append(mid)
+
+                if box_lo[axis] <= split:
+                    visit(lo, mid, depth + 1)
+
+                if box_hi[axis] >= split:
+                    visit(mid + 1, hi, depth + 1)
+
+            visit(0, len(coords), 0)
+
+            return ([self._keys[i] for i in positions] +
+                    [key
+                     for key, c in self._buffer.items()
+                     if inside(c)])
+
+    # BATCH QUERYING
+    # ==============
+    # Many query points descend the tree together, level by level, as arrays
+    # of (query point, tree range) pairs, so that each level takes a few array
+    # operations over all query points rather than Python calls per point.
+
+    def _points(self: Self, points: ArrayLike, /) -> NDArray[np.float64]:
+        qs: NDArray[np.float64] = np.asarray(points, dtype=np.float64)
+
+        assert qs.ndim == 2 and qs.shape[1] == self.n_dims, \
+            ValueError(f'*** QUERY POINTS OF SHAPE {qs.shape} '
+                       f'NOT OF SHAPE (n, {self.n_dims}) ***')
+
+        return qs
+
+    def _range_d2s(self: Self, qs: NDArray[np.float64], lo: NDArray[np.intp], hi: NDArray[np.intp], /) \
+            -> tuple[NDArray[np.intp], NDArray[np.float64]]:  # noqa: E501
+        """Return positions & squared distances of tree ranges' entries.
+
+        Ranges are padded to the same width; padding & dead entries are at
+        infinite squared distances.
+        """
+        positions: NDArray[np.intp] = lo[:, np.newaxis] + np.arange((hi - lo).max(initial=0))  # noqa: E501
+        valid: NDArray[np.bool_] = positions < hi[:, np.newaxis]
+        positions: NDArray[np.intp] = np.minimum(positions, len(self._coords) - 1)  # noqa: E501
+
+        d2s: NDArray[np.float64] = ((qs[:, np.newaxis] - self._coords[positions]) ** 2).sum(axis=-1)  # noqa: E501
+        d2s[~(valid & self._alive[positions])] = np.inf
+
+        return positions, d2s
+
+    def _within_radii(self: Self, qs: NDArray[np.float64], r2s: NDArray[np.float64], /) \
+            -> tuple[NDArray[np.intp], list[Hashable], NDArray[np.float64]]:  # noqa: E501
+        """Return (query IDs, keys, squared distances) of points within radii.
+
+        Squared radii are given by query point; pairs are sorted by query ID,
+        then by squared distance.
+        """
+        coords: NDArray[np.float64] = self._coords
+        alive: NDArray[np.bool_] = self._alive
+
+        found: list[tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.float64]]] = []  # noqa: E501
+
+        def find(q_ids: NDArray[np.intp], positions: NDArray[np.intp], d2s: NDArray[np.float64], /) -> None:  # noqa: E501
+            # padding & dead entries are excluded, even within infinite radii
+            hits: NDArray[np.bool_] = (d2s <= r2s[q_ids]) & (d2s < np.inf)
+            found.append((q_ids[hits], positions[hits], d2s[hits]))
+
+        # frontier of (query point, tree range) pairs, all at same depth
+        q_ids: NDArray[np.intp] = np.arange(len(qs) if len(coords) else 0)
+        lo: NDArray[np.intp] = np.zeros(len(q_ids), dtype=np.intp)
+        hi: NDArray[np.intp] = np.full(len(q_ids), len(coords))
+        depth: int = 0
+
+        while len(q_ids):
+            if (leaves := hi - lo <= _LEAF_SIZE).any():
+                positions, d2s = self._range_d2s(qs[q_ids[leaves]], lo[leaves], hi[leaves])  # noqa: E501
+                find(np.broadcast_to(q_ids[leaves, np.newaxis], d2s.shape), positions, d2s)  # noqa: E501
+
+                q_ids, lo, hi = q_ids[~leaves], lo[~leaves], hi[~leaves]
+
+            mid: NDArray[np.intp] = (lo + hi) // 2
+            axis: int = depth % self.n_dims
+
+            d2s: NDArray[np.float64] = ((qs[q_ids] - coords[mid]) ** 2).sum(axis=-1)  # noqa: E501
+            find(q_ids, mid, np.where(alive[mid], d2s, np.inf))
+
+            # visit sides containing query points or within their radii
+            diffs: NDArray[np.float64] = qs[q_ids, axis] - coords[mid, axis]
+            reached: NDArray[np.bool_] = diffs ** 2 <= r2s[q_ids]
+            left: NDArray[np.bool_] = (diffs <= 0) | reached
+            right: NDArray[np.bool_] = (diffs >= 0) | reached
+
+            q_ids = np.concatenate((q_ids[left], q_ids[right]))
+            lo, hi = (np.concatenate((lo[left], mid[right] + 1)),
+                      np.concatenate((mid[left], hi[right])))
+            depth += 1
+
+        # brute-force scan of buffered points
+        if self._buffer:
+            buffer_coords: NDArray[np.float64] = np.reshape(list(self._buffer.values()), (-1, self.n_dims))  # noqa: E501
+            d2s: NDArray[np.float64] = ((qs[:, np.newaxis] - buffer_coords) ** 2).sum(axis=-1)  # noqa: E501
+
+            q_ids, positions = np.indices(d2s.shape)
+            find(q_ids, len(coords) + positions, d2s)
+
+        q_ids, positions, d2s = (np.concatenate(arrays) for arrays in zip(
+            (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0)),  # noqa: E501
+            *found))
+
+        order: NDArray[np.intp] = np.lexsort((d2s, q_ids))
+        keys: list[Hashable] = self._keys + list(self._buffer)
+
+        return (q_ids[order],
+                [keys[i] for i in positions[order].tolist()],
+                d2s[order])
+
+    def _kth_nearest_d2_bounds(self: Self, qs: NDArray[np.float64], k: int, /) -> NDArray[np.float64]:  # noqa: E501
+        """Return upper bounds of query points' k-th nearest squared distances.
+
+        Each query point descends to a tree range of more than max(k, leaf
+        size) entries around it, whose k-th nearest live entry bounds its
+        k-th nearest distance; bounds are infinite if there are fewer than k.
+        """
+        lo: NDArray[np.intp] = np.zeros(len(qs), dtype=np.intp)
+        hi: NDArray[np.intp] = np.full(len(qs), len(self._coords))
+        min_size: int = max(k, _LEAF_SIZE)
+        depth: int = 0
+
+        while (descending := (hi - lo) // 2 > min_size).any():
+            mid: NDArray[np.intp] = (lo + hi) // 2
+            axis: int = depth % self.n_dims
+
+            to_left: NDArray[np.bool_] = qs[:, axis] < self._coords[mid, axis]
+
+            lo = np.where(descending & ~to_left, mid + 1, lo)
+            hi = np.where(descending & to_left, mid, hi)
+            depth += 1
+
+        _, d2s = self._range_d2s(qs, lo, hi)
+
+        if d2s.shape[1] < k:
+            return np.full(len(qs), np.inf)
+
+        return np.partition(d2s, k - 1, axis=1)[:, k - 1]
+
+    def nearest_batch(self: Self, points: ArrayLike, /, k: int = 1) -> list[list[tuple[Hashable, float]]]:  # noqa: E501
+        """Return k nearest (key, distance) pairs for each of many points."""
+        qs: NDArray[np.float64] = self._points(points)
+
+        with self._lock:
+            self._maybe_rebuild()
+
+            # candidates within bounds of k-th nearest distances
+            q_ids, keys, d2s = self._within_radii(qs, self._kth_nearest_d2_bounds(qs, k))  # noqa: E501
+
+        distances: list[float] = np.sqrt(d2s).tolist()
+        bounds: list[int] = np.searchsorted(q_ids, np.arange(len(qs) + 1)).tolist()  # noqa: E501
+
+        return [list(zip(keys[start:min(start + k, stop)],
+                         distances[start:min(start + k, stop)]))
+                for start, stop in zip(bounds, bounds[1:])]
+
+    def within_radius_batch(self: Self, points: ArrayLike, radius: float, /) -> list[list[Hashable]]:  # noqa: E501
+        """Return keys of points within radius of each of many points."""
+        qs: NDArray[np.float64] = self._points(points)
+
+        with self._lock:
+            self._maybe_rebuild()
+            q_ids, keys, _ = self._within_radii(qs, np.full(len(qs), radius * radius))  # noqa: E501
+
+        bounds: list[int] = np.searchsorted(q_ids, np.arange(len(qs) + 1)).tolist()  # noqa: E501
+
+        return [keys[start:stop] for start, stop in zip(bounds, bounds[1:])]
@@ -1,16 +1,20 @@
 """Unique Name Utilities."""
 
 
-from collections.abc import Sequence
+from collections.abc import Callable, Container, Sequence
+from functools import partial
 import os
 from tempfile import NamedTemporaryFile
-from typing import LiteralString
+from threading import Lock
+from typing import LiteralString, Self
 from uuid import uuid4
 
 from .type import CallableReturningStr
 
 
-__all__: Sequence[LiteralString] = 'tmp_file_name', 'str_uuid', 'UNIQUE_NAME_FACTORY'  # noqa: E501
+__all__: Sequence[LiteralString] = ('tmp_file_name', 'str_uuid',
+                                    'UniqueNameFactory',
+                                    'UNIQUE_NAME_FACTORY')
 
 
 def tmp_file_name() -> str:
@@ -32,4 +36,74 @@ def str_uuid() -> str:
     return str(uuid4())
 
 
-UNIQUE_NAME_FACTORY: CallableReturningStr = tmp_file_name
+_DEFAULT_PREFIX: LiteralString = '_'
+
+
+class UniqueNameFactory:
+    """In-Memory, Thread-Safe Unique Name Factory.
+
+    Names are generated as `<prefix><n>`, with one monotonic counter per
+    prefix namespace. Names already taken in any of the watched containers
+    (e.g., a Session's entities collection) are skipped.
+    """
+
+    def __init__(self: Self, prefix: str = _DEFAULT_PREFIX, /) -> None:
+        """Initialize unique name factory."""
+        assert isinstance(prefix, str) and prefix, \
+            TypeError(f'*** PREFIX {prefix} NOT NON-EMPTY STRING ***')
+
+        self.prefix: str = prefix
+
+        # monotonic counters by prefix namespace
+        self._counters: dict[str, int] = dict[str, int]()
+
+        # containers of names already taken
+        self._taken_name_containers: list[Container[str]] = \
+            list[Container[str]]()
+
+        self._lock: Lock = Lock()
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.prefix!r}, '
+                f'namespaces={sorted(self._counters)})')
+
+    def watch(self: Self, taken_names: Container[str], /) -> None:
+        """Skip names already taken in given container."""
+        with self._lock:
+            self._taken_name_containers.append(taken_names)
+
+    def _taken(self: Self, name: str, /) -> bool:
+        """Check if name already taken."""
+        return any(name in taken_names
+                   for taken_names in self._taken_name_containers)
+
+    def __call__(self: Self, prefix: str | None = None, /) -> str:
+        """Return new unique name within prefix namespace."""
+        if prefix is None:
+            prefix: str = self.prefix
+
+        with self._lock:
+            n: int = self._counters.get(prefix, 0)
+
+            # skip names colliding with those already taken
+            while self._taken(name := f'{prefix}{n}'):
+                n += 1
+
+            self._counters[prefix] = n + 1
+
+        return name
+
+    def namespace(self: Self, prefix: str, /) -> CallableReturningStr:
+        """Return name factory for prefix namespace."""
+        assert isinstance(prefix, str) and prefix, \
+            TypeError(f'*** PREFIX {prefix} NOT NON-EMPTY STRING ***')
+
+        return partial(self, prefix)
+
+    def count(self: Self, prefix: str | None = None, /) -> int:
+        """Return next counter value within prefix namespace."""
+        return self._counters.get(self.prefix if prefix is None else prefix, 0)
+
+
+UNIQUE_NAME_FACTORY: Callable[..., str] = UniqueNameFactory()
@@ -0,0 +1,127 @@
+"""Abstract Array-backed Point Cloud.
+
+Point Clouds hold many points' coordinates in one contiguous float64 array of
+shape (number of points, number of dimensions), rather than as individual
+point entities each carrying a name, dependencies & session state. Individual
+(Euclidean concrete) points are only created upon access by index or upon
+iteration.
+"""
+
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from g._core.point import EuclidConcretePoint
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import Any, LiteralString, Self
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('_PointCloudABC',)
+
+
+class _PointCloudABC(ABC):
+    """Abstract Array-backed Point Cloud."""
+
+    _N_DIMS: int
+
+    __slots__: Sequence[LiteralString] = ('coords',)
+
+    def __init__(self: Self, coords: ArrayLike, /) -> None:
+        """Initialize point cloud from (n, d)-shaped coordinates."""
+        coords: NDArray[np.float64] = np.ascontiguousarray(coords, dtype=np.float64)  # noqa: E501
+
+        if coords.size == 0:
+            coords: NDArray[np.float64] = coords.reshape(0, self._N_DIMS)
+
+        assert coords.ndim == 2 and coords.shape[1] == self._N_DIMS, \
+            ValueError(f'*** COORDINATES OF SHAPE {coords.shape} '
+                       f'NOT OF SHAPE (n, {self._N_DIMS}) ***')
+
+        self.coords: NDArray[np.float64] = coords
+
+    @classmethod
+    def from_points(cls: type[Self], points: Iterable[Any], /) -> Self:
+        """Create point cloud from points with numeric coordinates."""
+        return cls(np.fromiter((c
+                                for point in points
+                                for c in cls._point_coords(point)),
+                               dtype=np.float64).reshape(-1, cls._N_DIMS))
+
+    @staticmethod
+    @abstractmethod
+    def _point_coords(point: Any, /) -> tuple[Any, ...]:
+        """Return coordinates of individual point."""
+        raise NotImplementedError
+
+    def _point(self: Self, coords: NDArray[np.float64], /) -> EuclidConcretePoint:  # noqa: E501
+        """Create individual point of given coordinates."""
+        return EuclidConcretePoint(*coords.tolist())
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({len(self)} points)'
+
+    def __len__(self: Self, /) -> int:
+        """Return number of points."""
+        return len(self.coords)
+
+    def __getitem__(self: Self, index: int | slice | NDArray, /) -> Any:
+        """Return individual point by integer index, else sub-cloud."""
+        if isinstance(index, int | np.integer):
+            return self._point(self.coords[index])
+
+        return type(self)(self.coords[index])
+
+    def __iter__(self: Self, /) -> Iterator[Any]:
+        """Iterate through individual points, created one at a time."""
+        for coords in self.coords:
+            yield self._point(coords)
+
+    @property
+    def nbytes(self: Self, /) -> int:
+        """Return memory size of coordinates."""
+        return self.coords.nbytes
+
+    def translate(self: Self, vector: ArrayLike, /) -> Self:
+        """Return point cloud translated by vector."""
+        return type(self)(self.coords + np.asarray(vector, dtype=np.float64))  # noqa: E501
+
+    def __add__(self: Self, vector: ArrayLike, /) -> Self:
+        """Translate by vector."""
+        return self.translate(vector)
+
+    def __sub__(self: Self, vector: ArrayLike, /) -> Self:
+        """Translate by opposite vector."""
+        return self.translate(-np.asarray(vector, dtype=np.float64))
+
+    def distances(self: Self, point: ArrayLike, /) -> NDArray[np.float64]:
+        """Return Euclidean distances of all points to given point."""
+        diffs: NDArray[np.float64] = self.coords - np.asarray(point, dtype=np.float64)  # noqa: E501
+        return np.sqrt(np.einsum('ij,ij->i', diffs, diffs))
+
+    @property
+    def centroid(self: Self, /) -> NDArray[np.float64]:
+        """Return centroid coordinates, NaNs if empty."""
+        if not len(self):
+            return np.full(self._N_DIMS, np.nan)
+
+        return self.coords.mean(axis=0)
+
+    @property
+    def bounding_box(self: Self, /) -> tuple[NDArray[np.float64], NDArray[np.float64]]:  # noqa: E501
+        """Return minimum & maximum corners' coordinates.
+
+        Empty point clouds have empty bounding boxes, from +inf to -inf.
+        """
+        if not len(self):
+            return np.full(self._N_DIMS, np.inf), np.full(self._N_DIMS, -np.inf)  # noqa: E501
+
+        return self.coords.min(axis=0), self.coords.max(axis=0)
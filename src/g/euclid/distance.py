@@ -0,0 +1,169 @@
+"""Batch Pairwise Euclidean Distances between Points in R1, R2 or R3.
+
+Distance matrices are computed block by block, so that temporaries stay
+bounded regardless of numbers of points; blocks can also be streamed, or
+written into a caller-provided (e.g., memory-mapped) output matrix, for
+matrices too large to hold in memory.
+
+Numeric coordinates are processed as float64 arrays, while coordinates
+involving Variables fall back to vectorized symbolic (object) arrays.
+"""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.functions.elementary.miscellaneous import sqrt
+
+from ._abc._point_cloud import _PointCloudABC
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import Any, LiteralString
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('DEFAULT_BLOCK_SIZE',
+                                    'pairwise_distance_blocks',
+                                    'pairwise_distances')
+
+
+# 1024 x 1024 float64 blocks take 8 MiB
+DEFAULT_BLOCK_SIZE: int = 1024
+
+_AXES: tuple[str, ...] = ('x', 'y', 'z')
+
+_symbolic_sqrt: np.ufunc = np.frompyfunc(sqrt, 1, 1)
+
+
+def _coords(points: Iterable[Any] | ArrayLike | _PointCloudABC, /) -> NDArray:
+    """Return (n, d)-shaped coordinates, float64 if numeric, else objects."""
+    if isinstance(points, _PointCloudABC):
+        return points.coords
+
+    if isinstance(points, np.ndarray):
+        coords: NDArray = points
+
+    else:
+        points: list[Any] = list(points)
+
+        if points and hasattr(points[0], _AXES[0]):
+            axes: tuple[str, ...] = tuple(axis
+                                          for axis in _AXES
+                                          if hasattr(points[0], axis))
+            points: list[tuple[Any, ...]] = [tuple(getattr(point, axis)
+                                                   for axis in axes)
+                                             for point in points]
+
+        try:
+            coords: NDArray = np.asarray(points, dtype=np.float64)
+
+        except (TypeError, ValueError):
+            coords: NDArray = np.asarray(points, dtype=object)
+
+    if coords.ndim == 1:
+        coords: NDArray = coords.reshape(-1, 1)
+
+    assert coords.ndim == 2 and coords.shape[1] <= len(_AXES), \
+        ValueError(f'*** COORDINATES OF SHAPE {coords.shape} '
+                   f'NOT OF SHAPE (n, 1|2|3) ***')
+
+    return coords
+
+
+def _numeric_block(a: NDArray[np.float64], b: NDArray[np.float64],
+                   a_sq_norms: NDArray[np.float64], b_sq_norms: NDArray[np.float64],  # noqa: E501
+                   squared: bool, /) -> NDArray[np.float64]:
+    # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b, clipping negative rounding errors
+    block: NDArray[np.float64] = a_sq_norms[:, np.newaxis] + b_sq_norms - 2 * (a @ b.T)  # noqa: E501
+    np.maximum(block, 0, out=block)
+
+    return block if squared else np.sqrt(block, out=block)
+
+
+def _symbolic_block(a: NDArray, b: NDArray, squared: bool, /) -> NDArray:
+    diffs: NDArray = a[:, np.newaxis, :] - b[np.newaxis, :, :]
+    block: NDArray = (diffs * diffs).sum(axis=2)
+
+    return block if squared else _symbolic_sqrt(block)
+
+
+def pairwise_distance_blocks(
+        points_a: Iterable[Any] | ArrayLike | _PointCloudABC,
+        points_b: Iterable[Any] | ArrayLike | _PointCloudABC | None = None,
+        /, *, squared: bool = False,
+        block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[tuple[slice, slice, NDArray]]:  # noqa: E501
+    """Stream (rows, columns, block) of pairwise distance matrix.
+
+    Distances are among points A themselves if points B are not given.
+    """
+    assert isinstance(block_size, int) and block_size > 0, \
+        ValueError(f'*** BLOCK SIZE {block_size} NOT POSITIVE INT ***')
+
+    a: NDArray = _coords(points_a)
+    b: NDArray = a if points_b is None else _coords(points_b)
+
+    assert a.shape[1] == b.shape[1], \
+        ValueError(f'*** POINTS OF DIFFERENT DIMENSIONS {a.shape[1]} '
+                   f'& {b.shape[1]} ***')
+
+    numeric: bool = (a.dtype != object) and (b.dtype != object)
+
+    if numeric:
+        # center coordinates, limiting cancellation errors far from origin
+        if len(a):
+            center: NDArray[np.float64] = a.mean(axis=0)
+            a, b = a - center, b - center
+
+        a_sq_norms: NDArray[np.float64] = np.einsum('ij,ij->i', a, a)
+        b_sq_norms: NDArray[np.float64] = np.einsum('ij,ij->i', b, b)
+
+    for i in range(0, len(a), block_size):
+        rows: slice = slice(i, i + block_size)
+
+        for j in range(0, len(b), block_size):
+            cols: slice = slice(j, j + block_size)
+
+            yield rows, cols, (_numeric_block(a[rows], b[cols],
+                                              a_sq_norms[rows], b_sq_norms[cols],  # noqa: E501
+                                              squared)
+                               if numeric
+                               else _symbolic_block(a[rows], b[cols], squared))  # noqa: E501
+
+
+def pairwise_distances(
+        points_a: Iterable[Any] | ArrayLike | _PointCloudABC,
+        points_b: Iterable[Any] | ArrayLike | _PointCloudABC | None = None,
+        /, *, squared: bool = False,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        out: NDArray | None = None) -> NDArray:
+    """Return pairwise (squared) Euclidean distance matrix.
+
+    Points may be given as sequences of points with x (, y (, z))
+    coordinates, as (n, d)-shaped arrays, or as Point Clouds. Distances are
+    among points A themselves if points B are not given. Large matrices can
+    be written into given output, e.g., a `numpy.memmap`.
+    """
+    a: NDArray = _coords(points_a)
+    b: NDArray = a if points_b is None else _coords(points_b)
+
+    if out is None:
+        out: NDArray = np.empty((len(a), len(b)),
+                                dtype=(object
+                                       if object in (a.dtype, b.dtype)
+                                       else np.float64))
+
+    else:
+        assert out.shape == (len(a), len(b)), \
+            ValueError(f'*** OUTPUT OF SHAPE {out.shape} '
+                       f'NOT OF SHAPE {(len(a), len(b))} ***')
+
+    for rows, cols, block in pairwise_distance_blocks(a, b,
+                                                      squared=squared,
+                                                      block_size=block_size):
+        out[rows, cols] = block
+
+    return out
@@ -0,0 +1,198 @@
+"""Homogeneous Coordinates of Points, Lines & Planes in R2 & R3.
+
+Points in R2 & R3 are represented as (x : y : w) & (x : y : z : w) arrays,
+finite points having w != 0 and points at infinity w = 0 (their other
+coordinates being their directions), so that both share one code path.
+Dually, lines in R2 & planes in R3 are (a : b : c) & (a : b : c : d) arrays
+of their equations' coefficients.
+
+Joins of points & meets of lines/planes are (generalized) cross products,
+vectorized over (..., 3)- or (..., 4)-shaped arrays: the line through 2
+points, the point on 2 lines (at infinity if these are parallel), the plane
+through 3 points & the point on 3 planes never branch on points' kinds.
+
+Numeric coordinates are processed as float64 arrays; coordinates involving
+Variables fall back to symbolic object arrays, decided exactly.
+"""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.core.basic import Basic
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('homogeneous', 'cartesian',
+                                    'at_infinity', 'incident',
+                                    'join', 'meet')
+
+
+_AXES: tuple[str, ...] = ('x', 'y', 'z')
+
+# relative tolerance of numeric incidence checks
+_RTOL: float = 1e-12
+
+
+def _array(values: ArrayLike, /) -> NDArray:
+    """Return float64 array if values are all numeric, else object one."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+
+    except (TypeError, ValueError):
+        return np.asarray(values, dtype=object)
+
+
+def _homogeneous_coords(point: Any, n_dims: int, /) -> tuple[Any, ...]:
+    # points (at infinity) knowing their own homogeneous coordinates,
+    # possibly in R3 for points in R2 (e.g., Euclid Points with 0 z's)
+    if (coords := getattr(point, 'homogeneous', None)) is not None:
+        return (*coords[:n_dims], coords[-1])
+
+    return (*(getattr(point, axis) for axis in _AXES[:n_dims]), 1)
+
+
+def homogeneous(points: Any, /, n_dims: int = 2) -> NDArray:
+    """Return (..., n_dims + 1)-shaped homogeneous coordinates of points.
+
+    Points may be points or points at infinity (in any mix), sequences
+    thereof, or arrays of Cartesian (..., n_dims)-shaped coordinates, whose
+    points are then all finite.
+    """
+    assert n_dims in (2, 3), \
+        ValueError(f'*** NUMBER OF DIMENSIONS {n_dims} NEITHER 2 NOR 3 ***')
+
+    if hasattr(points, _AXES[0]) or hasattr(points, 'homogeneous'):
+        return _array(_homogeneous_coords(points, n_dims))
+
+    if not isinstance(points, np.ndarray):
+        points: list[Any] = list(points)
+
+        if points and (hasattr(points[0], _AXES[0]) or hasattr(points[0], 'homogeneous')):  # noqa: E501
+            return _array([_homogeneous_coords(point, n_dims)
+                           for point in points]).reshape(-1, n_dims + 1)
+
+    coords: NDArray = _array(points)
+
+    assert coords.ndim and coords.shape[-1] == n_dims, \
+        ValueError(f'*** CARTESIAN COORDINATES OF SHAPE {coords.shape} '
+                   f'NOT OF SHAPE (..., {n_dims}) ***')
+
+    return np.concatenate((coords, np.ones_like(coords[..., :1])), axis=-1)
+
+
+def _is_zero(value: Any, /) -> bool:
+    if isinstance(value, Basic):
+        return value.expand().is_zero is True
+
+    return value == 0
+
+
+_symbolic_is_zero: np.ufunc = np.frompyfunc(_is_zero, 1, 1)
+
+
+def at_infinity(coords: ArrayLike, /) -> NDArray[np.bool_]:
+    """Check which homogeneous points are at infinity, i.e., have w = 0."""
+    coords: NDArray = _array(coords)
+
+    if coords.dtype == object:
+        return np.asarray(_symbolic_is_zero(coords[..., -1]), dtype=bool)
+
+    return coords[..., -1] == 0
+
+
+def cartesian(coords: ArrayLike, /) -> NDArray:
+    """Return Cartesian coordinates of homogeneous points.
+
+    Coordinates of points at infinity are NaN (numeric) or None (symbolic).
+    """
+    coords: NDArray = _array(coords)
+    infinite: NDArray[np.bool_] = at_infinity(coords)[..., np.newaxis]
+
+    if coords.dtype == object:
+        return np.where(infinite, None,
+                        coords[..., :-1] / np.where(infinite, 1, coords[..., -1:]))  # noqa: E501
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(infinite, np.nan, coords[..., :-1] / coords[..., -1:])
+
+
+def incident(points: ArrayLike, hyperplanes: ArrayLike, /) -> NDArray[np.bool_]:  # noqa: E501
+    """Check which homogeneous points lie on which lines/planes (broadcast)."""
+    points: NDArray = _array(points)
+    hyperplanes: NDArray = _array(hyperplanes)
+
+    products: NDArray = points * hyperplanes
+
+    if products.dtype == object:
+        return np.asarray(_symbolic_is_zero(products.sum(axis=-1)), dtype=bool)  # noqa: E501
+
+    return np.abs(products.sum(axis=-1)) <= _RTOL * np.abs(products).sum(axis=-1)  # noqa: E501
+
+
+def _cross3(u: NDArray, v: NDArray, /) -> NDArray:
+    u0, u1, u2 = u[..., 0], u[..., 1], u[..., 2]
+    v0, v1, v2 = v[..., 0], v[..., 1], v[..., 2]
+
+    return np.stack((u1 * v2 - u2 * v1,
+                     u2 * v0 - u0 * v2,
+                     u0 * v1 - u1 * v0), axis=-1)
+
+
+def _cross4(u: NDArray, v: NDArray, w: NDArray, /) -> NDArray:
+    """Return r such that r . x = det(u, v, w, x) for all x."""
+    u0, u1, u2, u3 = u[..., 0], u[..., 1], u[..., 2], u[..., 3]
+
+    # 2x2 minors of v & w
+    m01 = v[..., 0] * w[..., 1] - v[..., 1] * w[..., 0]
+    m02 = v[..., 0] * w[..., 2] - v[..., 2] * w[..., 0]
+    m03 = v[..., 0] * w[..., 3] - v[..., 3] * w[..., 0]
+    m12 = v[..., 1] * w[..., 2] - v[..., 2] * w[..., 1]
+    m13 = v[..., 1] * w[..., 3] - v[..., 3] * w[..., 1]
+    m23 = v[..., 2] * w[..., 3] - v[..., 3] * w[..., 2]
+
+    return np.stack((-(u1 * m23 - u2 * m13 + u3 * m12),
+                     u0 * m23 - u2 * m03 + u3 * m02,
+                     -(u0 * m13 - u1 * m03 + u3 * m01),
+                     u0 * m12 - u1 * m02 + u2 * m01), axis=-1)
+
+
+def _wedge(elements: tuple[ArrayLike, ...], /) -> NDArray:
+    arrays: list[NDArray] = [_array(element) for element in elements]
+
+    if object in (array.dtype for array in arrays):
+        arrays: list[NDArray] = [array.astype(object) for array in arrays]
+
+    size: int = arrays[0].shape[-1]
+
+    assert len(arrays) == size - 1 and \
+        all(array.shape[-1] == size for array in arrays), \
+        ValueError(f'*** {len(arrays)} HOMOGENEOUS ELEMENTS OF SIZES '
+                   f'{[array.shape[-1] for array in arrays]} '
+                   'NEITHER 2 OF SIZE 3 NOR 3 OF SIZE 4 ***')
+
+    return _cross3(*arrays) if size == 3 else _cross4(*arrays)
+
+
+def join(*points: ArrayLike) -> NDArray:
+    """Return lines through 2 (or planes through 3) homogeneous points.
+
+    Results are zero where points are coincident (or collinear).
+    """
+    return _wedge(points)
+
+
+def meet(*hyperplanes: ArrayLike) -> NDArray:
+    """Return homogeneous points on 2 lines (or 3 planes).
+
+    Points are at infinity where lines (or planes' intersections) are
+    parallel, and zero where these are coincident.
+    """
+    return _wedge(hyperplanes)
@@ -0,0 +1,111 @@
+"""Vectorized Equations of Lines in R2.
+
+Each line is given once by the (a, b, c) coefficients of its equation
+a x + b y + c = 0, as the homogeneous join of 2 points on it, so that
+evaluating, measuring signed distances to & classifying sides of many
+points take single vectorized passes rather than per-point substitutions
+into symbolic equations. Equation values are positive to the left of lines
+(i.e., where the line's 2 points & the given point are counterclockwise),
+consistently with the orient2d predicate.
+
+Numeric coordinates are processed as float64 arrays, while coordinates
+involving Variables fall back to vectorized symbolic (object) arrays.
+"""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.functions.elementary.complexes import sign
+from sympy.functions.elementary.miscellaneous import sqrt
+
+from ._abc._point_cloud import _PointCloudABC
+from .homogeneous import homogeneous, join
+from .predicates import orient2d
+from .projection import coords_array
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('line_coefficients', 'normalize',
+                                    'evaluate', 'signed_distances', 'sides')
+
+
+_symbolic_sign: np.ufunc = np.frompyfunc(sign, 1, 1)
+_symbolic_sqrt: np.ufunc = np.frompyfunc(sqrt, 1, 1)
+
+
+def _points(points: Any, /) -> Any:
+    """Return points, or point clouds' coordinate arrays."""
+    return points.coords if isinstance(points, _PointCloudABC) else points
+
+
+def line_coefficients(points_0: Any, points_1: Any, /, *,
+                      normalized: bool = False) -> NDArray:
+    """Return (..., 3)-shaped coefficients of lines through 2 points each.
+
+    Points may be points, sequences thereof, or (..., 2)-shaped arrays; if
+    normalized, coefficients have a^2 + b^2 = 1.
+    """
+    coefficients: NDArray = join(homogeneous(_points(points_0)),
+                                 homogeneous(_points(points_1)))
+
+    return normalize(coefficients) if normalized else coefficients
+
+
+def normalize(coefficients: ArrayLike, /) -> NDArray:
+    """Return line coefficients scaled to a^2 + b^2 = 1.
+
+    Equation values of points are then their signed distances to lines.
+    """
+    coefficients: NDArray = coords_array(coefficients)
+    sq_norms: NDArray = (coefficients[..., :2] ** 2).sum(axis=-1, keepdims=True)  # noqa: E501
+
+    assert coefficients.dtype == object or sq_norms.all(), \
+        ValueError('*** LINE COEFFICIENTS WITH a = b = 0 ***')
+
+    return coefficients / (_symbolic_sqrt(sq_norms) if coefficients.dtype == object else np.sqrt(sq_norms))  # noqa: E501
+
+
+def evaluate(coefficients: ArrayLike, points: Any, /) -> Any:
+    """Return a x + b y + c of lines at points (broadcast).
+
+    Points may be points, sequences thereof, point clouds, or (..., 2)-shaped
+    arrays; values are scalars for single points & lines.
+    """
+    coefficients: NDArray = coords_array(coefficients)
+    coords: NDArray = homogeneous(_points(points))
+
+    if object in (coefficients.dtype, coords.dtype):
+        coefficients, coords = coefficients.astype(object), coords.astype(object)  # noqa: E501
+
+    return (coefficients * coords).sum(axis=-1)[()]
+
+
+def signed_distances(coefficients: ArrayLike, points: Any, /) -> Any:
+    """Return signed distances of points to lines (broadcast).
+
+    For many points, normalize coefficients once & evaluate them instead.
+    """
+    return evaluate(normalize(coefficients), points)
+
+
+def sides(point_0: Any, point_1: Any, points: Any, /) -> Any:
+    """Return 1 or -1 for points left or right of lines, else 0 (broadcast).
+
+    Numeric sides are decided robustly by the orient2d predicate, even for
+    points (nearly) on lines; symbolic ones are signs of equation values.
+    """
+    point_0, point_1, points = _points(point_0), _points(point_1), _points(points)  # noqa: E501
+
+    if object in (homogeneous(point_0).dtype, homogeneous(point_1).dtype,
+                  (coords := homogeneous(points)).dtype):
+        return _symbolic_sign(evaluate(line_coefficients(point_0, point_1), coords[..., :2]))  # noqa: E501
+
+    return orient2d(point_0, point_1, points)
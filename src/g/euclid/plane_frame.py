@@ -0,0 +1,220 @@
+"""Frames of Planes in R3, for Closed-Form Point & Line Queries.
+
+Each plane is given once by a point on it, its unit normal & an orthonormal
+in-plane basis, so that signed distances, perpendicular projections,
+reflections & line intersections of many points/lines take single vectorized
+passes rather than per-point symbolic projections onto helper lines.
+
+Numeric coordinates are processed as float64 arrays, while exact SymPy
+numbers & coordinates involving Variables stay exact in symbolic (object)
+arrays.
+"""
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.core.basic import Basic
+from sympy.core.numbers import Float
+from sympy.functions.elementary.miscellaneous import sqrt
+
+from ._abc._point_cloud import _PointCloudABC
+from .projection import coords_array
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString, Self
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('PlaneFrame',)
+
+
+_AXES: tuple[str, ...] = ('x', 'y', 'z')
+
+# relative tolerance of numeric parallelism checks
+_RTOL: float = 1e-12
+
+
+def _is_zero(value: Any, /) -> bool:
+    if isinstance(value, Basic):
+        return value.expand().is_zero is True
+
+    return value == 0
+
+
+_symbolic_is_zero: np.ufunc = np.frompyfunc(_is_zero, 1, 1)
+_symbolic_sqrt: np.ufunc = np.frompyfunc(sqrt, 1, 1)
+
+
+def _exact_array(values: ArrayLike, /, symbolic: bool = False) -> NDArray:
+    """Return float64 array of plain numbers, else object one, kept exact."""
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return values.astype(object if symbolic else np.float64, copy=False)
+
+    objects: NDArray = np.asarray(values, dtype=object)
+
+    if symbolic:
+        return objects
+
+    if any(isinstance(value, Basic) and not isinstance(value, Float)
+           for value in objects.flat):
+        return objects
+
+    return coords_array(objects)
+
+
+def _coords(points: Any, /, symbolic: bool = False) -> NDArray:
+    """Return (..., 3)-shaped coordinates of points, as objects if symbolic."""
+    if isinstance(points, _PointCloudABC):
+        return points.coords.astype(object) if symbolic else points.coords
+
+    if hasattr(points, _AXES[0]):
+        coords: NDArray = _exact_array([getattr(points, axis) for axis in _AXES], symbolic)  # noqa: E501
+
+    elif not isinstance(points, np.ndarray) and \
+            (points := list(points)) and hasattr(points[0], _AXES[0]):
+        coords: NDArray = _exact_array([[getattr(point, axis) for axis in _AXES]  # noqa: E501
+                                        for point in points], symbolic)
+
+    else:
+        coords: NDArray = _exact_array(points, symbolic)
+
+    assert coords.ndim and coords.shape[-1] == 3, \
+        ValueError(f'*** COORDINATES OF SHAPE {coords.shape} '
+                   'NOT OF SHAPE (..., 3) ***')
+
+    return coords
+
+
+def _homogeneous_coords(point: Any, /, symbolic: bool = False) -> NDArray:
+    """Return (x, y, z, w) of finite point or point at infinity, kept exact."""
+    if (coords := getattr(point, 'homogeneous', None)) is not None:
+        return _exact_array(coords, symbolic)
+
+    return _exact_array((*_coords(point, symbolic).tolist(), 1), symbolic)
+
+
+def _common(*arrays: NDArray) -> list[NDArray]:
+    """Return arrays as objects if any is symbolic."""
+    if object in (array.dtype for array in arrays):
+        return [array.astype(object) for array in arrays]
+
+    return list(arrays)
+
+
+def _dots(vectors: NDArray, vector: NDArray, /) -> NDArray:
+    """Return (...)-shaped dot products, as arrays even if symbolic & 0-d."""
+    return np.asarray((vectors * vector).sum(axis=-1))
+
+
+def _unit(vector: NDArray, /) -> NDArray:
+    if vector.dtype == object:
+        return vector / _symbolic_sqrt(vector @ vector)
+
+    norm: float = np.linalg.norm(vector)
+
+    assert norm, ValueError('*** ZERO VECTOR NOT NORMALIZABLE ***')
+
+    return vector / norm
+
+
+@dataclass(frozen=True, slots=True)
+class PlaneFrame:
+    """Plane in R3, as point on it, unit normal & orthonormal basis (u, v).
+
+    u x v is the unit normal, so that (u, v, normal) is right-handed.
+    """
+
+    origin: NDArray
+    unit_normal: NDArray
+    unit_u: NDArray
+    unit_v: NDArray
+
+    @classmethod
+    def from_points(cls: type[Self], point_0: Any, point_1: Any, point_2: Any, /) -> Self:  # noqa: E501
+        """Create frame of plane through finite point_0 & 2 other points.
+
+        Other points may be points at infinity, i.e., in-plane directions;
+        u is then along the direction from point_0 to point_1.
+        """
+        symbolic: bool = object in (_coords(point_0).dtype,
+                                    _homogeneous_coords(point_1).dtype,
+                                    _homogeneous_coords(point_2).dtype)
+
+        # plain numbers are kept as they are, rather than as floats, when
+        # mixed with exact SymPy numbers or Variables
+        origin: NDArray = _coords(point_0, symbolic)
+        direction_1, direction_2 = (coords[:3] - coords[3] * origin
+                                    for coords in (_homogeneous_coords(point_1, symbolic),  # noqa: E501
+                                                   _homogeneous_coords(point_2, symbolic)))  # noqa: E501
+
+        unit_normal: NDArray = _unit(np.cross(direction_1, direction_2))
+        unit_u: NDArray = _unit(direction_1)
+
+        return cls(origin, unit_normal, unit_u, np.cross(unit_normal, unit_u))
+
+    @property
+    def symbolic(self: Self, /) -> bool:
+        """Check whether frame is kept in symbolic (object) arrays."""
+        return self.origin.dtype == object
+
+    def _diffs(self: Self, points: Any, /) -> tuple[NDArray, NDArray]:
+        coords, origin = _common(_coords(points, self.symbolic), self.origin)
+
+        return coords, coords - origin
+
+    def signed_distances(self: Self, points: Any, /) -> Any:
+        """Return signed distances of points, positive on normal's side."""
+        _, diffs = self._diffs(points)
+
+        return _dots(diffs, self.unit_normal)[()]
+
+    def plane_coords(self: Self, points: Any, /) -> NDArray:
+        """Return (..., 2)-shaped (u, v) coordinates of points' projections."""
+        _, diffs = self._diffs(points)
+
+        return np.stack((_dots(diffs, self.unit_u), _dots(diffs, self.unit_v)), axis=-1)
+
+    def projections(self: Self, points: Any, /) -> NDArray:
+        """Return (..., 3)-shaped perpendicular projections of points."""
+        coords, diffs = self._diffs(points)
+
+        return coords - _dots(diffs, self.unit_normal)[..., np.newaxis] * self.unit_normal  # noqa: E501
+
+    def reflections(self: Self, points: Any, /) -> NDArray:
+        """Return (..., 3)-shaped reflections of points across plane."""
+        coords, diffs = self._diffs(points)
+
+        return coords - 2 * _dots(diffs, self.unit_normal)[..., np.newaxis] * self.unit_normal  # noqa: E501
+
+    def line_intersections(self: Self, points: Any, directions: ArrayLike, /) -> NDArray:  # noqa: E501
+        """Return (..., 3)-shaped intersections with lines (broadcast).
+
+        Lines are given by points on them & their directions. Intersections
+        of lines parallel to plane are NaN (numeric) or None (symbolic);
+        numeric parallelism is decided up to a relative tolerance.
+        """
+        coords, diffs = self._diffs(points)
+        directions: NDArray = _exact_array(directions, self.symbolic)
+        coords, diffs, directions, unit_normal = _common(coords, diffs, directions, self.unit_normal)  # noqa: E501
+
+        rates: NDArray = _dots(directions, unit_normal)
+
+        if rates.dtype == object:
+            parallel: NDArray[np.bool_] = np.asarray(_symbolic_is_zero(rates), dtype=bool)  # noqa: E501
+            safe_rates: NDArray = np.where(parallel, 1, rates)
+
+        else:
+            parallel: NDArray[np.bool_] = np.abs(rates) <= _RTOL * np.linalg.norm(directions, axis=-1)  # noqa: E501
+            safe_rates: NDArray = np.where(parallel, 1., rates)
+
+        intersections: NDArray = coords - (_dots(diffs, unit_normal) / safe_rates)[..., np.newaxis] * directions  # noqa: E501
+
+        return np.where(parallel[..., np.newaxis],
+                        None if intersections.dtype == object else np.nan,
+                        intersections)
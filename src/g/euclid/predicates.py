@@ -0,0 +1,277 @@
+"""Robust Adaptive-Precision Geometric Predicates.
+
+Signs of the orientation & in-circle/in-sphere determinants, decided by a
+floating-point filter first: each determinant is evaluated in float64
+together with Shewchuk's a-priori bound on its rounding error, and its sign
+is only trusted if its magnitude exceeds that bound. As such bounds only
+hold for coordinates that are exact float64s, points with other coordinates
+(e.g., SymPy Rationals like 1/3), as well as near-degenerate cases, escalate
+to exact rational (`Fraction`) arithmetic on the original coordinates, so
+results are always exact.
+
+Points may be given as numeric points with x, y (, z) coordinates (e.g.,
+PointInR2s & PointInR3s), as coordinate sequences, or as (..., d)-shaped
+arrays of many points, broadcast against one another; single predicates
+return ints in {-1, 0, 1}, batched ones int8 arrays.
+"""
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.core.numbers import Float, Rational
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any, LiteralString, Self
+
+    from numpy.typing import NDArray
+
+
+__all__: Sequence[LiteralString] = ('FilterStats', 'filter_stats',
+                                    'orient2d', 'incircle',
+                                    'orient3d', 'insphere')
+
+
+_AXES: tuple[str, ...] = ('x', 'y', 'z')
+
+# unit roundoff of float64
+_EPS: float = 2. ** -53
+
+# Shewchuk's error bound coefficients of float64 filters
+_ORIENT2D_ERRBOUND: float = (3 + 16 * _EPS) * _EPS
+_INCIRCLE_ERRBOUND: float = (10 + 96 * _EPS) * _EPS
+_ORIENT3D_ERRBOUND: float = (7 + 56 * _EPS) * _EPS
+_INSPHERE_ERRBOUND: float = (16 + 224 * _EPS) * _EPS
+
+
+@dataclass(slots=True)
+class FilterStats:
+    """Counts of predicates decided by float filter vs. exact arithmetic."""
+
+    fast: int = 0
+    exact: int = 0
+
+    @property
+    def fast_fraction(self: Self, /) -> float:
+        """Return fraction of predicates decided by float filter."""
+        return self.fast / total if (total := self.fast + self.exact) else 1.
+
+    def reset(self: Self, /) -> None:
+        """Reset counts."""
+        self.fast = self.exact = 0
+
+
+filter_stats: FilterStats = FilterStats()
+
+
+def _fraction(value: Any, /) -> Fraction:
+    """Convert numeric coordinate exactly."""
+    if isinstance(value, Rational):
+        return Fraction(int(value.p), int(value.q))
+
+    if isinstance(value, Float):
+        rational: Rational = Rational(value)
+        return Fraction(int(rational.p), int(rational.q))
+
+    return Fraction(value)
+
+
+def _is_exact_float(value: Any, /) -> bool:
+    """Check whether numeric coordinate is exactly representable in float64."""
+    if isinstance(value, (float, np.float64, np.float32, np.float16)):
+        return True
+
+    try:
+        return Fraction(float(value)) == _fraction(value)
+
+    # infinities & NaNs
+    except (OverflowError, ValueError):
+        return False
+
+
+_are_exact_floats: np.ufunc = np.frompyfunc(_is_exact_float, 1, 1)
+
+
+def _exact_floats(coords: NDArray, /) -> NDArray[np.bool_]:
+    """Return (...)-shaped flags of points with exact float64 coordinates."""
+    if coords.dtype.kind in 'fb':
+        return np.ones(coords.shape[:-1], dtype=bool)
+
+    if coords.dtype.kind in 'iu':
+        return (coords.astype(np.float64).astype(coords.dtype) == coords).all(axis=-1)  # noqa: E501
+
+    return _are_exact_floats(coords).astype(bool).all(axis=-1)
+
+
+def _coords(points: Any, n_dims: int, /) -> NDArray:
+    """Return (..., d)-shaped coordinates, with original numeric values."""
+    if not isinstance(points, np.ndarray):
+        if hasattr(points, _AXES[0]):
+            points: list[Any] = [getattr(points, axis) for axis in _AXES[:n_dims]]  # noqa: E501
+
+        elif (points := list(points)) and hasattr(points[0], _AXES[0]):
+            points: list[list[Any]] = [[getattr(point, axis) for axis in _AXES[:n_dims]]  # noqa: E501
+                                       for point in points]
+
+        # SymPy numbers are kept as objects, to be converted exactly
+        points: NDArray = np.asarray(points)
+
+    assert points.ndim and points.shape[-1] == n_dims, \
+        ValueError(f'*** COORDINATES OF SHAPE {points.shape} '
+                   f'NOT OF SHAPE (..., {n_dims}) ***')
+
+    return points
+
+
+def _predicate(determinant: Callable[..., tuple[Any, Any]], errbound: float,
+               n_dims: int, points: tuple[Any, ...], /) -> int | NDArray[np.int8]:  # noqa: E501
+    """Return sign of determinant, filtered by error bound of its permanent.
+
+    Points with coordinates not exactly representable in float64 bypass the
+    filter, whose error bound does not cover rounding of inputs.
+    """
+    coords: list[NDArray] = [_coords(p, n_dims) for p in points]
+    exact: NDArray[np.bool_] = np.logical_and.reduce(np.broadcast_arrays(*(_exact_floats(c) for c in coords))).ravel()  # noqa: E501
+
+    raws: list[NDArray] = np.broadcast_arrays(*coords)
+    shape: tuple[int, ...] = raws[0].shape[:-1]
+    raws: list[NDArray] = [raw.reshape(-1, n_dims) for raw in raws]
+
+    with np.errstate(all='ignore'):
+        det, permanent = determinant(*(raw[:, axis].astype(np.float64)
+                                       for raw in raws
+                                       for axis in range(n_dims)))
+
+        signs: NDArray[np.int8] = np.sign(det).astype(np.int8)
+
+        # NaNs & infinities from overflows are uncertain too
+        uncertain: NDArray[np.intp] = np.flatnonzero(~(exact & (np.abs(det) > errbound * permanent)))  # noqa: E501
+
+    filter_stats.fast += len(signs) - len(uncertain)
+    filter_stats.exact += len(uncertain)
+
+    for i in uncertain.tolist():
+        exact_det, _ = determinant(*(_fraction(c) for raw in raws for c in raw[i].tolist()))  # noqa: E501
+        signs[i] = (exact_det > 0) - (exact_det < 0)
+
+    return int(signs[0]) if not shape else signs.reshape(shape)
+
+
+def _orient2d(ax: Any, ay: Any, bx: Any, by: Any, cx: Any, cy: Any, /) -> tuple[Any, Any]:  # noqa: E501
+    detleft = (ax - cx) * (by - cy)
+    detright = (ay - cy) * (bx - cx)
+
+    return detleft - detright, abs(detleft) + abs(detright)
+
+
+def _incircle(ax: Any, ay: Any, bx: Any, by: Any, cx: Any, cy: Any,
+              dx: Any, dy: Any, /) -> tuple[Any, Any]:
+    adx, ady, bdx, bdy, cdx, cdy = ax - dx, ay - dy, bx - dx, by - dy, cx - dx, cy - dy  # noqa: E501
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    return ((alift * (bdxcdy - cdxbdy) +
+             blift * (cdxady - adxcdy) +
+             clift * (adxbdy - bdxady)),
+            ((abs(bdxcdy) + abs(cdxbdy)) * alift +
+             (abs(cdxady) + abs(adxcdy)) * blift +
+             (abs(adxbdy) + abs(bdxady)) * clift))
+
+
+def _orient3d(ax: Any, ay: Any, az: Any, bx: Any, by: Any, bz: Any,
+              cx: Any, cy: Any, cz: Any, dx: Any, dy: Any, dz: Any, /) -> tuple[Any, Any]:  # noqa: E501
+    adx, ady, adz = ax - dx, ay - dy, az - dz
+    bdx, bdy, bdz = bx - dx, by - dy, bz - dz
+    cdx, cdy, cdz = cx - dx, cy - dy, cz - dz
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+
+    return ((adz * (bdxcdy - cdxbdy) +
+             bdz * (cdxady - adxcdy) +
+             cdz * (adxbdy - bdxady)),
+            ((abs(bdxcdy) + abs(cdxbdy)) * abs(adz) +
+             (abs(cdxady) + abs(adxcdy)) * abs(bdz) +
+             (abs(adxbdy) + abs(bdxady)) * abs(cdz)))
+
+
+def _insphere(ax: Any, ay: Any, az: Any, bx: Any, by: Any, bz: Any,
+              cx: Any, cy: Any, cz: Any, dx: Any, dy: Any, dz: Any,
+              ex: Any, ey: Any, ez: Any, /) -> tuple[Any, Any]:
+    aex, aey, aez = ax - ex, ay - ey, az - ez
+    bex, bey, bez = bx - ex, by - ey, bz - ez
+    cex, cey, cez = cx - ex, cy - ey, cz - ez
+    dex, dey, dez = dx - ex, dy - ey, dz - ez
+
+    aexbey, bexaey = aex * bey, bex * aey
+    bexcey, cexbey = bex * cey, cex * bey
+    cexdey, dexcey = cex * dey, dex * cey
+    dexaey, aexdey = dex * aey, aex * dey
+    aexcey, cexaey = aex * cey, cex * aey
+    bexdey, dexbey = bex * dey, dex * bey
+
+    ab, bc, cd, da = aexbey - bexaey, bexcey - cexbey, cexdey - dexcey, dexaey - aexdey  # noqa: E501
+    ac, bd = aexcey - cexaey, bexdey - dexbey
+
+    abc = aez * bc - bez * ac + cez * ab
+    bcd = bez * cd - cez * bd + dez * bc
+    cda = cez * da + dez * ac + aez * cd
+    dab = dez * ab + aez * bd + bez * da
+
+    alift = aex * aex + aey * aey + aez * aez
+    blift = bex * bex + bey * bey + bez * bez
+    clift = cex * cex + cey * cey + cez * cez
+    dlift = dex * dex + dey * dey + dez * dez
+
+    aez, bez, cez, dez = abs(aez), abs(bez), abs(cez), abs(dez)
+    aexbey, bexaey, bexcey, cexbey = abs(aexbey), abs(bexaey), abs(bexcey), abs(cexbey)  # noqa: E501
+    cexdey, dexcey, dexaey, aexdey = abs(cexdey), abs(dexcey), abs(dexaey), abs(aexdey)  # noqa: E501
+    aexcey, cexaey, bexdey, dexbey = abs(aexcey), abs(cexaey), abs(bexdey), abs(dexbey)  # noqa: E501
+
+    return (((dlift * abc - clift * dab) + (blift * cda - alift * bcd)),
+            (((cexdey + dexcey) * bez + (dexbey + bexdey) * cez + (bexcey + cexbey) * dez) * alift +  # noqa: E501
+             ((dexaey + aexdey) * cez + (aexcey + cexaey) * dez + (cexdey + dexcey) * aez) * blift +  # noqa: E501
+             ((aexbey + bexaey) * dez + (bexdey + dexbey) * aez + (dexaey + aexdey) * bez) * clift +  # noqa: E501
+             ((bexcey + cexbey) * aez + (cexaey + aexcey) * bez + (aexbey + bexaey) * cez) * dlift))  # noqa: E501
+
+
+def orient2d(a: Any, b: Any, c: Any, /) -> int | NDArray[np.int8]:
+    """Return 1 if a, b & c are counterclockwise, -1 if clockwise, else 0."""
+    return _predicate(_orient2d, _ORIENT2D_ERRBOUND, 2, (a, b, c))
+
+
+def incircle(a: Any, b: Any, c: Any, d: Any, /) -> int | NDArray[np.int8]:
+    """Return 1 if d is inside circle through a, b & c, -1 if outside, else 0.
+
+    Points a, b & c must be counterclockwise, else signs are reversed.
+    """
+    return _predicate(_incircle, _INCIRCLE_ERRBOUND, 2, (a, b, c, d))
+
+
+def orient3d(a: Any, b: Any, c: Any, d: Any, /) -> int | NDArray[np.int8]:
+    """Return 1 if d is below plane through a, b & c, -1 if above, else 0.
+
+    Below is the side from which a, b & c appear clockwise.
+    """
+    return _predicate(_orient3d, _ORIENT3D_ERRBOUND, 3, (a, b, c, d))
+
+
+def insphere(a: Any, b: Any, c: Any, d: Any, e: Any, /) -> int | NDArray[np.int8]:  # noqa: E501
+    """Return 1 if e is inside sphere through a, b, c & d, -1 if outside, else 0.
+
+    Points a, b, c & d must be positively oriented (`orient3d` > 0), else
+    signs are reversed.
+    """  # noqa: E501
+    return _predicate(_insphere, _INSPHERE_ERRBOUND, 3, (a, b, c, d, e))
@@ -0,0 +1,79 @@
+"""Batch Perpendicular Projections of Points onto Lines & Planes.
+
+Each line or plane is given once by a point on it and its precomputed unit
+direction or unit normal, so that projections & distances of many points
+take single vectorized passes rather than per-point symbolic projections.
+
+Numeric coordinates are processed as float64 arrays, while coordinates
+involving Variables fall back to vectorized symbolic (object) arrays.
+"""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.functions.elementary.miscellaneous import sqrt
+
+from .distance import _coords
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('coords_array',
+                                    'project_onto_line', 'project_onto_plane')
+
+
+_symbolic_sqrt: np.ufunc = np.frompyfunc(sqrt, 1, 1)
+
+
+def coords_array(values: ArrayLike, /) -> NDArray:
+    """Return float64 array if values are all numeric, else object one."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+
+    except (TypeError, ValueError):
+        return np.asarray(values, dtype=object)
+
+
+def _norms(vectors: NDArray, /) -> NDArray:
+    sq_norms: NDArray = (vectors * vectors).sum(axis=-1)
+
+    return _symbolic_sqrt(sq_norms) if sq_norms.dtype == object else np.sqrt(sq_norms)  # noqa: E501
+
+
+def project_onto_line(points: Any, origin: ArrayLike, unit_direction: ArrayLike, /) -> tuple[NDArray, NDArray]:  # noqa: E501
+    """Return perpendicular projections & distances of points onto line.
+
+    Points may be given as sequences of points, as (n, d)-shaped arrays, or
+    as Point Clouds.
+    """
+    coords: NDArray = _coords(points)
+    origin: NDArray = coords_array(origin)
+    unit_direction: NDArray = coords_array(unit_direction)
+
+    diffs: NDArray = coords - origin
+    projections: NDArray = origin + (diffs @ unit_direction)[:, np.newaxis] * unit_direction  # noqa: E501
+
+    return projections, _norms(coords - projections)
+
+
+def project_onto_plane(points: Any, origin: ArrayLike, unit_normal: ArrayLike, /) -> tuple[NDArray, NDArray]:  # noqa: E501
+    """Return perpendicular projections & distances of points onto plane.
+
+    Points may be given as sequences of points, as (n, 3)-shaped arrays, or
+    as Point Clouds.
+    """
+    coords: NDArray = _coords(points)
+    origin: NDArray = coords_array(origin)
+    unit_normal: NDArray = coords_array(unit_normal)
+
+    signed_distances: NDArray = (coords - origin) @ unit_normal
+
+    return (coords - signed_distances[:, np.newaxis] * unit_normal,
+            np.abs(signed_distances))
@@ -0,0 +1,278 @@
+"""Symmetric Matrix (Quadratic Form) Representation of Conics in R2.
+
+A conic is the zero set of `p^T M p` over homogeneous points p = (x, y, 1),
+for symmetric 3 x 3 matrix
+
+        | a    b/2  d/2 |
+    M = | b/2  c    e/2 |   of equation a x^2 + b xy + c y^2 + d x + e y + f,
+        | d/2  e/2  f   |
+
+whose upper-left 2 x 2 block A is the quadratic part. Classification, center,
+principal axes, polars & tangents all follow from M & A, vectorized over
+batches of conics as (..., 3, 3)-shaped arrays.
+
+Conversion from focus/vertex/eccentricity form (`|P - F| = e dist(P, L)` for
+directrix L) is rational in its inputs, hence also works on symbolic (object)
+arrays; the other operations are numeric.
+"""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..projection import coords_array
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import LiteralString
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('DEGENERATE', 'IMAGINARY', 'CIRCLE',
+                                    'ELLIPSE', 'PARABOLA', 'HYPERBOLA',
+                                    'from_coefficients', 'to_coefficients',
+                                    'from_focus_vertex_eccentricity',
+                                    'to_focus_vertex_eccentricity',
+                                    'classify', 'centers', 'principal_axes',
+                                    'evaluate', 'polars', 'tangents')
+
+
+# kinds of conics
+DEGENERATE: int = 0
+IMAGINARY: int = 1
+CIRCLE: int = 2
+ELLIPSE: int = 3
+PARABOLA: int = 4
+HYPERBOLA: int = 5
+
+# relative tolerance of numeric invariant checks
+_RTOL: float = 1e-12
+
+
+def _homogeneous(points: ArrayLike, /) -> NDArray[np.float64]:
+    points: NDArray[np.float64] = np.asarray(points, dtype=np.float64)
+
+    return np.concatenate((points, np.ones_like(points[..., :1])), axis=-1)
+
+
+def from_coefficients(a: ArrayLike, b: ArrayLike, c: ArrayLike,
+                      d: ArrayLike, e: ArrayLike, f: ArrayLike, /) -> NDArray:  # noqa: E501
+    """Return matrices of equations a x^2 + b xy + c y^2 + d x + e y + f."""
+    a, b, c, d, e, f = np.broadcast_arrays(*(coords_array(i) for i in (a, b, c, d, e, f)))  # noqa: E501
+
+    return np.stack((np.stack((a, b / 2, d / 2), axis=-1),
+                     np.stack((b / 2, c, e / 2), axis=-1),
+                     np.stack((d / 2, e / 2, f), axis=-1)), axis=-2)
+
+
+def to_coefficients(matrices: ArrayLike, /) -> tuple[NDArray, ...]:
+    """Return equations' coefficients (a, b, c, d, e, f) of matrices."""
+    m: NDArray = coords_array(matrices)
+
+    return (m[..., 0, 0], 2 * m[..., 0, 1], m[..., 1, 1],
+            2 * m[..., 0, 2], 2 * m[..., 1, 2], m[..., 2, 2])
+
+
+def from_focus_vertex_eccentricity(foci: ArrayLike, vertices: ArrayLike,
+                                   eccentricities: ArrayLike, /) -> NDArray:
+    """Return matrices of conics by foci, nearest vertices & eccentricities.
+
+    With d = vertex - focus & w = P - focus, conics are
+    `|w|^2 - (e w.d / |d| - (1 + e) |d|)^2 = 0`, i.e., quadratic forms with
+    A = I - (e^2 / d.d) d d^T, linear part g = e (1 + e) d & constant
+    -(1 + e)^2 d.d in w, translated to P.
+    """
+    arrays: list[NDArray] = [coords_array(i) for i in (foci, vertices, eccentricities)]  # noqa: E501
+
+    # symbolic inputs are kept exact, e.g., Rational eccentricities
+    if object in (array.dtype for array in arrays):
+        dtype: type = object
+        foci, vertices, eccentricities = (np.asarray(i, dtype=object) for i in (foci, vertices, eccentricities))  # noqa: E501
+
+    else:
+        dtype: type = np.float64
+        foci, vertices, eccentricities = arrays
+
+    # flattened batches, as symbolic reductions of 0-d arrays are scalars
+    shape: tuple[int, ...] = np.broadcast_shapes(foci.shape[:-1], vertices.shape[:-1], eccentricities.shape)  # noqa: E501
+    foci: NDArray = np.broadcast_to(foci, (*shape, 2)).reshape(-1, 2).astype(dtype)  # noqa: E501
+    vertices: NDArray = np.broadcast_to(vertices, (*shape, 2)).reshape(-1, 2).astype(dtype)  # noqa: E501
+    eccentricities: NDArray = np.broadcast_to(eccentricities, shape).reshape(-1).astype(dtype)  # noqa: E501
+
+    d: NDArray = vertices - foci
+    sq_p: NDArray = (d * d).sum(axis=-1)
+    e: NDArray = eccentricities
+
+    # quadratic part
+    outer: NDArray = d[..., :, np.newaxis] * d[..., np.newaxis, :]
+    a: NDArray = np.eye(2, dtype=outer.dtype) - (e * e / sq_p)[..., np.newaxis, np.newaxis] * outer  # noqa: E501
+
+    # linear & constant parts about focus
+    g: NDArray = (e * (1 + e))[..., np.newaxis] * d
+    h: NDArray = -(1 + e) ** 2 * sq_p
+
+    # translate w = P - focus
+    af: NDArray = (a * foci[..., np.newaxis, :]).sum(axis=-1)
+    linear: NDArray = g - af
+    constant: NDArray = (foci * af).sum(axis=-1) - 2 * (g * foci).sum(axis=-1) + h  # noqa: E501
+
+    return np.concatenate(
+        (np.concatenate((a, linear[..., :, np.newaxis]), axis=-1),
+         np.concatenate((linear, constant[..., np.newaxis]), axis=-1)[..., np.newaxis, :]),  # noqa: E501
+        axis=-2).reshape(*shape, 3, 3)
+
+
+def _scales(m: NDArray[np.float64], /) -> NDArray[np.float64]:
+    return np.abs(m).max(axis=(-2, -1))
+
+
+def classify(matrices: ArrayLike, /) -> NDArray[np.int8] | int:
+    """Classify conics by invariants det(M), det(A) & trace(A)."""
+    m: NDArray[np.float64] = np.asarray(matrices, dtype=np.float64)
+    a: NDArray[np.float64] = m[..., :2, :2]
+    scales: NDArray[np.float64] = _scales(m)
+
+    det_m: NDArray[np.float64] = np.linalg.det(m)
+    det_a: NDArray[np.float64] = np.linalg.det(a)
+    trace_a: NDArray[np.float64] = np.trace(a, axis1=-2, axis2=-1)
+
+    degenerate: NDArray[np.bool_] = np.abs(det_m) <= _RTOL * scales ** 3
+    parabolic: NDArray[np.bool_] = np.abs(det_a) <= _RTOL * scales ** 2
+    circular: NDArray[np.bool_] = ((np.abs(a[..., 0, 0] - a[..., 1, 1]) <= _RTOL * scales) &  # noqa: E501
+                                   (np.abs(a[..., 0, 1]) <= _RTOL * scales))
+
+    kinds: NDArray[np.int8] = np.select(
+        (degenerate, parabolic, det_a < 0, det_m * trace_a > 0, circular),
+        (DEGENERATE, PARABOLA, HYPERBOLA, IMAGINARY, CIRCLE),
+        ELLIPSE).astype(np.int8)
+
+    return int(kinds) if kinds.ndim == 0 else kinds
+
+
+def centers(matrices: ArrayLike, /) -> NDArray[np.float64]:
+    """Return homogeneous centers, i.e., poles of line at infinity.
+
+    Centers of parabolas are at infinity, along their axes.
+    """
+    m: NDArray[np.float64] = np.asarray(matrices, dtype=np.float64)
+
+    # last column of adjugate of M, i.e., M^-1 (0, 0, 1) up to scale
+    return np.stack((m[..., 0, 1] * m[..., 1, 2] - m[..., 1, 1] * m[..., 0, 2],
+                     m[..., 0, 1] * m[..., 0, 2] - m[..., 0, 0] * m[..., 1, 2],
+                     m[..., 0, 0] * m[..., 1, 1] - m[..., 0, 1] ** 2), axis=-1)  # noqa: E501
+
+
+def _principal(m: NDArray[np.float64], /) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:  # noqa: E501
+    """Return eigen-pairs & squared semi-axis lengths, major axis first."""
+    eigenvalues, eigenvectors = np.linalg.eigh(m[..., :2, :2])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # constant term about center, f + b.c = det(M) / det(A)
+        centered_constants: NDArray[np.float64] = np.linalg.det(m) / np.prod(eigenvalues, axis=-1)  # noqa: E501
+
+        sq_lengths: NDArray[np.float64] = -centered_constants[..., np.newaxis] / eigenvalues  # noqa: E501
+
+    # largest positive squared semi-axis length first
+    order: NDArray[np.intp] = np.argsort(np.where(sq_lengths > 0, -sq_lengths, np.inf), axis=-1)  # noqa: E501
+
+    return (np.take_along_axis(eigenvalues, order, axis=-1),
+            np.take_along_axis(np.swapaxes(eigenvectors, -2, -1), order[..., np.newaxis], axis=-2),  # noqa: E501
+            np.take_along_axis(sq_lengths, order, axis=-1))
+
+
+def principal_axes(matrices: ArrayLike, /) -> tuple[NDArray[np.float64], NDArray[np.float64]]:  # noqa: E501
+    """Return principal (unit) axis directions & semi-axis lengths.
+
+    Directions are (..., 2, 2)-shaped, one per row, major (or transverse)
+    axis first; semi-axis lengths are NaN where infinite or imaginary, e.g.,
+    for parabolas & conjugate hyperbola axes.
+    """
+    _, directions, sq_lengths = _principal(np.asarray(matrices, dtype=np.float64))  # noqa: E501
+
+    return directions, np.sqrt(np.where(np.isfinite(sq_lengths) & (sq_lengths > 0), sq_lengths, np.nan))  # noqa: E501
+
+
+def to_focus_vertex_eccentricity(matrices: ArrayLike, /) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:  # noqa: E501
+    """Return foci, nearest vertices & eccentricities of real conics.
+
+    Central conics' foci are either of their 2 foci; vertices of circles are
+    in +x direction from their centers; results are NaN for degenerate &
+    imaginary conics.
+    """
+    m: NDArray[np.float64] = np.asarray(matrices, dtype=np.float64)
+
+    # batches flattened, for masked assignments to also apply to single conics
+    shape: tuple[int, ...] = m.shape[:-2]
+    m: NDArray[np.float64] = m.reshape(-1, 3, 3)
+    kinds: NDArray[np.int8] = classify(m)
+
+    eigenvalues, directions, sq_lengths = _principal(m)
+    major: NDArray[np.float64] = directions[..., 0, :]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        homogeneous_centers: NDArray[np.float64] = centers(m)
+        center: NDArray[np.float64] = homogeneous_centers[..., :2] / homogeneous_centers[..., 2:]  # noqa: E501
+
+        # central conics: e^2 = 1 -/+ b^2 / a^2 = 1 - lambda_a / lambda_b
+        a: NDArray[np.float64] = np.sqrt(sq_lengths[..., 0])
+        eccentricities: NDArray[np.float64] = np.sqrt(np.maximum(1 - eigenvalues[..., 0] / eigenvalues[..., 1], 0))  # noqa: E501
+
+        foci: NDArray[np.float64] = center + (a * eccentricities)[..., np.newaxis] * major  # noqa: E501
+        vertices: NDArray[np.float64] = center + a[..., np.newaxis] * major
+
+    # circles' vertices are taken in +x direction from their centers
+    circular: NDArray[np.bool_] = kinds == CIRCLE
+    vertices[circular] = center[circular] + np.stack((a[circular], np.zeros_like(a[circular])), axis=-1)  # noqa: E501
+
+    # parabolas: with axis u (A u = 0) & other eigen-pair (lambda, v),
+    # lambda (r - r0)^2 = -2 (b.u) (s - s0) in coordinates s = P.u & r = P.v
+    if (parabolic := kinds == PARABOLA).any():
+        p: NDArray[np.float64] = m[parabolic]
+
+        eigenvalues, eigenvectors = np.linalg.eigh(p[..., :2, :2])
+        axis: NDArray[np.intp] = np.argmin(np.abs(eigenvalues), axis=-1)[..., np.newaxis]  # noqa: E501
+
+        u: NDArray[np.float64] = np.take_along_axis(eigenvectors, axis[..., np.newaxis], axis=-1)[..., 0]  # noqa: E501
+        v: NDArray[np.float64] = np.stack((-u[..., 1], u[..., 0]), axis=-1)
+        lam: NDArray[np.float64] = np.take_along_axis(eigenvalues, 1 - axis, axis=-1)[..., 0]  # noqa: E501
+
+        bu: NDArray[np.float64] = (p[..., :2, 2] * u).sum(axis=-1)
+        bv: NDArray[np.float64] = (p[..., :2, 2] * v).sum(axis=-1)
+
+        r0: NDArray[np.float64] = -bv / lam
+        s0: NDArray[np.float64] = -(p[..., 2, 2] - bv * bv / lam) / (2 * bu)
+        focal_lengths: NDArray[np.float64] = -bu / (2 * lam)
+
+        vertices[parabolic] = s0[..., np.newaxis] * u + r0[..., np.newaxis] * v  # noqa: E501
+        foci[parabolic] = vertices[parabolic] + focal_lengths[..., np.newaxis] * u  # noqa: E501
+        eccentricities[parabolic] = 1
+
+    invalid: NDArray[np.bool_] = (kinds == DEGENERATE) | (kinds == IMAGINARY)
+    foci[invalid] = vertices[invalid] = eccentricities[invalid] = np.nan
+
+    return (foci.reshape(*shape, 2), vertices.reshape(*shape, 2),
+            eccentricities.reshape(shape)[()])
+
+
+def evaluate(matrices: ArrayLike, points: ArrayLike, /) -> NDArray[np.float64]:  # noqa: E501
+    """Evaluate quadratic forms at (..., 2)-shaped points (broadcast)."""
+    p: NDArray[np.float64] = _homogeneous(points)
+
+    return np.einsum('...i,...ij,...j->...', p, np.asarray(matrices, dtype=np.float64), p)  # noqa: E501
+
+
+def polars(matrices: ArrayLike, points: ArrayLike, /) -> NDArray[np.float64]:
+    """Return polar lines (a : b : c) of (..., 2)-shaped points (broadcast)."""
+    return np.einsum('...ij,...j->...i', np.asarray(matrices, dtype=np.float64), _homogeneous(points))  # noqa: E501
+
+
+def tangents(matrices: ArrayLike, points: ArrayLike, /) -> NDArray[np.float64]:
+    """Return tangent lines (a : b : c) at points on conics (broadcast).
+
+    Tangents at points on conics are their polars.
+    """
+    return polars(matrices, points)
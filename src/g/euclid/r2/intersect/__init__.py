@@ -0,0 +1,34 @@
+"""Intersections in R2."""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .circle import (DISJOINT, EXTERNALLY_TANGENT, INTERSECTING,
+                     INTERNALLY_TANGENT, CONTAINED, COINCIDENT,
+                     CircleBatch, CircleIntersections)
+from .conic import (ConicLineIntersections, ConicIntersections,
+                    intersect_conic_lines, intersect_conics, conic_cut_points)
+from .linear import (LINE, RAY, SEGMENT,
+                     LinearEntityBatch, LinearIntersections,
+                     intersect_pairwise, intersect_all)
+from .sweep import segment_intersections
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import LiteralString
+
+
+__all__: Sequence[LiteralString] = ('LINE', 'RAY', 'SEGMENT',
+                                    'LinearEntityBatch', 'LinearIntersections',
+                                    'intersect_pairwise', 'intersect_all',
+                                    'segment_intersections',
+                                    'ConicLineIntersections',
+                                    'ConicIntersections',
+                                    'intersect_conic_lines', 'intersect_conics',
+                                    'conic_cut_points',
+                                    'DISJOINT', 'EXTERNALLY_TANGENT',
+                                    'INTERSECTING', 'INTERNALLY_TANGENT',
+                                    'CONTAINED', 'COINCIDENT',
+                                    'CircleBatch', 'CircleIntersections')
@@ -0,0 +1,300 @@
+"""Batch Circle-Circle Intersections, Powers & Radical Axes in R2.
+
+Circles are held as structure of arrays of centers `c` & radii `r`. Circles
+1 & 2, at center distance `d`, meet at
+
+    c1 + a u +/- h u^perp,    a = (d^2 + r1^2 - r2^2) / (2 d),    h^2 = r1^2 - a^2,
+
+for unit `u = (c2 - c1) / d`, on their radical axis, where powers
+`|p - c|^2 - r^2` of points p w.r.t. both circles are equal.
+
+Pairs among many circles are pruned by a uniform spatial grid first, with
+cells about as large as typical circles: only circles whose bounding boxes
+share cells are tested, so that sparse inputs take near-linear time. Circles
+much larger than typical ones are paired on coarser grids of their own, and
+with smaller ones by sweeping along x, rather than covering many cells.
+"""
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ...homogeneous import meet
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Any, LiteralString, Self
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('DISJOINT', 'EXTERNALLY_TANGENT',
+                                    'INTERSECTING', 'INTERNALLY_TANGENT',
+                                    'CONTAINED', 'COINCIDENT',
+                                    'CircleBatch', 'CircleIntersections')
+
+
+# relations of pairs of circles
+DISJOINT: int = 0
+EXTERNALLY_TANGENT: int = 1
+INTERSECTING: int = 2
+INTERNALLY_TANGENT: int = 3
+CONTAINED: int = 4
+COINCIDENT: int = 5
+
+# relative tolerance of numeric tangency & coincidence checks
+_RTOL: float = 1e-12
+
+# maximum number of grid cells spanned by circles per axis, beyond which
+# circles are paired on coarser grids of their own
+_MAX_CELL_SPAN: int = 4
+
+
+def _candidate_codes(centers: NDArray[np.float64], margins: NDArray[np.float64],  # noqa: E501
+                     indices: NDArray[np.intp], /) -> list[NDArray[np.int64]]:
+    """Return codes i * n + j (i < j) of candidate pairs of indexed circles.
+
+    Circles spanning more than `_MAX_CELL_SPAN` cells per axis recurse onto
+    grids of their own, of larger median radius, so that no circle covers
+    more than a bounded number of cells.
+    """
+    if len(indices) < 2:
+        return []
+
+    n: int = len(centers)
+    reaches: NDArray[np.float64] = margins[indices, np.newaxis]
+
+    cell_size: float = 2 * float(np.median(reaches)) or float(reaches.max()) or 1.  # noqa: E501
+    lo: NDArray[np.int64] = np.floor((centers[indices] - reaches) / cell_size).astype(np.int64)  # noqa: E501
+    hi: NDArray[np.int64] = np.floor((centers[indices] + reaches) / cell_size).astype(np.int64)  # noqa: E501
+    spans: NDArray[np.int64] = hi - lo + 1
+
+    codes: list[NDArray[np.int64]] = []
+
+    if (oversized := spans.max(axis=-1) > _MAX_CELL_SPAN).any():
+        codes.extend(_candidate_codes(centers, margins, indices[oversized]))
+        codes.append(_sweep_codes(centers, margins, indices[oversized], indices[~oversized]))  # noqa: E501
+
+        fitting: NDArray[np.bool_] = ~oversized
+        indices, lo, spans = indices[fitting], lo[fitting], spans[fitting]
+
+        if len(indices) < 2:
+            return codes
+
+    # (cell, circle) entries of all cells covered by bounding boxes, with
+    # cells keyed by row-major ranks in grid
+    counts: NDArray[np.int64] = spans[:, 0] * spans[:, 1]
+    circles: NDArray[np.intp] = np.repeat(np.arange(len(indices)), counts)
+    ranks: NDArray[np.int64] = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)  # noqa: E501
+    cells: NDArray[np.int64] = lo[circles] - lo.min(axis=0) + np.stack((ranks // spans[circles, 1], ranks % spans[circles, 1]), axis=-1)  # noqa: E501
+    keys: NDArray[np.int64] = cells[:, 0] * (cells[:, 1].max() + 1) + cells[:, 1]  # noqa: E501
+
+    # circles ascending within runs of cells
+    order: NDArray[np.intp] = np.lexsort((circles, keys))
+    keys, circles = keys[order], indices[circles[order]]
+
+    # pairs within cells, by offsets within runs
+    offset: int = 1
+
+    while offset < len(circles):
+        same: NDArray[np.bool_] = keys[offset:] == keys[:-offset]
+
+        if not same.any():
+            break
+
+        codes.append(circles[:-offset][same] * n + circles[offset:][same])
+        offset += 1
+
+    return codes
+
+
+def _sweep_codes(centers: NDArray[np.float64], margins: NDArray[np.float64],
+                 large: NDArray[np.intp], small: NDArray[np.intp], /) -> NDArray[np.int64]:  # noqa: E501
+    """Return codes of pairs of large & small circles with overlapping boxes.
+
+    Small circles are sorted by x, so that each large circle is only tested
+    against those within its x-range.
+    """
+    order: NDArray[np.intp] = small[np.argsort(centers[small, 0])]
+    xs: NDArray[np.float64] = centers[order, 0]
+
+    reaches: NDArray[np.float64] = margins[large] + margins[small].max(initial=0)  # noqa: E501
+    lo: NDArray[np.intp] = np.searchsorted(xs, centers[large, 0] - reaches, side='left')  # noqa: E501
+    counts: NDArray[np.intp] = np.searchsorted(xs, centers[large, 0] + reaches, side='right') - lo  # noqa: E501
+
+    i: NDArray[np.intp] = np.repeat(large, counts)
+    j: NDArray[np.intp] = order[np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts - lo, counts)]  # noqa: E501
+
+    # bounding boxes also overlapping in y
+    overlapping: NDArray[np.bool_] = np.abs(centers[i, 1] - centers[j, 1]) <= margins[i] + margins[j]  # noqa: E501
+    i, j = i[overlapping], j[overlapping]
+
+    return np.minimum(i, j) * len(centers) + np.maximum(i, j)
+
+
+@dataclass(frozen=True, slots=True)
+class CircleIntersections:
+    """Intersections of pairs of circles.
+
+    Points are (k, 2, 2)-shaped, NaN where absent, & equal for tangent pairs.
+    """
+
+    pairs: NDArray[np.intp]
+    relations: NDArray[np.int8]
+    points: NDArray[np.float64]
+
+
+@dataclass(frozen=True, slots=True)
+class CircleBatch:
+    """Batch of Circles in R2, as structure of arrays."""
+
+    centers: NDArray[np.float64]
+    radii: NDArray[np.float64]
+
+    @classmethod
+    def from_arrays(cls: type[Self], centers: ArrayLike, radii: ArrayLike, /) -> Self:  # noqa: E501
+        """Create batch from (n, 2)-shaped centers & (n,)-shaped radii."""
+        centers: NDArray[np.float64] = np.asarray(centers, dtype=np.float64)
+        radii: NDArray[np.float64] = np.broadcast_to(np.asarray(radii, dtype=np.float64), centers.shape[:1])  # noqa: E501
+
+        assert centers.ndim == 2 and centers.shape[1] == 2, \
+            ValueError(f'*** CENTERS OF SHAPE {centers.shape} NOT OF SHAPE (n, 2) ***')  # noqa: E501
+
+        assert (radii >= 0).all(), \
+            ValueError('*** RADII NOT ALL NON-NEGATIVE ***')
+
+        return cls(centers, radii)
+
+    @classmethod
+    def from_circles(cls: type[Self], circles: Iterable[Any], /) -> Self:
+        """Create batch from numeric circles with centers & radii.
+
+        Circles may be, e.g., CircleInR2s or SymPy Circles.
+        """
+        circles: list[Any] = list(circles)
+
+        return cls.from_arrays(
+            np.reshape([(float(circle.center.x), float(circle.center.y)) for circle in circles], (-1, 2)),  # noqa: E501
+            [float(circle.radius) for circle in circles])
+
+    def __len__(self: Self, /) -> int:
+        """Return number of circles."""
+        return len(self.radii)
+
+    def power(self: Self, points: ArrayLike, /) -> NDArray[np.float64]:
+        """Return (..., n)-shaped powers of (..., 2)-shaped points.
+
+        Powers are negative inside, zero on & positive outside circles.
+        """
+        offsets: NDArray[np.float64] = np.asarray(points, dtype=np.float64)[..., np.newaxis, :] - self.centers  # noqa: E501
+
+        return (offsets * offsets).sum(axis=-1) - self.radii ** 2
+
+    def radical_axes(self: Self, pairs: ArrayLike, /) -> NDArray[np.float64]:  # noqa: E501
+        """Return (k, 3)-shaped lines (a : b : c) of (k, 2) index pairs.
+
+        Radical axes of concentric circles are at infinity.
+        """
+        i, j = np.asarray(pairs, dtype=np.intp).reshape(-1, 2).T
+        c1, c2 = self.centers[i], self.centers[j]
+
+        # difference of equations |p|^2 - 2 c.p + |c|^2 - r^2
+        return np.concatenate(
+            (2 * (c2 - c1),
+             ((c1 * c1).sum(axis=-1) - self.radii[i] ** 2 -
+              (c2 * c2).sum(axis=-1) + self.radii[j] ** 2)[:, np.newaxis]),
+            axis=-1)
+
+    def radical_centers(self: Self, triples: ArrayLike, /) -> NDArray[np.float64]:  # noqa: E501
+        """Return (k, 3)-shaped homogeneous radical centers of index triples.
+
+        Radical centers, of equal powers w.r.t. 3 circles, are at infinity
+        for collinear centers.
+        """
+        triples: NDArray[np.intp] = np.asarray(triples, dtype=np.intp).reshape(-1, 3)  # noqa: E501
+
+        return meet(self.radical_axes(triples[:, :2]),
+                    self.radical_axes(triples[:, 1:]))
+
+    def candidate_pairs(self: Self, /) -> NDArray[np.intp]:
+        """Return (k, 2)-shaped index pairs (i < j) of overlapping circles.
+
+        Candidates are pairs of circles whose bounding boxes share cells of
+        a uniform grid, of cell size twice the median radius, and which are
+        within touching distance. Circles spanning too many cells are paired
+        on coarser grids among themselves & by sweeping along x with smaller
+        ones.
+        """
+        n: int = len(self)
+
+        # tolerances to keep tangent pairs
+        margins: NDArray[np.float64] = self.radii * (1 + _RTOL) + _RTOL * np.abs(self.centers).max(axis=-1, initial=0)  # noqa: E501
+
+        if not (codes := _candidate_codes(self.centers, margins, np.arange(n))):  # noqa: E501
+            return np.empty((0, 2), dtype=np.intp)
+
+        # pairs coded as i * n + j, deduplicated by sorting (faster than
+        # hash-based np.unique on many codes)
+        codes: NDArray[np.int64] = np.sort(np.concatenate(codes))
+        codes: NDArray[np.int64] = codes[np.diff(codes, prepend=-1) != 0]
+        pairs: NDArray[np.intp] = np.stack(np.divmod(codes, n), axis=-1)
+
+        # exact test of candidates
+        i, j = pairs.T
+        offsets: NDArray[np.float64] = self.centers[j] - self.centers[i]
+        touching: NDArray[np.bool_] = (np.hypot(offsets[:, 0], offsets[:, 1]) <= margins[i] + margins[j])  # noqa: E501
+
+        return pairs[touching]
+
+    def intersect_pairs(self: Self, pairs: ArrayLike, /) -> CircleIntersections:  # noqa: E501
+        """Intersect & classify (k, 2) index pairs of circles."""
+        pairs: NDArray[np.intp] = np.asarray(pairs, dtype=np.intp).reshape(-1, 2)  # noqa: E501
+        i, j = pairs.T
+
+        c1, c2 = self.centers[i], self.centers[j]
+        r1, r2 = self.radii[i], self.radii[j]
+
+        offsets: NDArray[np.float64] = c2 - c1
+        distances: NDArray[np.float64] = np.hypot(offsets[:, 0], offsets[:, 1])  # noqa: E501
+        tolerances: NDArray[np.float64] = _RTOL * (r1 + r2 + distances + np.abs(c1).max(axis=-1))  # noqa: E501
+
+        outer_gaps: NDArray[np.float64] = distances - (r1 + r2)
+        inner_gaps: NDArray[np.float64] = distances - np.abs(r1 - r2)
+
+        relations: NDArray[np.int8] = np.select(
+            ((distances <= tolerances) & (np.abs(r1 - r2) <= tolerances),
+             outer_gaps > tolerances,
+             outer_gaps >= -tolerances,
+             inner_gaps < -tolerances,
+             inner_gaps <= tolerances),
+            (COINCIDENT, DISJOINT, EXTERNALLY_TANGENT, CONTAINED, INTERNALLY_TANGENT),  # noqa: E501
+            INTERSECTING).astype(np.int8)
+
+        meeting: NDArray[np.bool_] = ((relations == EXTERNALLY_TANGENT) |
+                                      (relations == INTERSECTING) |
+                                      (relations == INTERNALLY_TANGENT))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            units: NDArray[np.float64] = offsets / distances[:, np.newaxis]
+            a: NDArray[np.float64] = (distances ** 2 + r1 ** 2 - r2 ** 2) / (2 * distances)  # noqa: E501
+
+        h: NDArray[np.float64] = np.where(relations == INTERSECTING, np.sqrt(np.maximum(r1 ** 2 - a ** 2, 0)), 0)  # noqa: E501
+
+        bases: NDArray[np.float64] = c1 + a[:, np.newaxis] * units
+        normals: NDArray[np.float64] = h[:, np.newaxis] * np.stack((-units[:, 1], units[:, 0]), axis=-1)  # noqa: E501
+
+        points: NDArray[np.float64] = np.stack((bases - normals, bases + normals), axis=1)  # noqa: E501
+        points[~meeting] = np.nan
+
+        return CircleIntersections(pairs, relations, points)
+
+    def intersect_all(self: Self, /) -> CircleIntersections:
+        """Intersect & classify all pairs of overlapping circles.
+
+        Pairs not reported, as pruned by `candidate_pairs`, are disjoint.
+        """
+        return self.intersect_pairs(self.candidate_pairs())
@@ -0,0 +1,447 @@
+"""Intersection of Conics with Linear Entities & with Other Conics in R2.
+
+Conics are given by their symmetric 3 x 3 matrices M (see `conic_matrix`).
+
+Linear entity `p + t d` meets conic M where quadratic
+
+    (P + t D)^T M (P + t D) = A t^2 + 2 B t + C = 0,
+
+for homogeneous P = (p, 1) & D = (d, 0), solved for many (conic, linear
+entity) pairs in one vectorized pass, with the cancellation-free roots
+`q / A` & `C / q` for `q = -(B + sign(B) sqrt(B^2 - A C))`.
+
+Conics A & B meet on all conics of their pencil `A + lambda B`; numerically,
+a real root of cubic `det(A + lambda B) = 0` gives a degenerate member, which
+is split into its 2 (possibly complex) lines, each of which is then
+intersected with conic A, in complex arithmetic. Symbolically, intersections
+are solved via the resultant of both equations.
+
+Numeric matrices & coordinates are processed as float64 arrays; symbolic
+(object) ones fall back to per-pair SymPy solutions, with exact parameter
+range checks.
+"""
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.core.symbol import Dummy
+from sympy.functions.elementary.miscellaneous import sqrt
+from sympy.polys.polytools import resultant
+from sympy.solvers.solvers import solve
+
+from .linear import (LinearEntityBatch, _array, _exact, _in_range, _is_zero,
+                     _symbolic_in_range)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__: Sequence[LiteralString] = ('ConicLineIntersections',
+                                    'ConicIntersections',
+                                    'intersect_conic_lines',
+                                    'intersect_conics', 'conic_cut_points')
+
+
+# relative tolerance of numeric discriminant & degeneracy checks
+_RTOL: float = 1e-12
+
+# relative tolerance of imaginary parts & distances of duplicate points,
+# as roots at tangencies are only accurate to about sqrt(float64 epsilon)
+_ROOT_RTOL: float = 1e-7
+
+_N_NEWTON_STEPS: int = 2
+
+
+@dataclass(frozen=True, slots=True)
+class ConicLineIntersections:
+    """Intersections of pairs of conics & linear entities.
+
+    Points & parameters, ascending per pair, are NaN (numeric) or None
+    (symbolic) where not real; tangent pairs have double roots, and contained
+    linear entities lie on their conics entirely. Points intersect if real
+    and their parameters are (provably, if symbolic) within their entities'
+    ranges.
+    """
+
+    points: NDArray
+    t: NDArray
+    tangent: NDArray[np.bool_]
+    contained: NDArray[np.bool_]
+    intersects: NDArray[np.bool_]
+
+
+@dataclass(frozen=True, slots=True)
+class ConicIntersections:
+    """Intersections of pairs of conics, as up to 4 distinct real points.
+
+    Points are NaN (numeric) or None (symbolic) where absent; coincident
+    pairs share components (i.e., infinitely many points), of which the
+    points reported are incomplete.
+    """
+
+    points: NDArray
+    real: NDArray[np.bool_]
+    coincident: NDArray[np.bool_]
+
+
+def _conic_line_coefficients(m: NDArray, p: NDArray, d: NDArray, /) -> tuple[NDArray, NDArray, NDArray]:  # noqa: E501
+    """Return A, B & C of A t^2 + 2 B t + C along p + t d."""
+    a: NDArray = m[..., :2, :2]
+    linear: NDArray = m[..., :2, 2]
+
+    ad: NDArray = (a * d[..., np.newaxis, :]).sum(axis=-1)
+    ap: NDArray = (a * p[..., np.newaxis, :]).sum(axis=-1) + linear
+
+    return ((ad * d).sum(axis=-1),
+            (ad * p).sum(axis=-1) + (linear * d).sum(axis=-1),
+            (ap * p).sum(axis=-1) + (linear * p).sum(axis=-1) + m[..., 2, 2])
+
+
+def _symbolic_quadratic_roots(a: Any, b: Any, c: Any, /) -> tuple[tuple[Any, Any], bool, bool]:  # noqa: E501
+    """Return roots (padded with None), tangency & containment."""
+    if _is_zero(a):
+        if _is_zero(b):
+            return (None, None), False, _is_zero(c)
+
+        return (-c / (2 * b), None), False, False
+
+    discriminant: Any = (b * b - a * c).expand()
+
+    if _is_zero(discriminant):
+        return (-b / a, -b / a), True, False
+
+    if discriminant.is_negative:
+        return (None, None), False, False
+
+    return ((-b - sqrt(discriminant)) / a, (-b + sqrt(discriminant)) / a), False, False  # noqa: E501
+
+
+def _intersect_conic_lines(m: NDArray, p: NDArray, d: NDArray,
+                           kinds: NDArray[np.int8], /) -> ConicLineIntersections:  # noqa: E501
+    a, b, c = _conic_line_coefficients(m, p, d)
+
+    if object in (a.dtype, b.dtype, c.dtype):
+        a, b, c = np.broadcast_arrays(np.asarray(a, dtype=object), np.asarray(b, dtype=object), np.asarray(c, dtype=object))  # noqa: E501
+
+        t: NDArray = np.empty((*a.shape, 2), dtype=object)
+        tangent: NDArray[np.bool_] = np.zeros(a.shape, dtype=bool)
+        contained: NDArray[np.bool_] = np.zeros(a.shape, dtype=bool)
+
+        for i in np.ndindex(a.shape):
+            (t[i][0], t[i][1]), tangent[i], contained[i] = _symbolic_quadratic_roots(a[i], b[i], c[i])  # noqa: E501
+
+        real: NDArray[np.bool_] = t != None  # noqa: E711
+        points: NDArray = np.where(real[..., np.newaxis], p[..., np.newaxis, :] + np.where(real, t, 0)[..., np.newaxis] * d[..., np.newaxis, :], None)  # noqa: E501
+
+        return ConicLineIntersections(points, t, tangent, contained,
+                                      intersects=(real &
+                                                  _symbolic_in_range(t, kinds[..., np.newaxis])))  # noqa: E501
+
+    # tolerances relative to magnitudes of terms
+    sq_d_norms: NDArray[np.float64] = (d * d).sum(axis=-1)
+    scales: NDArray[np.float64] = np.abs(m).max(axis=(-2, -1)) * (sq_d_norms + (p * p).sum(axis=-1) + 1)  # noqa: E501
+
+    discriminants: NDArray[np.float64] = b * b - a * c
+    tangent: NDArray[np.bool_] = np.abs(discriminants) <= _RTOL * scales ** 2
+    contained: NDArray[np.bool_] = ((np.abs(a) <= _RTOL * scales) &
+                                    (np.abs(b) <= _RTOL * scales) &
+                                    (np.abs(c) <= _RTOL * scales))
+
+    q: NDArray[np.float64] = -(b + np.copysign(np.sqrt(np.where(tangent, 0, np.maximum(discriminants, 0))), b))  # noqa: E501
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t: NDArray[np.float64] = np.stack(
+            (np.where(np.abs(a) <= _RTOL * scales, np.nan, q / a),
+             np.where(q == 0, np.where(np.abs(c) <= _RTOL * scales, 0, np.nan), c / q)),  # noqa: E501
+            axis=-1)
+
+    t[(discriminants < 0) & ~tangent] = np.nan
+    t[contained] = np.nan
+    t.sort(axis=-1)
+
+    points: NDArray[np.float64] = p[..., np.newaxis, :] + t[..., np.newaxis] * d[..., np.newaxis, :]  # noqa: E501
+
+    return ConicLineIntersections(points, t, tangent & ~contained, contained,
+                                  intersects=(~np.isnan(t) &
+                                              _in_range(t, kinds[..., np.newaxis])))  # noqa: E501
+
+
+def intersect_conic_lines(matrices: ArrayLike, lines: LinearEntityBatch, /) -> ConicLineIntersections:  # noqa: E501
+    """Intersect conics with linear entities, as (n, 2)-shaped root arrays.
+
+    Matrices may be a single (3, 3)-shaped conic, intersected with all
+    linear entities, or (n, 3, 3)-shaped ones, intersected pairwise.
+    """
+    m: NDArray = _array(matrices)
+
+    assert m.shape[-2:] == (3, 3) and m.ndim in (2, 3), \
+        ValueError(f'*** MATRICES OF SHAPE {m.shape} NEITHER OF SHAPE (3, 3) '
+                   'NOR (n, 3, 3) ***')
+
+    p, d = lines.origins, lines.directions
+
+    # float64 coordinates mixed in are converted exactly, not to Floats
+    if object in (m.dtype, p.dtype):
+        m: NDArray = np.asarray(matrices, dtype=object)
+        p, d = _exact(p), _exact(d)
+
+    return _intersect_conic_lines(m if m.ndim == 3 else m[np.newaxis],
+                                  p, d, lines.kinds)
+
+
+def _adjugates(m: NDArray, /) -> NDArray:
+    """Return adjugates of symmetric 3 x 3 matrices."""
+    def cofactor(i: int, j: int, /) -> NDArray:
+        (i0, i1), (j0, j1) = [k for k in range(3) if k != i], [k for k in range(3) if k != j]  # noqa: E501
+        return (-1) ** (i + j) * (m[..., i0, j0] * m[..., i1, j1] - m[..., i0, j1] * m[..., i1, j0])  # noqa: E501
+
+    return np.stack([np.stack([cofactor(j, i) for j in range(3)], axis=-1)
+                     for i in range(3)], axis=-2)
+
+
+def _cross_matrices(p: NDArray, /) -> NDArray:
+    zeros: NDArray = np.zeros_like(p[..., 0])
+
+    return np.stack((np.stack((zeros, -p[..., 2], p[..., 1]), axis=-1),
+                     np.stack((p[..., 2], zeros, -p[..., 0]), axis=-1),
+                     np.stack((-p[..., 1], p[..., 0], zeros), axis=-1)), axis=-2)  # noqa: E501
+
+
+def _take(m: NDArray, i: NDArray[np.intp], /) -> NDArray:
+    """Take i-th rows of batched matrices."""
+    return np.take_along_axis(m, i[..., np.newaxis, np.newaxis], axis=-2)[..., 0, :]  # noqa: E501
+
+
+def _split_degenerate(d: NDArray[np.complex128], /) -> tuple[NDArray[np.complex128], NDArray[np.complex128]]:  # noqa: E501
+    """Return (homogeneous) line pairs g & h of degenerate conics g h^T + h g^T.
+
+    As adj(D) = -p p^T for lines' intersection p = g x h, D + [p]_x = 2 h g^T
+    is of rank 1, of which nonzero rows & columns are g & h; double lines
+    D = l l^T have adj(D) = 0.
+    """
+    b: NDArray[np.complex128] = _adjugates(d)
+    b_diagonals: NDArray[np.complex128] = np.diagonal(b, axis1=-2, axis2=-1)
+    d_diagonals: NDArray[np.complex128] = np.diagonal(d, axis1=-2, axis2=-1)
+    scales: NDArray[np.float64] = np.abs(d).max(axis=(-2, -1))
+
+    # line pairs
+    i: NDArray[np.intp] = np.argmax(np.abs(b_diagonals), axis=-1)
+    b_ii: NDArray[np.complex128] = np.take_along_axis(b_diagonals, i[..., np.newaxis], axis=-1)[..., 0]  # noqa: E501
+    double: NDArray[np.bool_] = np.abs(b_ii) <= _RTOL * scales ** 2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p: NDArray[np.complex128] = _take(np.swapaxes(b, -2, -1), i) / np.sqrt(-b_ii)[..., np.newaxis]  # noqa: E501
+
+    c: NDArray[np.complex128] = d + _cross_matrices(np.where(double[..., np.newaxis], 0, p))  # noqa: E501
+    ij: NDArray[np.intp] = np.argmax(np.abs(c).reshape(*c.shape[:-2], 9), axis=-1)  # noqa: E501
+    g: NDArray[np.complex128] = _take(c, ij // 3)
+    h: NDArray[np.complex128] = _take(np.swapaxes(c, -2, -1), ij % 3)
+
+    # double lines
+    k: NDArray[np.intp] = np.argmax(np.abs(d_diagonals), axis=-1)
+    d_kk: NDArray[np.complex128] = np.take_along_axis(d_diagonals, k[..., np.newaxis], axis=-1)[..., 0]  # noqa: E501
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        line: NDArray[np.complex128] = _take(d, k) / np.sqrt(d_kk)[..., np.newaxis]  # noqa: E501
+
+    line: NDArray[np.complex128] = np.where(np.isfinite(line), line, 0)
+
+    return (np.where(double[..., np.newaxis], line, g),
+            np.where(double[..., np.newaxis], line, h))
+
+
+def _intersect_conic_homogeneous_lines(m: NDArray[np.complex128], lines: NDArray[np.complex128], /) -> tuple[NDArray[np.complex128], NDArray[np.bool_]]:  # noqa: E501
+    """Return (..., 2, 3)-shaped homogeneous intersections & containment.
+
+    With points u & v spanning each line, (s u + r v)^T M (s u + r v) =
+    a s^2 + 2 b s r + c r^2 = 0 has homogeneous roots (q : a) & (c : q).
+    """
+    # points spanning lines: meets with coordinate lines other than largest
+    k: NDArray[np.intp] = np.argmax(np.abs(lines), axis=-1)
+    basis: NDArray[np.float64] = np.eye(3)
+    u: NDArray[np.complex128] = np.cross(lines, basis[(k + 1) % 3])
+    v: NDArray[np.complex128] = np.cross(lines, basis[(k + 2) % 3])
+
+    mu: NDArray[np.complex128] = (m @ u[..., np.newaxis])[..., 0]
+    mv: NDArray[np.complex128] = (m @ v[..., np.newaxis])[..., 0]
+    a: NDArray[np.complex128] = (u * mu).sum(axis=-1)
+    b: NDArray[np.complex128] = (u * mv).sum(axis=-1)
+    c: NDArray[np.complex128] = (v * mv).sum(axis=-1)
+
+    scales: NDArray[np.float64] = np.abs(m).max(axis=(-2, -1)) * (np.abs(u).max(axis=-1) + np.abs(v).max(axis=-1)) ** 2  # noqa: E501
+    contained: NDArray[np.bool_] = (np.abs(a) <= _RTOL * scales) & (np.abs(b) <= _RTOL * scales) & (np.abs(c) <= _RTOL * scales)  # noqa: E501
+
+    root: NDArray[np.complex128] = np.sqrt(b * b - a * c)
+    q: NDArray[np.complex128] = -np.where(np.abs(b + root) >= np.abs(b - root), b + root, b - root)  # noqa: E501
+
+    return (np.stack((q[..., np.newaxis] * u + a[..., np.newaxis] * v,
+                      c[..., np.newaxis] * u + q[..., np.newaxis] * v), axis=-2),  # noqa: E501
+            contained)
+
+
+def _real_cubic_roots(a: NDArray[np.float64], b: NDArray[np.float64], c: NDArray[np.float64], /) -> NDArray[np.float64]:  # noqa: E501
+    """Return a real root of each x^3 + a x^2 + b x + c, in closed form.
+
+    Depressed cubics t^3 + p t + q (for x = t - a / 3) with 1 real root are
+    solved by Cardano's formula, those with 3 by the trigonometric one.
+    """
+    p: NDArray[np.float64] = b - a * a / 3
+    q: NDArray[np.float64] = (2 * a * a / 27 - b / 3) * a + c
+    discriminants: NDArray[np.float64] = (q / 2) ** 2 + (p / 3) ** 3
+
+    sqrt_discriminants: NDArray[np.float64] = np.sqrt(np.maximum(discriminants, 0))  # noqa: E501
+    cardano: NDArray[np.float64] = np.cbrt(-q / 2 + sqrt_discriminants) + np.cbrt(-q / 2 - sqrt_discriminants)  # noqa: E501
+
+    m: NDArray[np.float64] = 2 * np.sqrt(np.maximum(-p / 3, 0))
+    trigonometric: NDArray[np.float64] = m * np.cos(np.arccos(np.clip(3 * q / (p * m), -1, 1)) / 3)  # noqa: E501
+
+    return np.where(discriminants > 0, cardano, np.where(m > 0, trigonometric, cardano)) - a / 3  # noqa: E501
+
+
+def _normalized(m: NDArray[np.float64], /) -> NDArray[np.float64]:
+    i: NDArray[np.intp] = np.argmax(np.abs(m).reshape(*m.shape[:-2], 9), axis=-1)  # noqa: E501
+
+    return m / np.take_along_axis(m.reshape(*m.shape[:-2], 9), i[..., np.newaxis], axis=-1)[..., np.newaxis]  # noqa: E501
+
+
+def _numeric_intersect_conics(m1: NDArray[np.float64], m2: NDArray[np.float64], /) -> ConicIntersections:  # noqa: E501
+    # matrices normalized by their (signed) largest entries,
+    # so that proportional matrices, i.e., coincident conics, are equal
+    m1, m2 = np.broadcast_arrays(_normalized(m1), _normalized(m2))
+    proportional: NDArray[np.bool_] = (np.abs(m1 - m2) <= _ROOT_RTOL).all(axis=(-2, -1))  # noqa: E501
+
+    det1: NDArray[np.float64] = np.linalg.det(m1)
+    det2: NDArray[np.float64] = np.linalg.det(m2)
+    singular1: NDArray[np.bool_] = np.abs(det1) <= _RTOL
+    singular2: NDArray[np.bool_] = np.abs(det2) <= _RTOL
+
+    # cubic det(M1 + lambda M2) = det2 l^3 + c2 l^2 + c1 l + det1
+    plus: NDArray[np.float64] = np.linalg.det(m1 + m2)
+    minus: NDArray[np.float64] = np.linalg.det(m1 - m2)
+    c2: NDArray[np.float64] = (plus + minus) / 2 - det1
+    c1: NDArray[np.float64] = (plus - minus) / 2 - det2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        safe_det2: NDArray[np.float64] = np.where(singular2, 1, det2)
+        real_lambdas: NDArray[np.float64] = _real_cubic_roots(c2 / safe_det2, c1 / safe_det2, det1 / safe_det2)  # noqa: E501
+
+    # Newton refinement of simple roots
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(_N_NEWTON_STEPS):
+            values: NDArray[np.float64] = ((det2 * real_lambdas + c2) * real_lambdas + c1) * real_lambdas + det1  # noqa: E501
+            slopes: NDArray[np.float64] = (3 * det2 * real_lambdas + 2 * c2) * real_lambdas + c1  # noqa: E501
+            steps: NDArray[np.float64] = values / slopes
+            real_lambdas: NDArray[np.float64] = np.where(np.isfinite(steps), real_lambdas - steps, real_lambdas)  # noqa: E501
+
+    # degenerate members of pencils: singular conics themselves, if any
+    degenerates: NDArray[np.float64] = np.where(
+        singular2[..., np.newaxis, np.newaxis], m2,
+        np.where(singular1[..., np.newaxis, np.newaxis], m1,
+                 m1 + real_lambdas[..., np.newaxis, np.newaxis] * m2))
+    others: NDArray[np.float64] = np.where((singular1 & ~singular2)[..., np.newaxis, np.newaxis], m2, m1)  # noqa: E501
+
+    g, h = _split_degenerate(degenerates.astype(np.complex128))
+    homogeneous_points, contained = _intersect_conic_homogeneous_lines(
+        others[..., np.newaxis, :, :].astype(np.complex128), np.stack((g, h), axis=-2))  # noqa: E501
+    homogeneous_points: NDArray[np.complex128] = homogeneous_points.reshape(*det1.shape, 4, 3)  # noqa: E501
+
+    # real & finite points, normalized by their largest coordinates
+    k: NDArray[np.intp] = np.argmax(np.abs(homogeneous_points), axis=-1)[..., np.newaxis]  # noqa: E501
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized: NDArray[np.complex128] = homogeneous_points / np.take_along_axis(homogeneous_points, k, axis=-1)  # noqa: E501
+
+        real: NDArray[np.bool_] = (np.abs(normalized.imag).max(axis=-1) <= _ROOT_RTOL) & \
+            (np.abs(normalized[..., 2]) > _ROOT_RTOL)  # noqa: E501
+        points: NDArray[np.float64] = np.where(real[..., np.newaxis], normalized[..., :2].real / normalized[..., 2:].real, np.nan)  # noqa: E501
+
+    # distinct points only
+    for j in range(1, 4):
+        distances: NDArray[np.float64] = np.abs(points[..., :j, :] - points[..., j:j + 1, :]).max(axis=-1)  # noqa: E501
+        duplicate: NDArray[np.bool_] = (distances <= _ROOT_RTOL * (1 + np.abs(points[..., j:j + 1, :]).max(axis=-1))).any(axis=-1)  # noqa: E501
+        real[..., j] &= ~duplicate
+        points[..., j, :][duplicate] = np.nan
+
+    real[proportional] = False
+    points[proportional] = np.nan
+
+    return ConicIntersections(points, real,
+                              coincident=proportional | contained.any(axis=-1))  # noqa: E501
+
+
+def _symbolic_intersect_conics(m1: NDArray, m2: NDArray, /) -> tuple[list[tuple[Any, Any]], bool]:  # noqa: E501
+    """Return intersection points (not known to be non-real) & coincidence."""
+    x, y = Dummy('x'), Dummy('y')
+    p: NDArray = np.array((x, y, 1), dtype=object)
+
+    f1: Any = (p @ m1 @ p).expand()
+    f2: Any = (p @ m2 @ p).expand()
+
+    if (r := resultant(f1, f2, y).expand()).is_zero:
+        return [], True
+
+    points: list[tuple[Any, Any]] = []
+
+    for x0 in ((solve(r, x) if r.has(x) else []) or []):
+        # f1 is identically zero in y on vertical line components
+        g: Any = f1.subs(x, x0).expand() if f1.subs(x, x0).expand().has(y) else f2.subs(x, x0).expand()  # noqa: E501
+
+        for y0 in solve(g, y):
+            if _is_zero(f1.subs({x: x0, y: y0})) and _is_zero(f2.subs({x: x0, y: y0})) and \
+                    x0.is_real is not False and y0.is_real is not False and (x0, y0) not in points:  # noqa: E501
+                points.append((x0, y0))
+
+    return points, False
+
+
+def intersect_conics(matrices_a: ArrayLike, matrices_b: ArrayLike, /) -> ConicIntersections:  # noqa: E501
+    """Intersect pairs of conics, as (..., 4, 2)-shaped point arrays.
+
+    Matrices are (..., 3, 3)-shaped, broadcast against one another.
+    """
+    m1: NDArray = _array(matrices_a)
+    m2: NDArray = _array(matrices_b)
+
+    if object not in (m1.dtype, m2.dtype):
+        return _numeric_intersect_conics(m1, m2)
+
+    m1, m2 = np.broadcast_arrays(np.asarray(matrices_a, dtype=object),
+                                 np.asarray(matrices_b, dtype=object))
+    shape: tuple[int, ...] = m1.shape[:-2]
+
+    points: NDArray = np.full((*shape, 4, 2), None, dtype=object)
+    real: NDArray[np.bool_] = np.zeros((*shape, 4), dtype=bool)
+    coincident: NDArray[np.bool_] = np.zeros(shape, dtype=bool)
+
+    for i in np.ndindex(shape):
+        pair_points, coincident[i] = _symbolic_intersect_conics(m1[i], m2[i])
+
+        for j, point in enumerate(pair_points[:4]):
+            points[i][j] = point
+            real[i][j] = True
+
+    return ConicIntersections(points, real, coincident)
+
+
+def conic_cut_points(matrix: ArrayLike, other: Any, /) -> list[tuple[Any, Any]]:  # noqa: E501
+    """Return distinct real intersection points of conic & other entity.
+
+    Other entities are linear entities (lines, rays & segments) or conics
+    with `matrix` forms (e.g., ConicInR2s & CircleInR2s).
+    """
+    if (other_matrix := getattr(other, 'matrix', None)) is not None:
+        result: ConicIntersections = intersect_conics(matrix, other_matrix)
+        return [tuple(point) for point in result.points[result.real].tolist()]
+
+    result: ConicLineIntersections = intersect_conic_lines(matrix, LinearEntityBatch.from_entities([other]))  # noqa: E501
+
+    # double roots of tangents
+    points: NDArray = result.points[0][result.intersects[0]]
+    return [tuple(point) for point in points[:1 if result.tangent[0] else 2].tolist()]  # noqa: E501
@@ -0,0 +1,287 @@
+"""Bulk Intersection of Linear Entities (Lines, Rays & Segments) in R2.
+
+Each linear entity is represented by an origin `p`, a direction `d` and a
+kind restricting its parameter `t` along `p + t d` (unrestricted for lines,
+`t >= 0` for rays, `0 <= t <= 1` for segments). Intersections of many pairs
+are solved in one vectorized pass via 2D cross products: for `p + t d` and
+`q + u e`, with `w = q - p`,
+
+    t = (w x e) / (d x e),    u = (w x d) / (d x e),
+
+pairs being parallel when `d x e` vanishes, and coincident when additionally
+`w x d` vanishes.
+
+Numeric coordinates exactly representable in float64 are processed as
+float64 arrays; other exact numbers (e.g., Rational(1, 3)) & coordinates
+involving Variables fall back to symbolic object arrays, in which
+parallelism & parameter ranges are decided exactly, entities intersecting
+only where their ranges provably contain their parameters.
+"""
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.core.basic import Basic
+from sympy.core.numbers import Float, Rational
+from sympy.geometry.line import Ray2D, Segment2D
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Any, LiteralString, Self
+
+    from numpy.typing import ArrayLike, NDArray
+    from sympy.geometry.line import LinearEntity2D
+
+
+__all__: Sequence[LiteralString] = ('LINE', 'RAY', 'SEGMENT',
+                                    'LinearEntityBatch',
+                                    'LinearIntersections',
+                                    'intersect_pairwise', 'intersect_all')
+
+
+# kinds of linear entities
+LINE: int = 0
+RAY: int = 1
+SEGMENT: int = 2
+
+# relative tolerance of numeric parallelism & parameter range checks
+_RTOL: float = 1e-12
+
+
+def _array(values: ArrayLike, /) -> NDArray:
+    """Return float64 array if values are all numeric, else object one."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+
+    except (TypeError, ValueError):
+        return np.asarray(values, dtype=object)
+
+
+def _is_exact_float(value: Any, /) -> bool:
+    """Check whether numeric value is exactly representable in float64."""
+    if isinstance(value, (float, Float)):
+        return True
+
+    try:
+        return Rational(float(value)) == value
+
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+
+def _exact_array(values: ArrayLike, /) -> NDArray:
+    """Return float64 array if values are all exact in float64, else object one."""
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return _array(values)
+
+    objects: NDArray = np.asarray(values, dtype=object)
+
+    if all(_is_exact_float(value) for value in objects.flat):
+        return _array(objects)
+
+    return objects
+
+
+def _exact(values: NDArray, /) -> NDArray:
+    """Return object array with floats converted exactly to Rationals."""
+    return np.vectorize(lambda value: Rational(value) if isinstance(value, float) else value,  # noqa: E501
+                        otypes=[object])(values)
+
+
+def _kind(entity: LinearEntity2D, /) -> int:
+    if isinstance(entity, Segment2D):
+        return SEGMENT
+
+    if isinstance(entity, Ray2D):
+        return RAY
+
+    return LINE
+
+
+@dataclass(frozen=True, slots=True)
+class LinearEntityBatch:
+    """Batch of Linear Entities in R2, as structure of arrays."""
+
+    origins: NDArray
+    directions: NDArray
+    kinds: NDArray[np.int8]
+
+    @classmethod
+    def from_arrays(cls: type[Self], origins: ArrayLike, directions: ArrayLike,  # noqa: E501
+                    kinds: ArrayLike = LINE, /) -> Self:
+        """Create batch from (n, 2)-shaped origins & directions."""
+        origins_array: NDArray = _exact_array(origins)
+        directions_array: NDArray = _exact_array(directions)
+
+        # symbolic batches keep original (exact) numeric values
+        if object in (origins_array.dtype, directions_array.dtype):
+            origins, directions = np.asarray(origins, dtype=object), np.asarray(directions, dtype=object)  # noqa: E501
+
+        else:
+            origins, directions = origins_array, directions_array
+
+        assert origins.ndim == 2 and origins.shape[1] == 2 and \
+            origins.shape == directions.shape, \
+            ValueError(f'*** ORIGINS OF SHAPE {origins.shape} & DIRECTIONS '
+                       f'OF SHAPE {directions.shape} NOT BOTH OF SHAPE (n, 2) ***')  # noqa: E501
+
+        return cls(origins, directions,
+                   np.broadcast_to(np.asarray(kinds, dtype=np.int8),
+                                   len(origins)))
+
+    @classmethod
+    def from_entities(cls: type[Self], entities: Iterable[LinearEntity2D], /) -> Self:  # noqa: E501
+        """Create batch from LineInR2s, RayInR2s & SegmentInR2s.
+
+        Lines & rays through points at infinity are supported, as their
+        second defining points are then offset from their first ones by the
+        points at infinity's directions.
+        """
+        entities: list[LinearEntity2D] = list(entities)
+
+        return cls.from_arrays(
+            np.reshape([entity.p1.args for entity in entities], (-1, 2)),
+            np.reshape([entity.direction.args for entity in entities], (-1, 2)),  # noqa: E501
+            [_kind(entity) for entity in entities])
+
+    def __len__(self: Self, /) -> int:
+        """Return number of linear entities."""
+        return len(self.origins)
+
+    @property
+    def symbolic(self: Self, /) -> bool:
+        """Check if coordinates are symbolic (object) rather than float64."""
+        return self.origins.dtype == object
+
+
+@dataclass(frozen=True, slots=True)
+class LinearIntersections:
+    """Intersections of pairs of linear entities.
+
+    Points & parameters are NaN (numeric) or None (symbolic) for parallel
+    pairs; coincident pairs are flagged as parallel too. Pairs intersect if
+    not parallel and both parameters are within their entities' ranges.
+    """
+
+    points: NDArray
+    t: NDArray
+    u: NDArray
+    parallel: NDArray[np.bool_]
+    coincident: NDArray[np.bool_]
+    intersects: NDArray[np.bool_]
+
+
+def _cross(a: NDArray, b: NDArray, /) -> NDArray:
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def _is_zero(value: Any, /) -> bool:
+    if isinstance(value, Basic):
+        return value.expand().is_zero is True
+
+    return value == 0
+
+
+_symbolic_is_zero: np.ufunc = np.frompyfunc(_is_zero, 1, 1)
+
+
+def _in_range(params: NDArray[np.float64], kinds: NDArray[np.int8], /) -> NDArray[np.bool_]:  # noqa: E501
+    return ((kinds == LINE) |
+            ((params >= -_RTOL) & ((kinds == RAY) | (params <= 1 + _RTOL))))
+
+
+def _is_nonnegative(value: Any, /) -> bool:
+    if isinstance(value, Basic):
+        return value.is_nonnegative is True
+
+    return value >= 0
+
+
+def _symbolic_in_range(params: NDArray, kinds: NDArray[np.int8], /) -> NDArray[np.bool_]:  # noqa: E501
+    """Check which (possibly None) symbolic parameters are provably in range."""
+    params, kinds = np.broadcast_arrays(params, kinds)
+
+    return np.array([kind == LINE or
+                     (param is not None and _is_nonnegative(param) and
+                      (kind == RAY or _is_nonnegative(1 - param)))
+                     for param, kind in zip(params.flat, kinds.flat)],
+                    dtype=bool).reshape(params.shape)
+
+
+def _intersect(p: NDArray, d: NDArray, kinds_a: NDArray[np.int8],
+               q: NDArray, e: NDArray, kinds_b: NDArray[np.int8], /) -> LinearIntersections:  # noqa: E501
+    w: NDArray = q - p
+    denominators: NDArray = _cross(d, e)
+    t_numerators: NDArray = _cross(w, e)
+    u_numerators: NDArray = _cross(w, d)
+
+    if object in (denominators.dtype, t_numerators.dtype):
+        # float64 coordinates mixed in are converted exactly, not to Floats
+        p, d, q, e = _exact(p), _exact(d), _exact(q), _exact(e)
+        w: NDArray = q - p
+        denominators: NDArray = _cross(d, e)
+        t_numerators: NDArray = _cross(w, e)
+        u_numerators: NDArray = _cross(w, d)
+
+        parallel: NDArray[np.bool_] = _symbolic_is_zero(denominators).astype(bool)  # noqa: E501
+        coincident: NDArray[np.bool_] = parallel & _symbolic_is_zero(u_numerators).astype(bool)  # noqa: E501
+
+        safe_denominators: NDArray = np.where(parallel, 1, denominators)
+        t: NDArray = np.where(parallel, None, t_numerators / safe_denominators)
+        u: NDArray = np.where(parallel, None, u_numerators / safe_denominators)
+        points: NDArray = np.where(parallel[..., np.newaxis], None,
+                                   p + np.where(parallel, 0, t)[..., np.newaxis] * d)  # noqa: E501
+
+        return LinearIntersections(points, t, u, parallel, coincident,
+                                   intersects=(~parallel &
+                                               _symbolic_in_range(t, kinds_a) &
+                                               _symbolic_in_range(u, kinds_b)))
+
+    d_norms: NDArray[np.float64] = np.hypot(d[..., 0], d[..., 1])
+    e_norms: NDArray[np.float64] = np.hypot(e[..., 0], e[..., 1])
+    w_norms: NDArray[np.float64] = np.hypot(w[..., 0], w[..., 1])
+
+    parallel: NDArray[np.bool_] = np.abs(denominators) <= _RTOL * d_norms * e_norms  # noqa: E501
+    coincident: NDArray[np.bool_] = parallel & (np.abs(u_numerators) <= _RTOL * w_norms * d_norms)  # noqa: E501
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t: NDArray[np.float64] = np.where(parallel, np.nan, t_numerators / denominators)  # noqa: E501
+        u: NDArray[np.float64] = np.where(parallel, np.nan, u_numerators / denominators)  # noqa: E501
+
+    points: NDArray[np.float64] = p + t[..., np.newaxis] * d
+
+    return LinearIntersections(points, t, u, parallel, coincident,
+                               intersects=(~parallel &
+                                           _in_range(t, kinds_a) &
+                                           _in_range(u, kinds_b)))
+
+
+def intersect_pairwise(batch_a: LinearEntityBatch, batch_b: LinearEntityBatch, /) -> LinearIntersections:  # noqa: E501
+    """Intersect i-th linear entities of 2 equally long batches."""
+    assert len(batch_a) == len(batch_b), \
+        ValueError(f'*** BATCHES OF DIFFERENT LENGTHS {len(batch_a)} '
+                   f'& {len(batch_b)} ***')
+
+    return _intersect(batch_a.origins, batch_a.directions, batch_a.kinds,
+                      batch_b.origins, batch_b.directions, batch_b.kinds)
+
+
+def intersect_all(batch_a: LinearEntityBatch,
+                  batch_b: LinearEntityBatch | None = None, /) -> LinearIntersections:  # noqa: E501
+    """Intersect all pairs across 2 batches, as (n_a, n_b)-shaped arrays.
+
+    Pairs are within batch A itself if batch B is not given.
+    """
+    if batch_b is None:
+        batch_b: LinearEntityBatch = batch_a
+
+    return _intersect(batch_a.origins[:, np.newaxis],
+                      batch_a.directions[:, np.newaxis],
+                      batch_a.kinds[:, np.newaxis],
+                      batch_b.origins[np.newaxis],
+                      batch_b.directions[np.newaxis],
+                      batch_b.kinds[np.newaxis])
@@ -0,0 +1,177 @@
+"""Sweep-Line (Bentley-Ottmann) Detection of All Segment Intersections in R2.
+
+A vertical sweep line moves left to right (then bottom to top along vertical
+lines) through event points: segments' endpoints, and intersection points of
+segments found adjacent along the sweep line. At each event point, all
+segments starting, ending or passing through it are reported together, so
+shared endpoints, vertical segments and multiple concurrent segments are
+handled uniformly; collinear overlapping segments are reported at the
+endpoints of their overlaps.
+
+Coordinates are converted exactly to `Fraction`s (floats included), so all
+predicates & intersection points are exact and free of rounding failures.
+
+For N segments with K intersection points, the event queue & the binary
+searches of the sweep status take O((N + K) log N) comparisons. The status is
+however a plain list, spliced at each event, so the worst-case total time is
+O((N + K) N); splices are memory moves of at most N references, so the
+quadratic term has a small constant for practical N.
+"""
+
+
+from __future__ import annotations
+
+from fractions import Fraction
+import heapq
+from typing import TYPE_CHECKING
+
+from sympy.core.numbers import Float, Rational
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import Any, LiteralString
+
+    type _Point = tuple[Fraction, Fraction]
+
+
+__all__: Sequence[LiteralString] = ('segment_intersections',)
+
+
+def _fraction(value: Any, /) -> Fraction:
+    """Convert numeric coordinate exactly."""
+    if isinstance(value, Rational):
+        return Fraction(int(value.p), int(value.q))
+
+    if isinstance(value, Float):
+        return Fraction(float(value))
+
+    return Fraction(value)
+
+
+def _endpoints(segment: Any, /) -> tuple[_Point, _Point]:
+    """Return (start, end) of segment, lexicographically ordered."""
+    # SymPy segments (incl. SegmentInR2s), else pairs of coordinate pairs
+    p, q = (segment.args if hasattr(segment, 'args') else segment)
+
+    p: _Point = _fraction(p[0]), _fraction(p[1])
+    q: _Point = _fraction(q[0]), _fraction(q[1])
+
+    return (p, q) if p <= q else (q, p)
+
+
+def _intersection(a: tuple[_Point, _Point], b: tuple[_Point, _Point], /) -> _Point | None:  # noqa: E501
+    """Return single intersection point of 2 segments, if any."""
+    ((px, py), (p2x, p2y)), ((qx, qy), (q2x, q2y)) = a, b
+
+    dx, dy, ex, ey = p2x - px, p2y - py, q2x - qx, q2y - qy
+
+    # parallel, incl. collinear (overlaps are reported at endpoint events)
+    if not (denominator := dx * ey - dy * ex):
+        return None
+
+    wx, wy = qx - px, qy - py
+    t: Fraction = (wx * ey - wy * ex) / denominator
+    u: Fraction = (wx * dy - wy * dx) / denominator
+
+    if 0 <= t <= 1 and 0 <= u <= 1:
+        return px + t * dx, py + t * dy
+
+    return None
+
+
+def segment_intersections(segments: Iterable[Any], /,
+                          *, exact: bool = False) -> Iterator[tuple[tuple[Any, Any], tuple[int, ...]]]:  # noqa: C901,E501
+    """Yield (point, indices of segments through it) for all intersections.
+
+    Segments may be SymPy segments (e.g., SegmentInR2s) or pairs of
+    numeric coordinate pairs. Points are yielded as float coordinates, or as
+    exact `Fraction`s if so specified, in sweep order; each point is yielded
+    once, together with all (at least 2) segments containing it.
+    """
+    endpoints: list[tuple[_Point, _Point]] = [_endpoints(segment)
+                                              for segment in segments]
+
+    # slopes, None for vertical segments
+    slopes: list[Fraction | None] = [(q[1] - p[1]) / (q[0] - p[0])
+                                     if q[0] != p[0]
+                                     else None
+                                     for p, q in endpoints]
+
+    # event queue & segments starting at each event point
+    events: list[_Point] = []
+    queued: set[_Point] = set()
+    starts: dict[_Point, list[int]] = {}
+
+    def enqueue(point: _Point, /) -> None:
+        if point not in queued:
+            queued.add(point)
+            heapq.heappush(events, point)
+
+    for i, (p, q) in enumerate(endpoints):
+        starts.setdefault(p, []).append(i)
+        enqueue(p)
+        enqueue(q)
+
+    # segments crossing sweep line, ordered bottom to top
+    # (spliced in O(N) per event, rather than kept in a balanced tree)
+    status: list[int] = []
+
+    def y_at(i: int, x: Fraction, y: Fraction, /) -> Fraction:
+        # vertical segments are positioned at current event point
+        if (slope := slopes[i]) is None:
+            return y
+
+        (x0, y0), _ = endpoints[i]
+        return y0 + (x - x0) * slope
+
+    def find_event(i: int, j: int, point: _Point, /) -> None:
+        intersection_point: _Point | None = _intersection(endpoints[i], endpoints[j])  # noqa: E501
+
+        if intersection_point is not None and intersection_point > point:
+            enqueue(intersection_point)
+
+    def order_after(i: int, /) -> tuple[bool, Fraction]:
+        # order just after event point: by slope, vertical segments last
+        return (slope := slopes[i]) is None, slope or 0
+
+    while events:
+        point: _Point = heapq.heappop(events)
+        queued.discard(point)
+        x, y = point
+
+        # locate contiguous run of status segments containing event point
+        lo, hi = 0, len(status)
+        while lo < hi:
+            if y_at(status[mid := (lo + hi) // 2], x, y) < y:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        hi: int = lo
+        while hi < len(status) and y_at(status[hi], x, y) == y:
+            hi += 1
+
+        upper: list[int] = starts.pop(point, [])
+        containing: list[int] = status[lo:hi]
+
+        if len(upper) + len(containing) > 1:
+            yield ((x, y) if exact else (float(x), float(y)),
+                   tuple(sorted({*upper, *containing})))
+
+        # re-insert segments continuing beyond event point, in new order
+        continuing: list[int] = sorted((i
+                                        for i in (*containing, *upper)
+                                        if endpoints[i][1] != point),
+                                       key=order_after)
+
+        status[lo:hi] = continuing
+
+        if continuing:
+            if lo > 0:
+                find_event(status[lo - 1], continuing[0], point)
+
+            if (k := lo + len(continuing)) < len(status):
+                find_event(continuing[-1], status[k], point)
+
+        elif 0 < lo < len(status):
+            find_event(status[lo - 1], status[lo], point)
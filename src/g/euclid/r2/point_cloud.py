@@ -0,0 +1,28 @@
+"""Array-backed Point Cloud in R2."""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._abc._point_cloud import _PointCloudABC
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, LiteralString
+
+
+__all__: Sequence[LiteralString] = ('PointCloudR2',)
+
+
+class PointCloudR2(_PointCloudABC):
+    """Array-backed Point Cloud in R2."""
+
+    _N_DIMS: int = 2
+
+    __slots__: Sequence[LiteralString] = ()
+
+    @staticmethod
+    def _point_coords(point: Any, /) -> tuple[Any, ...]:
+        """Return coordinates of individual point."""
+        return point.x, point.y
@@ -0,0 +1,229 @@
+"""Vectorized Sampling of Parametric Curves & Surfaces.
+
+Entities' parametric equations are residuals `X - f(t)`, `Y - g(t)` (, ...)
+in coordinate symbols & parameters. Their coordinate functions are compiled
+once, via `lambdify`, into vectorized callables taking the parameters and
+all other free symbols (e.g., Variables) as arguments, and cached by
+expression, so that sampling under many different Variable bindings never
+recompiles.
+
+Curves can also be sampled adaptively, for rendering: parameter intervals
+are bisected, in batches of all intervals pending at once, until their
+chords deviate from curves by at most a (screen-space) tolerance, so that
+numbers of points grow with curves' visual complexity rather than with a
+fixed resolution.
+"""
+
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy.core.sorting import default_sort_key
+from sympy.utilities.lambdify import lambdify
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+    from typing import Any, LiteralString
+
+    from numpy.typing import ArrayLike, NDArray
+    from sympy.core.expr import Expr
+    from sympy.core.symbol import Symbol
+
+
+__all__: Sequence[LiteralString] = ('DEFAULT_N_SAMPLES', 'DEFAULT_TOLERANCE',
+                                    'compile_parametric', 'sample_parametric',
+                                    'sample_adaptive')
+
+
+DEFAULT_N_SAMPLES: int = 256
+
+# default maximum chord deviation of adaptive sampling, e.g., in pixels
+DEFAULT_TOLERANCE: float = .25
+
+# defaults of adaptive sampling: initial intervals, initial intervals per
+# streamed chunk & maximum number of bisections of initial intervals
+_N_INITIAL_INTERVALS: int = 32
+_N_INTERVALS_PER_CHUNK: int = 8
+_MAX_DEPTH: int = 20
+
+
+@cache
+def compile_parametric(coord_funcs: tuple[Expr, ...], parameters: tuple[Symbol, ...],  # noqa: E501
+                       backend: str = 'numpy') -> tuple[Callable[..., Any], tuple[Symbol, ...]]:  # noqa: E501
+    """Compile coordinate functions of parameters into vectorized callable.
+
+    Return callable & free symbols other than parameters, which the callable
+    takes as further arguments, after parameters.
+    """
+    free_symbols: tuple[Symbol, ...] = tuple(sorted(
+        set().union(*(func.free_symbols for func in coord_funcs)) - set(parameters),  # noqa: E501
+        key=default_sort_key))
+
+    return (lambdify((*parameters, *free_symbols), coord_funcs, modules=backend),  # noqa: E501
+            free_symbols)
+
+
+def _binding(symbol: Symbol, bindings: Mapping[Symbol, Any], /) -> Any:
+    if symbol in bindings:
+        return bindings[symbol]
+
+    # Variables bound to numeric expressions
+    if (expr := getattr(symbol, 'expr', None)) is not None and expr.is_number:
+        return float(expr)
+
+    raise ValueError(f'*** UNBOUND SYMBOL {symbol} ***')
+
+
+def _evaluator(residuals: Sequence[Expr], coords: Sequence[Symbol],
+               parameters: Sequence[Symbol], bindings: Mapping[Symbol, Any] | None,  # noqa: E501
+               backend: str, /) -> Callable[..., NDArray[np.float64]]:
+    """Return callable mapping parameters' (n,)-shaped values to samples."""
+    # coordinate functions f(t) = X - (X - f(t))
+    func, free_symbols = compile_parametric(
+        tuple(coord - residual for coord, residual in zip(coords, residuals)),
+        tuple(parameters), backend)
+
+    bindings: Mapping[Symbol, Any] = bindings or {}
+    args: tuple[Any, ...] = tuple(_binding(symbol, bindings) for symbol in free_symbols)  # noqa: E501
+
+    def evaluate(*values: NDArray[np.float64]) -> NDArray[np.float64]:
+        with np.errstate(all='ignore'):
+            samples: tuple[Any, ...] = func(*values, *args)
+
+        # constant coordinates evaluate to scalars
+        return np.stack([np.broadcast_to(np.asarray(sample, dtype=np.float64), values[0].shape)  # noqa: E501
+                         for sample in samples], axis=-1)
+
+    return evaluate
+
+
+def sample_parametric(residuals: Sequence[Expr], coords: Sequence[Symbol],
+                      parameters: Sequence[Symbol],
+                      n_or_values: int | ArrayLike = DEFAULT_N_SAMPLES, /,
+                      domain: Sequence[tuple[float, float]] = ((0, 1),),
+                      *, bindings: Mapping[Symbol, Any] | None = None,
+                      backend: str = 'numpy') -> NDArray[np.float64]:
+    """Return (n, d)-shaped samples of parametric residuals' zero set.
+
+    Samples are at n evenly-spaced parameter values over domain (on an n^k
+    grid for k parameters), or at given (n,)- or (n, k)-shaped values.
+    """
+    if isinstance(n_or_values, int):
+        assert n_or_values > 0, \
+            ValueError(f'*** NUMBER OF SAMPLES {n_or_values} NOT POSITIVE ***')  # noqa: E501
+
+        grids: list[NDArray[np.float64]] = np.meshgrid(
+            *(np.linspace(lo, hi, n_or_values) for lo, hi in domain))
+
+        values: NDArray[np.float64] = np.stack([grid.ravel() for grid in grids], axis=-1)  # noqa: E501
+
+    else:
+        values: NDArray[np.float64] = np.asarray(n_or_values, dtype=np.float64).reshape(-1, len(parameters))  # noqa: E501
+
+    return _evaluator(residuals, coords, parameters, bindings, backend)(*values.T)  # noqa: E501
+
+
+def _chord_deviations(left: NDArray[np.float64], right: NDArray[np.float64],
+                      mid: NDArray[np.float64], /) -> NDArray[np.float64]:
+    """Return distances of midpoints from chords (segments) of intervals."""
+    chords: NDArray[np.float64] = right - left
+    offsets: NDArray[np.float64] = mid - left
+    sq_lengths: NDArray[np.float64] = (chords * chords).sum(axis=-1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fractions: NDArray[np.float64] = np.clip(np.where(sq_lengths > 0, (offsets * chords).sum(axis=-1) / sq_lengths, 0), 0, 1)  # noqa: E501
+
+        return np.linalg.norm(offsets - fractions[:, np.newaxis] * chords, axis=-1)  # noqa: E501
+
+
+def _refine(evaluate: Callable[..., NDArray[np.float64]], knots: NDArray[np.float64],  # noqa: E501
+            tolerance: float, max_depth: int,
+            bounds: tuple[NDArray[np.float64], NDArray[np.float64]] | None, /) -> Iterator[NDArray[np.float64]]:  # noqa: E501
+    """Yield polylines over knots' intervals, bisected until flat.
+
+    Intervals still not flat after max_depth bisections (e.g., across
+    asymptotes) or with non-finite or out-of-bounds points break polylines.
+    """
+    def visible(points: NDArray[np.float64], /) -> NDArray[np.bool_]:
+        if bounds is None:
+            return np.isfinite(points).all(axis=-1)
+
+        return ((points >= bounds[0]) & (points <= bounds[1])).all(axis=-1)
+
+    t_left, t_right = knots[:-1], knots[1:]
+    points: NDArray[np.float64] = evaluate(knots)
+    p_left, p_right = points[:-1], points[1:]
+
+    accepted: list[tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], NDArray[np.bool_]]] = []  # noqa: E501
+
+    for depth in range(max_depth + 1):
+        t_mid: NDArray[np.float64] = (t_left + t_right) / 2
+        p_mid: NDArray[np.float64] = evaluate(t_mid)
+
+        visibles: tuple[NDArray[np.bool_], ...] = visible(p_left), visible(p_right), visible(p_mid)  # noqa: E501
+        flat: NDArray[np.bool_] = (visibles[0] & visibles[1] & visibles[2] &
+                                   (_chord_deviations(p_left, p_right, p_mid) <= tolerance))  # noqa: E501
+
+        # partly visible intervals are bisected towards singularities/bounds
+        vanished: NDArray[np.bool_] = ~(visibles[0] | visibles[1] | visibles[2])  # noqa: E501
+        done: NDArray[np.bool_] = flat | vanished | (depth == max_depth)
+        accepted.append((t_left[done], p_left[done], p_right[done], flat[done]))  # noqa: E501
+
+        # bisect others
+        split: NDArray[np.bool_] = ~done
+        t_left, t_right = (np.concatenate((t_left[split], t_mid[split])),
+                           np.concatenate((t_mid[split], t_right[split])))
+        p_left, p_right = (np.concatenate((p_left[split], p_mid[split])),
+                           np.concatenate((p_mid[split], p_right[split])))
+
+        if not len(t_left):
+            break
+
+    # polylines of consecutive flat intervals
+    t_starts, starts, ends, connected = (np.concatenate(arrays) for arrays in zip(*accepted))  # noqa: E501
+    order: NDArray[np.intp] = np.argsort(t_starts, kind='stable')
+    starts, ends, connected = starts[order], ends[order], connected[order]
+
+    breaks: NDArray[np.intp] = np.flatnonzero(~connected)
+
+    for lo, hi in zip(np.concatenate(([-1], breaks)) + 1, np.concatenate((breaks, [len(connected)]))):  # noqa: E501
+        if hi > lo:
+            yield np.concatenate((starts[lo:hi], ends[hi - 1:hi]))
+
+
+def sample_adaptive(residuals: Sequence[Expr], coords: Sequence[Symbol],
+                    parameter: Symbol, domain: tuple[float, float] = (0, 1), /,  # noqa: E501
+                    tolerance: float = DEFAULT_TOLERANCE,
+                    *, scale: float = 1.,
+                    n_initial_intervals: int = _N_INITIAL_INTERVALS,
+                    n_intervals_per_chunk: int = _N_INTERVALS_PER_CHUNK,
+                    max_depth: int = _MAX_DEPTH,
+                    bounds: tuple[ArrayLike, ArrayLike] | None = None,
+                    bindings: Mapping[Symbol, Any] | None = None,
+                    backend: str = 'numpy') -> Iterator[NDArray[np.float64]]:
+    """Yield (k, d)-shaped polyline chunks of parametric curve, adaptively.
+
+    Initial intervals, evenly spaced over domain, are bisected until their
+    midpoints deviate from their chords by at most tolerance, in units of
+    coordinates times scale (e.g., pixels per unit, for screen-space
+    tolerances). Chunks are streamed in parameter order, every few initial
+    intervals; consecutive ones share endpoints unless curves break there,
+    e.g., at non-finite points or across asymptotes. Unbounded curves (e.g.,
+    parabolas & hyperbolas) should be clipped to (lower, upper) corners of
+    bounds (e.g., viewports), outside of which they are not refined.
+    """
+    assert tolerance > 0 and scale > 0, \
+        ValueError(f'*** TOLERANCE {tolerance} OR SCALE {scale} NOT POSITIVE ***')  # noqa: E501
+
+    evaluate: Callable[..., NDArray[np.float64]] = _evaluator(residuals, coords, (parameter,), bindings, backend)  # noqa: E501
+
+    if bounds is not None:
+        bounds: tuple[NDArray[np.float64], NDArray[np.float64]] = tuple(np.asarray(corner, dtype=np.float64) for corner in bounds)  # noqa: E501
+
+    knots: NDArray[np.float64] = np.linspace(*domain, n_initial_intervals + 1)
+    for i in range(0, n_initial_intervals, n_intervals_per_chunk):
+        yield from _refine(evaluate, knots[i:i + n_intervals_per_chunk + 1],
+                           tolerance / scale, max_depth, bounds)
@@ -7,7 +7,8 @@ from typing import TYPE_CHECKING
 
 from sympy.assumptions.assume import AssumptionsContext
 
-from ._core import AnEntity
+from ._core import AnEntity, AConcretePoint
+from ._core._entity.dependency_index import DEPENDENCY_INDEX
 
 from ._alg.abc import _AlgBackendABC
 from ._alg.sympy import SymPyBackend
@@ -15,11 +16,12 @@ from ._alg.sympy import SymPyBackend
 from ._art.abc import _ArtFrontendABC
 from ._art.manim import MAnimFrontend
 
+from ._util.spatial_index import SpatialIndex
 from ._util.type import OptionalStr
-from ._util.unique_name import UNIQUE_NAME_FACTORY
+from ._util.unique_name import UniqueNameFactory, UNIQUE_NAME_FACTORY
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
     from typing import Any, LiteralString, Self
 
     from ._core import ASpace
@@ -34,7 +36,8 @@ class Session:
     def __init__(self: Self, name: OptionalStr = None, /, *,
                  ambient_space: ASpace = None,
                  alg_backend: _AlgBackendABC = SymPyBackend(),
-                 art_frontend: _ArtFrontendABC = MAnimFrontend()) -> None:
+                 art_frontend: _ArtFrontendABC = MAnimFrontend(),
+                 name_factory: UniqueNameFactory | None = None) -> None:
         """Initialize session."""
         # assign name
         self.name: str = UNIQUE_NAME_FACTORY() if name is None else name
@@ -42,13 +45,26 @@ class Session:
         # assign ambient space
         self.ambient_space: ASpace = ambient_space
 
-        # assign algebra backend & art frontend
+        # assign algebra backend (for callers' coordinate computations, not
+        # used by entities' own constructions) & art frontend
+        assert isinstance(alg_backend, _AlgBackendABC), \
+            TypeError(f'*** {alg_backend} NOT OF TYPE {_AlgBackendABC.__name__} ***')  # noqa: E501
+
         self.alg_backend: _AlgBackendABC = alg_backend
         self.art_frontend: _ArtFrontendABC = art_frontend
 
         # initialize entities collection
         self.entities: dict[str, AnEntity] = dict[str, AnEntity]()
 
+        # initialize unique name factory, skipping names of own entities
+        self.name_factory: UniqueNameFactory = (UniqueNameFactory()
+                                                if name_factory is None
+                                                else name_factory)
+        self.name_factory.watch(self.entities)
+
+        # initialize lazily-built spatial indexes, by number of dimensions
+        self._spatial_indexes: dict[int, SpatialIndex] = {}
+
         # initialize SymPy assumptions
         self.sympy_assumptions: AssumptionsContext = AssumptionsContext()
 
@@ -58,6 +74,10 @@ class Session:
 
     __str__: Callable[[Self], str] = __repr__
 
+    def unique_name(self: Self, prefix: OptionalStr = None, /) -> str:
+        """Return new entity name unique within session."""
+        return self.name_factory(prefix)
+
     def _assign_entity(self: Self, name: str, entity: AnEntity, /,
                        *, validate_type: bool = True) -> None:
         """Assign entity."""
@@ -75,6 +95,76 @@ class Session:
         # add entity to session's entities collection
         self.entities[name]: AnEntity = entity
 
+        # (re-)index or un-index entity name in spatial indexes
+        for n_dims, spatial_index in self._spatial_indexes.items():
+            if (coords := _numeric_point_coords(entity, n_dims)) is None:
+                spatial_index.remove(name)
+            else:
+                spatial_index.insert(name, coords)
+
+    def _delete_entity(self: Self, name: str, /) -> None:
+        """Delete entity by name."""
+        del self.entities[name]
+
+        for spatial_index in self._spatial_indexes.values():
+            spatial_index.remove(name)
+
+    def spatial_index(self: Self, dim: int = 2, /) -> SpatialIndex:
+        """Return KD-tree spatial index of numeric concrete points' names.
+
+        The index is built upon first request, and kept up to date as
+        entities are subsequently assigned or deleted.
+        """
+        assert dim in (2, 3), ValueError(f'*** DIMENSION {dim} NOT 2 OR 3 ***')
+
+        if (spatial_index := self._spatial_indexes.get(dim)) is None:
+            spatial_index: SpatialIndex = SpatialIndex(
+                dim,
+                ((name, coords)
+                 for name, entity in self.entities.items()
+                 if (coords := _numeric_point_coords(entity, dim)) is not None))  # noqa: E501
+
+            self._spatial_indexes[dim] = spatial_index
+
+        return spatial_index
+
+    def _owned(self: Self, entities: Iterable[AnEntity], /) -> list[AnEntity]:  # noqa: E501
+        """Return entities of session."""
+        return [entity for entity in entities if entity.session is self]
+
+    def dependents(self: Self, entity: AnEntity, /) -> list[AnEntity]:
+        """Return session's entities directly depending on given entity."""
+        return self._owned(DEPENDENCY_INDEX.dependents(entity))
+
+    def transitive_dependents(self: Self, entity: AnEntity, /) -> list[AnEntity]:  # noqa: E501
+        """Return session's entities depending, directly or not, on given one.
+
+        Entities of other sessions are only traversed, not returned.
+        """
+        return self._owned(DEPENDENCY_INDEX.transitive_dependents(entity))
+
+    def topological_order(self: Self, /) -> list[AnEntity]:
+        """Return session's named entities, each after all its dependencies.
+
+        Unnamed intermediate entities & entities of other sessions are only
+        traversed, not returned.
+        """
+        return DEPENDENCY_INDEX.topological_order(self.entities.values())
+
+    def propagate_change(self: Self, entity: AnEntity, /) -> list[AnEntity]:
+        """Invalidate cached properties of entities downstream of changed one.
+
+        Only the affected sub-graph is visited; cleared values are recomputed
+        lazily upon next access. As dependents may belong to other sessions,
+        all of them are invalidated. Return affected entities.
+        """
+        affected_entities: list[AnEntity] = DEPENDENCY_INDEX.transitive_dependents(entity)  # noqa: E501
+
+        for affected_entity in affected_entities:
+            affected_entity._invalidate_cached_properties()
+
+        return affected_entities
+
     def __setattr__(self: Self, name: str, value: Any, /) -> None:
         """Assign entity, if applicable."""
         if isinstance(value, AnEntity):
@@ -97,12 +187,30 @@ class Session:
 
     def __delattr__(self: Self, name: str, /) -> None:
         """Delete entity by name."""
-        del self.entities[name]
+        self._delete_entity(name)
 
     def __delitem__(self: Self, name: str, /) -> None:
         """Delete entity by name."""
-        del self.entities[name]
+        self._delete_entity(name)
+
+
+def _numeric_point_coords(entity: AnEntity, n_dims: int, /) -> tuple[float, ...] | None:  # noqa: E501
+    """Return coordinates of numeric n-dimensional concrete point, else None.
+
+    Points of 2-dimensional indexes are those with zero z coordinates.
+    """
+    if not isinstance(entity, AConcretePoint):
+        return None
+
+    try:
+        coords: tuple[float, ...] = tuple(float(getattr(entity, axis, 0))
+                                          for axis in 'xyz')
+
+    except TypeError:
+        return None
+
+    return None if any(coords[n_dims:]) else coords[:n_dims]
 
 
-# default/global session
-DEFAULT_SESSION: Session = Session('')
+# default/global session, sharing global unique name factory
+DEFAULT_SESSION: Session = Session('', name_factory=UNIQUE_NAME_FACTORY)
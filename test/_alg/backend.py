@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from math import isclose
+
+import numpy as np
+
+from g._alg import NumPyBackend, SymPyBackend
+from g.session import Session
+
+
+class TestNumPyBackend:
+    def agreement_with_sympy_test(self):
+        for coords in (((0, 0), (2, 2), (0, 2), (2, 0)),
+                       ((1, -3), (4, 5), (-2, 7), (6, 1))):
+            results: list[list[tuple[float, ...]]] = []
+
+            for backend in (SymPyBackend(), NumPyBackend()):
+                p, q, r, t = (backend.point(c) for c in coords)
+
+                results.append([
+                    tuple(float(i) for i in backend.line_coefficients(p, q)),
+                    tuple(float(i) for i in backend.coords(
+                        backend.intersect_lines(p, q, r, t))),
+                    tuple(float(i) for i in backend.coords(
+                        backend.project(r, p, backend.sub(q, p)))),
+                    (float(backend.distance(p, q)),
+                     float(backend.dot(backend.sub(q, p),
+                                       backend.sub(t, r)))),
+                ])
+
+            for sympy_result, numpy_result in zip(*results, strict=True):
+                assert all(isclose(i, j)
+                           for i, j in zip(sympy_result, numpy_result,
+                                           strict=True))
+
+    def axis_parallel_line_coefficients_test(self):
+        # vertical & horizontal lines, where SymPy's Line.coefficients differ
+        for backend in (SymPyBackend(), NumPyBackend()):
+            p, q, r = (backend.point(c) for c in ((2, 1), (2, 4), (5, 1)))
+
+            assert [float(i) for i in backend.line_coefficients(p, q)] == [-3, 0, 6]  # noqa: E501
+            assert [float(i) for i in backend.line_coefficients(p, r)] == [0, 3, -3]  # noqa: E501
+
+    def parallel_lines_test(self):
+        b: NumPyBackend = NumPyBackend()
+        assert b.intersect_lines(b.point((0, 0)), b.point((1, 1)),
+                                 b.point((0, 1)), b.point((1, 2))) is None
+
+    def scale_invariant_parallelism_test(self):
+        b: NumPyBackend = NumPyBackend()
+
+        # nearly parallel lines at any scale
+        for scale in (1e-9, 1, 1e9):
+            p, q, r, t = (b.point(np.multiply(c, scale))
+                          for c in ((0, 0), (1, 1), (0, 1), (1, 2 + 1e-14)))
+            assert b.intersect_lines(p, q, r, t) is None
+
+        # intersecting lines of tiny coordinates
+        p, q, r, t = (b.point(np.multiply(c, 1e-9))
+                      for c in ((0, 0), (1, 1), (0, 1), (1, 0)))
+        assert np.allclose(b.intersect_lines(p, q, r, t), (.5e-9, .5e-9), rtol=1e-9, atol=0)  # noqa: E501
+
+    def session_selection_test(self):
+        assert isinstance(Session(alg_backend=NumPyBackend()).alg_backend,
+                          NumPyBackend)
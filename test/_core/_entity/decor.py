@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Self
+
+from g._core import ANonGeomEntity, assign_entity_dependencies_and_name, Var
+from g._core._entity import decor
+
+
+@assign_entity_dependencies_and_name
+class Node(ANonGeomEntity):
+    _short_repr: str = 'Node'
+
+    def __init__(self, parent: Node | None = None, weight: int = 0,
+                 *, label: Var | None = None) -> None:
+        self.parent: Node | None = parent
+        self.weight: int = weight
+        self.label: Var | None = label
+
+    def child(self, weight: int = 0) -> Self:
+        node: Node = object.__new__(Node)
+        node.weight = weight
+        return node
+
+    @property
+    def sibling(self) -> Node:
+        return object.__new__(Node)
+
+
+@assign_entity_dependencies_and_name
+class SubNode(Node):
+    _short_repr: str = 'SubNode'
+
+    def unit(self) -> Vector:  # noqa: F821
+        # Vector is only resolvable in `g`, not in this module
+        return object.__new__(SubNode)
+
+
+class TestDecor:
+    def init_dependencies_test(self):
+        root: Node = Node()
+        label: Var = Var('label')
+
+        assert root.dependencies == set()
+        assert Node(root, 1, label=label).dependencies == {root, label}
+        assert Node(parent=root).dependencies == {root}
+
+    def method_and_property_dependencies_test(self):
+        root: Node = Node()
+
+        assert root.child(2).dependencies == {root}
+        assert root.sibling.dependencies == {root}
+
+    def decoration_plan_sources_test(self):
+        # plans are invalidated by changes to how they are computed, too
+        sources: dict[str, int] = decor._decoration_plan_sources(Node)
+
+        assert decor.__file__ in sources and __file__ in sources
+
+    def decoration_plan_fallbacks_test(self):
+        # annotations evaluated in `g` are recorded, to validate cached plans
+        node_plan, _ = decor._compute_decoration_plan(Node)
+        sub_node_plan, fallbacks = decor._compute_decoration_plan(SubNode)
+
+        assert fallbacks['Vector'] == 'g._core.vector.Vector'
+        assert all(decor._g_annotation_id(annotation) == annotation_id
+                   for annotation, annotation_id in fallbacks.items())
+
+        # plans do not depend on inherited members being already decorated,
+        # which are then left as they are
+        assert ('child', decor._INSTANCE_METHOD) in node_plan
+        assert ('child', decor._INSTANCE_METHOD) in sub_node_plan
+        assert 'child' not in vars(SubNode)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import gc
+
+from g._core import ANonGeomEntity, assign_entity_dependencies_and_name, Var
+from g.session import Session
+
+
+@assign_entity_dependencies_and_name
+class Node(ANonGeomEntity):
+    _short_repr: str = 'Node'
+
+    def __init__(self, *parents: Node | Var) -> None:
+        self.parents: tuple[Node | Var, ...] = parents
+
+
+class TestDependencyIndex:
+    def dependents_test(self):
+        s: Session = Session()
+        s.x = x = Var('x')
+
+        a: Node = Node(x)
+        b: Node = Node(a)
+        c: Node = Node(a, b)
+        d: Node = Node(c)
+
+        assert a.session is s
+        assert {id(i) for i in s.dependents(a)} == {id(b), id(c)}
+        assert {id(i) for i in s.transitive_dependents(x)} == \
+            {id(a), id(b), id(c), id(d)}
+        assert s.transitive_dependents(d) == []
+
+    def topological_order_test(self):
+        s: Session = Session()
+        s.x = x = Var('x')
+
+        a: Node = Node(x)
+        b: Node = Node(a)
+        s.c = c = Node(b, a)
+        s.a = a
+
+        # other session's & unnamed intermediate entities are not returned
+        s2: Session = Session()
+        s2.y = y = Var('y')
+        s.d = d = Node(y, c)
+
+        assert [id(i) for i in s.topological_order()] == [id(x), id(a), id(c), id(d)]  # noqa: E501
+        assert [id(i) for i in s2.topological_order()] == [id(y)]
+
+    def garbage_collection_test(self):
+        s: Session = Session()
+        s.x = x = Var('x')
+
+        a: Node = Node(x)
+        Node(a)
+        gc.collect()
+
+        assert [id(i) for i in s.transitive_dependents(x)] == [id(a)]
+
+    def sessions_test(self):
+        s: Session = Session()
+        s.x = x = Var('x')
+        a: Node = Node(x)
+
+        # other session's dependents are only traversed, not returned
+        s2: Session = Session()
+        s2.b = b = Node(a)
+        c: Node = Node(b)
+        assert c.session is s2
+
+        s.d = d = Node(c)
+
+        assert [id(i) for i in s.dependents(a)] == []
+        assert [id(i) for i in s2.dependents(a)] == [id(b)]
+        assert {id(i) for i in s.transitive_dependents(x)} == {id(a), id(d)}
+        assert {id(i) for i in s2.transitive_dependents(x)} == {id(b), id(c)}
+
+        # all downstream entities are nonetheless invalidated upon changes
+        assert {id(i) for i in s.propagate_change(x)} == \
+            {id(a), id(b), id(c), id(d)}
+
+    def lazy_indexing_test(self):
+        s: Session = Session()
+        s.x = x = Var('x')
+
+        # dependencies changed before next query are indexed as they are then
+        a: Node = Node(x)
+        a.dependencies = set()
+        assert s.dependents(x) == []
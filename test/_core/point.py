@@ -1,4 +1,4 @@
-from g import ORIG
+from g import ORIG, Pt, Var, Vec
 
 
 class TestPoint:
@@ -7,3 +7,28 @@ class TestPoint:
 
     def complex_test(self):
         pass
+
+    def numeric_arithmetic_test(self):
+        p: Pt = Pt(1.5, -2.5)
+        assert p.numeric and ORIG.numeric
+
+        q: Pt = p + Vec(1, 2, 3)
+        assert q == Pt(2.5, -.5, 3) and q.numeric
+        assert Vec(1, 2, 3) + p == q
+
+        assert q - p == Vec(1, 2, 3)
+        assert q - Vec(1, 2, 3) == p
+        assert isinstance((q - p).x, float)
+
+    def symbolic_promotion_test(self):
+        x: Var = Var('x')
+        p: Pt = Pt(x, 1)
+        assert not p.numeric
+
+        q: Pt = p + Vec(1, 2)
+        assert isinstance(q.x, Var) and q.x.expr == x + 1
+        assert q.y == 3 and q.z == 0
+
+        # displacement in terms of promoted Variable, bound to x + 1
+        dx: Var = (q - p).x
+        assert isinstance(dx, Var) and dx.expr.subs(q.x, q.x.expr) == 1
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from functools import cached_property
+
+from g._core import ANonGeomEntity, assign_entity_dependencies_and_name, Var
+from g._util.unique_name import UniqueNameFactory
+from g.session import Session
+
+
+@assign_entity_dependencies_and_name
+class Sum(ANonGeomEntity):
+    _short_repr: str = 'Sum'
+
+    def __init__(self, *terms: Sum | Var) -> None:
+        self.terms: tuple[Sum | Var, ...] = terms
+
+    @cached_property
+    def value(self):
+        return sum(term.expr if isinstance(term, Var) else term.value
+                   for term in self.terms)
+
+
+class TestVariable:
+    def free_test(self):
+        assert Var('free_var').free
+        assert not Var('bound_var', expr=1).free
+
+    def rebinding_invalidation_test(self):
+        s: Session = Session()
+        s.x = x = Var('x', expr=1)
+        s.y = y = Var('y', expr=10)
+
+        a: Sum = Sum(x)
+        b: Sum = Sum(a, y)
+        c: Sum = Sum(y)
+        assert (a.value, b.value, c.value) == (1, 11, 10)
+
+        x.expr = 5
+        assert 'value' not in vars(a)
+        assert 'value' not in vars(b)
+        assert 'value' in vars(c)
+        assert (a.value, b.value, c.value) == (5, 15, 10)
+
+    def rebinding_across_sessions_test(self):
+        # dependent moved into other session than its variable's
+        x: Var = Var('xx', expr=1)
+        a: Sum = Sum(x)
+        s: Session = Session()
+        s.a = a
+        assert a.value == 1
+
+        x.expr = 5
+        assert a.value == 5
+
+        # variable moved into other session than its dependent's
+        y: Var = Var('yy', expr=1)
+        b: Sum = Sum(y)
+        assert b.value == 1
+
+        s2: Session = Session()
+        s2.y = y
+        y.expr = 7
+        assert b.value == 7
+
+    def session_unique_name_test(self):
+        # bound variables are named by their variables' session's factory
+        s: Session = Session(name_factory=UniqueNameFactory('v'))
+        s.x = Var('x', expr=1)
+
+        y: Var = Var(s.x + 1)
+        assert y.name == 'v0'
+        assert s.name_factory.count() == 1
@@ -1,3 +1,5 @@
+from dataclasses import asdict, astuple, fields, replace
+
 from g import Vector, Vec, V, Ux, Uy, Uz, V0  # noqa: F401
 
 
@@ -7,3 +9,29 @@ class TestVector:
 
     def complex_test(self):
         pass
+
+    def cached_length_and_unit_test(self):
+        v: Vector = Vector(3, 4, 0)
+
+        assert v.__len__() == 5
+        assert v.unit() == Vector(.6, .8, 0)
+        assert v.unit() is v.unit()
+
+        # caches are invalidated upon coordinate changes
+        v.x = 0
+        assert v.__len__() == 4
+        assert v.unit() == Uy
+
+    def slots_test(self):
+        assert not hasattr(Vector(1, 2, 3), '__dict__')
+
+    def dataclass_fields_test(self):
+        # entity attributes & caches are slots, not dataclass fields
+        v: Vector = Vector(3, 4, 0)
+        v.unit()
+
+        assert [f.name for f in fields(Vector)] == ['x', 'y', 'z']
+        assert asdict(v) == {'x': 3, 'y': 4, 'z': 0}
+        assert astuple(v) == (3, 4, 0)
+        assert replace(v, z=12) == Vector(3, 4, 12)
+        assert replace(v, z=12).__len__() == 13
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import numpy as np
+
+from g import Var, Vector, VectorBatch, Ux, Uy, Uz, V0
+
+
+class TestVectorBatch:
+    def numeric_test(self):
+        b: VectorBatch = VectorBatch.from_vectors([Ux, Uy, Uz, V0])
+
+        assert not b.symbolic
+        assert b.to_vectors() == [Ux, Uy, Uz, V0]
+        assert np.allclose(b.cross(Ux).components,
+                           ((0, 0, 0), (0, 0, -1), (0, 1, 0), (0, 0, 0)))
+        assert np.allclose(b.dot(Uy), (0, 1, 0, 0))
+        assert np.allclose(b[:3].angle(Ux), (0, np.pi / 2, np.pi / 2))
+
+        v: VectorBatch = VectorBatch([(3, 4, 0), (0, 0, 2)])
+        assert np.allclose(v.norm(), (5, 2))
+        assert np.allclose(v.unit().components, ((.6, .8, 0), (0, 0, 1)))
+        assert np.allclose(v.project(Ux).components, ((3, 0, 0), (0, 0, 0)))
+
+    def symbolic_test(self):
+        x: Var = Var('x')
+        b: VectorBatch = VectorBatch.from_vectors([Vector(x, 1, 0), Ux])
+
+        assert b.symbolic
+        assert b.dot(Ux)[0] == x
+        assert b[0] == Vector(x, 1, 0)
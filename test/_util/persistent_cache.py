@@ -0,0 +1,16 @@
+from g._util.persistent_cache import CACHE_DIR_ENV_VAR, PersistentCache
+
+
+class TestPersistentCache:
+    def round_trip_test(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+
+        cache: PersistentCache = PersistentCache('test')
+        cache.set('key', {'src.py': 1}, [['member', 'kind']])
+        cache.save()
+
+        reloaded: PersistentCache = PersistentCache('test')
+        assert reloaded.get('key', {'src.py': 1}) == [['member', 'kind']]
+
+        # modified source invalidates cached value
+        assert reloaded.get('key', {'src.py': 2}) is None
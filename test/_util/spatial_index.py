@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import numpy as np
+
+from g import Session, Pt, Var
+from g._util.spatial_index import SpatialIndex
+
+
+class TestSpatialIndex:
+    def brute_force_agreement_test(self):
+        rng: np.random.Generator = np.random.default_rng(0)
+
+        for n_dims in (2, 3):
+            coords: np.ndarray = rng.random((2000, n_dims))
+            index: SpatialIndex = SpatialIndex(n_dims, enumerate(coords))
+
+            # deletes & inserts, including re-inserts, across rebuilds
+            for i in range(0, 2000, 5):
+                index.remove(i)
+            for i in range(1, 200, 5):
+                coords[i] = rng.random(n_dims)
+                index.insert(i, coords[i])
+
+            keys: list[int] = [i for i in range(2000) if i % 5]
+            live: np.ndarray = coords[keys]
+            assert len(index) == len(keys)
+
+            for q in rng.random((50, n_dims)):
+                distances: np.ndarray = np.sqrt(((live - q) ** 2).sum(axis=1))
+
+                assert [key for key, _ in index.nearest(q, k=4)] == \
+                    [keys[i] for i in np.argsort(distances)[:4]]
+
+                assert sorted(index.within_radius(q, .1)) == \
+                    [keys[i] for i in np.flatnonzero(distances <= .1)]
+
+                lo, hi = q - .1, q + .05
+                assert sorted(index.within_box(lo, hi)) == \
+                    [keys[i]
+                     for i in np.flatnonzero(((live >= lo) & (live <= hi)).all(axis=1))]  # noqa: E501
+
+    def session_test(self):
+        s: Session = Session()
+        s.a, s.b = Pt(0, 0), Pt(1, 1)
+        s.symbolic = Pt(Var('u'), 0)
+
+        index: SpatialIndex = s.spatial_index(2)
+        assert len(index) == 2
+        assert index.nearest((.9, .9)) == [('b', index.nearest((.9, .9))[0][1])]  # noqa: E501
+
+        s['c'] = Pt(.95, .95)
+        assert index.nearest((.9, .9))[0][0] == 'c'
+
+        del s.c
+        del s['b']
+        assert [key for key, _ in index.nearest_batch([(.9, .9)])[0]] == ['a']  # noqa: E501
+
+    def dimensions_test(self):
+        # points off the xy plane are not 2-dimensional
+        s: Session = Session()
+        s.a, s.b = Pt(0, 0), Pt(0, 0, 100)
+
+        assert s.spatial_index(2).within_radius((0, 0), 1) == ['a']
+        assert [key for key, _ in s.spatial_index(3).nearest((0, 0, 90))] == ['b']  # noqa: E501
+
+        s.a = Pt(0, 0, 1)
+        assert len(s.spatial_index(2)) == 0
+
+    def batch_agreement_test(self):
+        rng: np.random.Generator = np.random.default_rng(1)
+
+        for n_dims in (2, 3):
+            index: SpatialIndex = SpatialIndex(n_dims, enumerate(rng.random((1000, n_dims))))  # noqa: E501
+
+            # dead & buffered entries
+            for i in range(0, 1000, 3):
+                index.remove(i)
+            for i in range(1000, 1020):
+                index.insert(i, rng.random(n_dims))
+
+            queries: np.ndarray = rng.random((100, n_dims))
+
+            for q, nearest, within_radius in zip(queries,
+                                                 index.nearest_batch(queries, k=5),  # noqa: E501
+                                                 index.within_radius_batch(queries, .1)):  # noqa: E501
+                assert nearest == index.nearest(q, k=5)
+                assert sorted(within_radius) == sorted(index.within_radius(q, .1))  # noqa: E501
+
+        # fewer points than k
+        assert len(SpatialIndex(2, enumerate([(0, 0), (1, 1)])).nearest_batch([(0, 0)], k=3)[0]) == 2  # noqa: E501
@@ -0,0 +1,28 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from g._util.unique_name import UniqueNameFactory
+from g.session import Session
+
+
+class TestUniqueNameFactory:
+    def namespace_test(self):
+        factory: UniqueNameFactory = UniqueNameFactory()
+        pt = factory.namespace('Pt')
+
+        assert [factory(), pt(), factory(), pt()] == ['_0', 'Pt0', '_1', 'Pt1']
+        assert factory.count('Pt') == 2
+
+    def collision_test(self):
+        s: Session = Session()
+        s.entities['_0'] = s.entities['_1'] = None
+
+        assert s.unique_name() == '_2'
+
+    def thread_safety_test(self):
+        factory: UniqueNameFactory = UniqueNameFactory()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            names: list[str] = list(executor.map(lambda _: factory(),
+                                                 range(10 ** 4)))
+
+        assert len(set(names)) == len(names)
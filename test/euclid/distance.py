@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import numpy as np
+
+from g import Pt, Var
+from g.euclid.distance import pairwise_distance_blocks, pairwise_distances
+from g.euclid.r2.point_cloud import PointCloudR2
+
+
+class TestPairwiseDistances:
+    def numeric_test(self):
+        rng: np.random.Generator = np.random.default_rng(0)
+        a: np.ndarray = rng.random((300, 3)) * 1e3
+        b: np.ndarray = rng.random((200, 3)) * 1e3
+        expected: np.ndarray = np.sqrt(((a[:, np.newaxis] - b) ** 2).sum(axis=2))  # noqa: E501
+
+        assert np.allclose(pairwise_distances(a, b, block_size=64), expected)
+        assert np.allclose(pairwise_distances(a, b, squared=True),
+                           expected ** 2)
+
+        assert sum(block.size
+                   for *_, block in pairwise_distance_blocks(a, b, block_size=64)) == 300 * 200  # noqa: E501
+
+    def points_test(self):
+        assert np.allclose(pairwise_distances([Pt(0, 0), Pt(3, 4)]),
+                           ((0, 5), (5, 0)))
+        assert np.allclose(pairwise_distances(PointCloudR2([(0, 0), (1, 1)]),
+                                              squared=True),
+                           ((0, 2), (2, 0)))
+        assert np.allclose(pairwise_distances([1, 4]), ((0, 3), (3, 0)))
+
+    def symbolic_test(self):
+        u: Var = Var('u')
+        d: np.ndarray = pairwise_distances([Pt(u, 0)], [Pt(3, 4)],
+                                           squared=True)
+
+        assert d.dtype == object
+        assert (d[0, 0] - ((u - 3) ** 2 + 16)).expand() == 0
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import numpy as np
+from sympy.core.symbol import Symbol
+
+from g._core import EuclidConcretePoint, EuclidPointAtInf, Vector
+from g.euclid.homogeneous import (at_infinity, cartesian, homogeneous,
+                                  incident, join, meet)
+
+
+class TestHomogeneous:
+    def points_test(self):
+        coords: np.ndarray = homogeneous([EuclidConcretePoint(1, 2),
+                                          EuclidPointAtInf(inf_dir=Vector(3, 4))])
+
+        assert coords.tolist() == [[1, 2, 1], [3, 4, 0]]
+        assert at_infinity(coords).tolist() == [False, True]
+        assert np.allclose(cartesian(coords)[0], (1, 2))
+        assert np.isnan(cartesian(coords)[1]).all()
+
+        assert homogeneous([[1, 2], [3, 4]]).tolist() == [[1, 2, 1], [3, 4, 1]]  # noqa: E501
+        assert homogeneous(EuclidConcretePoint(1, 2, 3), n_dims=3).tolist() == [1, 2, 3, 1]  # noqa: E501
+
+    def join_meet_r2_test(self):
+        # lines through a finite point & finite/infinite points alike
+        origin: np.ndarray = homogeneous([(0, 0)])
+        others: np.ndarray = np.array([(1, 1, 1), (1, 1, 0), (2, 0, 1)])
+
+        lines: np.ndarray = join(origin, others)
+
+        assert incident(others, lines).all() and incident(origin, lines).all()
+
+        # meets with line y = 1: finite, then at infinity for parallel line
+        points: np.ndarray = meet(lines, (0, 1, -1))
+
+        assert np.allclose(cartesian(points[0]), (1, 1))
+        assert at_infinity(points).tolist() == [False, False, True]
+
+    def join_meet_r3_test(self):
+        plane: np.ndarray = join(homogeneous((0, 0, 0), n_dims=3),
+                                 homogeneous((1, 0, 0), n_dims=3),
+                                 (0, 1, 0, 0))
+
+        assert np.allclose(plane / plane[2], (0, 0, 1, 0))
+
+        point: np.ndarray = meet((1, 0, 0, -1), (0, 1, 0, -2), (0, 0, 1, -3))
+        assert np.allclose(cartesian(point), (1, 2, 3))
+
+    def symbolic_test(self):
+        t: Symbol = Symbol('t')
+
+        line: np.ndarray = join((t, 0, 1), (0, t, 1))
+
+        assert line.dtype == object
+        assert incident((t / 2, t / 2, 1), line)
+        assert not incident((t, t, 1), line)
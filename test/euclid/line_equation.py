@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import numpy as np
+from sympy.core.numbers import Rational
+from sympy.core.symbol import Symbol
+
+from g._core import EuclidConcretePoint
+from g.euclid.line_equation import (evaluate, line_coefficients, normalize,
+                                    signed_distances, sides)
+from g.euclid.r2.point_cloud import PointCloudR2
+
+
+class TestLineEquation:
+    def vertical_horizontal_test(self):
+        points: list[EuclidConcretePoint] = [EuclidConcretePoint(-1, 5),
+                                             EuclidConcretePoint(2, 0)]
+
+        # upward vertical line x = 1, & leftward horizontal line y = 2
+        vertical: np.ndarray = line_coefficients(EuclidConcretePoint(1, 0),
+                                                 EuclidConcretePoint(1, 3))
+        horizontal: np.ndarray = line_coefficients((3, 2), (0, 2), normalized=True)  # noqa: E501
+
+        assert np.allclose(normalize(vertical), (-1, 0, 1))
+        assert np.allclose(horizontal, (0, -1, 2))
+
+        assert np.allclose(signed_distances(vertical, points), (2, -1))
+        assert np.allclose(evaluate(horizontal, points), (-3, 2))
+        assert evaluate(horizontal, EuclidConcretePoint(0, 0)) == 2
+
+        assert sides(EuclidConcretePoint(1, 0), EuclidConcretePoint(1, 3), points).tolist() == [1, -1]  # noqa: E501
+        assert sides((3, 2), (0, 2), PointCloudR2([(0, 3), (0, 2), (0, 1)])).tolist() == [-1, 0, 1]  # noqa: E501
+
+    def robust_sides_test(self):
+        # points within rounding errors of line y = x, on both sides of it
+        ts: np.ndarray = np.linspace(.5, 10.5, 1001)
+        ys: np.ndarray = np.where(np.arange(1001) % 2, np.nextafter(ts, np.inf), np.nextafter(ts, -np.inf))  # noqa: E501
+
+        expected: np.ndarray = np.where(np.arange(1001) % 2, 1, -1)
+        assert sides((.5, .5), (12.5, 12.5), np.stack((ts, ys), axis=-1)).tolist() == expected.tolist()  # noqa: E501
+
+        # exact rationals not representable as floats
+        third: Rational = Rational(1, 3)
+        assert sides((0, 0), (third, third), [(Rational(1, 10), Rational(1, 10))]).tolist() == [0]  # noqa: E501
+
+    def symbolic_test(self):
+        a: Symbol = Symbol('a', positive=True)
+
+        # leftward horizontal line y = a
+        coefficients: np.ndarray = line_coefficients((a, a), (0, a))
+        assert coefficients.dtype == object
+        assert normalize(coefficients).tolist() == [0, -1, a]
+
+        assert evaluate(coefficients, [(a, 0), (0, 2 * a)]).tolist() == [a ** 2, -a ** 2]  # noqa: E501
+        assert sides((a, a), (0, a), [(a, 0), (0, 2 * a)]).tolist() == [1, -1]
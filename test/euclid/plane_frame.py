@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+from sympy.core.numbers import Rational
+from sympy.core.singleton import S
+from sympy.core.symbol import Symbol
+from sympy.functions.elementary.miscellaneous import sqrt
+
+from g._core import EuclidConcretePoint, EuclidPointAtInf, Vector
+from g.euclid.plane_frame import PlaneFrame
+
+
+class TestPlaneFrame:
+    def numeric_test(self):
+        # plane z = 1, through point at infinity in x direction
+        frame: PlaneFrame = PlaneFrame.from_points(
+            EuclidConcretePoint(0, 0, 1),
+            EuclidPointAtInf(inf_dir=Vector(2, 0, 0)),
+            (0, 1, 1))
+
+        assert not frame.symbolic
+        assert np.allclose((frame.unit_normal, frame.unit_u, frame.unit_v), np.eye(3)[::-1][[0, 2, 1]])  # noqa: E501
+
+        points: list[EuclidConcretePoint] = [EuclidConcretePoint(3, 4, 5),
+                                             EuclidConcretePoint(-1, 2, -1)]
+
+        assert np.allclose(frame.signed_distances(points), (4, -2))
+        assert frame.signed_distances(EuclidConcretePoint(0, 0, 3)) == 2
+        assert np.allclose(frame.projections(points), ((3, 4, 1), (-1, 2, 1)))
+        assert np.allclose(frame.reflections(points), ((3, 4, -3), (-1, 2, 3)))  # noqa: E501
+        assert np.allclose(frame.plane_coords(points), ((3, 4), (-1, 2)))
+
+    def line_intersections_test(self):
+        frame: PlaneFrame = PlaneFrame.from_points((0, 0, 1), (1, 0, 1), (0, 1, 1))  # noqa: E501
+
+        intersections: np.ndarray = frame.line_intersections(
+            np.zeros(3), [(1, 1, 1), (1, 0, 0), (1, 0, 1e-17), (0, 0, -2)])
+
+        assert np.allclose(intersections[[0, 3]], ((1, 1, 1), (0, 0, 1)))
+
+        # parallel & nearly parallel lines, within tolerance
+        assert np.isnan(intersections[1:3]).all()
+
+    def exact_test(self):
+        # plane x + y + z = 1
+        frame: PlaneFrame = PlaneFrame.from_points(
+            EuclidConcretePoint(S.One, S.Zero, S.Zero),
+            EuclidConcretePoint(S.Zero, S.One, S.Zero),
+            EuclidConcretePoint(S.Zero, S.Zero, S.One))
+
+        assert frame.symbolic
+        assert frame.unit_normal.tolist() == [sqrt(3) / 3] * 3
+
+        point: EuclidConcretePoint = EuclidConcretePoint(S.One, S.One, S.One)
+        third: Rational = Rational(1, 3)
+
+        assert frame.signed_distances(point) == 2 * sqrt(3) / 3
+        assert frame.projections(point).tolist() == [third] * 3
+        assert frame.reflections(point).tolist() == [-third] * 3
+
+        assert frame.line_intersections([(S.Zero, S.Zero, S.Zero)], [(S.One, S.One, S.Zero)]).tolist() == [[Rational(1, 2), Rational(1, 2), 0]]  # noqa: E501
+
+    def symbolic_test(self):
+        a: Symbol = Symbol('a')
+
+        # plane z = a
+        frame: PlaneFrame = PlaneFrame.from_points((0, 0, a), (1, 0, a), (0, 1, a))  # noqa: E501
+
+        assert frame.projections([(1, 2, 3)]).tolist() == [[1, 2, a]]
+
+        assert frame.line_intersections((1, 2, 3), [(0, 0, 1), (1, 1, 0)]).tolist() == [[1, 2, a], [None] * 3]  # noqa: E501
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from fractions import Fraction
+
+import numpy as np
+from sympy.core.numbers import Rational
+from sympy.geometry.point import Point2D
+
+from g.euclid.predicates import (filter_stats, incircle, insphere,
+                                 orient2d, orient3d)
+
+
+class TestPredicates:
+    def orient2d_test(self):
+        assert orient2d((0, 0), (1, 0), (0, 1)) == 1
+        assert orient2d((0, 0), (0, 1), (1, 0)) == -1
+        assert orient2d((0, 0), (1, 1), (2, 2)) == 0
+
+        # points only approximately collinear in floating point
+        assert orient2d((.5, .5), (12, 12), (24, 24)) == 0
+        assert orient2d((0, 0), (1e-30, 1e-30), (1, 1 + 2 ** -52)) == 1
+
+    def exact_fallback_test(self):
+        filter_stats.reset()
+
+        # Kettner et al.'s classic failure case of naive float orientation
+        x: np.ndarray = .5 + np.arange(256) * 2. ** -53
+        points: np.ndarray = np.stack((x, np.full(256, .5)), axis=-1)
+        p, q = np.array((12., 12.)), np.array((24., 24.))
+
+        signs: np.ndarray = orient2d(points, q, p)
+
+        expected: list[int] = [
+            (lambda d: (d > 0) - (d < 0))(
+                (Fraction(24) - Fraction(px)) * (Fraction(12) - Fraction(py)) -
+                (Fraction(24) - Fraction(py)) * (Fraction(12) - Fraction(px)))
+            for px, py in points.tolist()]
+
+        assert signs.dtype == np.int8 and signs.tolist() == expected
+        assert filter_stats.exact > 0 and filter_stats.fast_fraction < 1
+
+    def sympy_points_test(self):
+        a, b = Point2D(0, 0), Point2D(1, Rational(1, 3))
+
+        assert orient2d(a, b, Point2D(3, 1)) == 0
+        assert orient2d(a, b, [(3, 1), (3, 2), (3, 0)]).tolist() == [0, 1, -1]
+
+    def incircle_test(self):
+        a, b, c = (1, 0), (0, 1), (-1, 0)
+
+        assert incircle(a, b, c, (0, 0)) == 1
+        assert incircle(a, b, c, (0, -1)) == 0
+        assert incircle(a, b, c, (2, 2)) == -1
+        assert incircle(a, c, b, (0, 0)) == -1
+
+    def orient3d_insphere_test(self):
+        a, b, c = (0, 0, 0), (1, 0, 0), (0, 1, 0)
+
+        assert orient3d(a, b, c, [(0, 0, -1), (0, 0, 1), (1, 1, 0)]).tolist() == [1, -1, 0]  # noqa: E501
+
+        # a, b, c & d positively oriented
+        d = (0, 0, -1)
+        assert insphere(a, b, c, d, (.25, .25, -.25)) == 1
+        assert insphere(a, b, c, d, (1, 1, -1)) == 0
+        assert insphere(a, b, c, d, (5, 5, 5)) == -1
+
+    def inexact_rationals_test(self):
+        # collinear, but not so once rounded to float64
+        assert orient2d((Rational(-52, 73), Rational(9820, 1533)),
+                        (Rational(-44, 31), Rational(3140, 651)),
+                        (Rational(-32, 35), Rational(4376, 735))) == 0
+
+        rng: np.random.Generator = np.random.default_rng(0)
+        for p, q, s, t in rng.integers(1, 99, size=(200, 4)).tolist():
+            a, d, k = Rational(p, q), Rational(q, s), Rational(s, t)
+
+            assert orient2d((a, d), (a + 1, d + k), (a + t, d + t * k)) == 0
+
+            # cocircular rational points (1 - u^2, 2u) / (1 + u^2) of circle
+            cocircular: list[tuple[Rational, Rational]] = [
+                (a + d * (1 - u ** 2) / (1 + u ** 2), k + d * 2 * u / (1 + u ** 2))  # noqa: E501
+                for u in (Rational(p, q), Rational(q, s), Rational(-s, t), Rational(t, p + 1))]  # noqa: E501
+
+            assert incircle(*cocircular) == 0
+
+        # integers beyond 2^53
+        assert orient2d((0, 0), (2 ** 60 + 1, 1), (2 ** 61 + 2, 2)) == 0
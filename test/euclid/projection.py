@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import numpy as np
+from sympy.core.symbol import Symbol
+from sympy.functions.elementary.miscellaneous import sqrt
+
+from g.euclid.projection import coords_array, project_onto_line, project_onto_plane  # noqa: E501
+from g.euclid.r2.point_cloud import PointCloudR2
+
+
+class TestProjection:
+    def line_test(self):
+        projections, distances = project_onto_line(
+            PointCloudR2([(0, 2), (3, -1), (1, 1)]), (1, 1), (1, 0))
+
+        assert np.allclose(projections, ((0, 1), (3, 1), (1, 1)))
+        assert np.allclose(distances, (1, 2, 0))
+
+    def plane_test(self):
+        points: np.ndarray = np.array(((1, 2, 3), (-1, 0, -4)))
+
+        projections, distances = project_onto_plane(points, (0, 0, 1), (0, 0, 1))  # noqa: E501
+
+        assert np.allclose(projections, ((1, 2, 1), (-1, 0, 1)))
+        assert np.allclose(distances, (2, 5))
+
+    def symbolic_test(self):
+        t: Symbol = Symbol('t', positive=True)
+
+        assert coords_array((t, 0)).dtype == object
+        assert coords_array((sqrt(2), 0)).dtype == np.float64
+
+        projections, distances = project_onto_line([(t, t)], (0, 0), (1, 0))
+
+        assert projections.dtype == object
+        assert (projections[0, 0] - t).equals(0) and projections[0, 1] == 0
+        assert (distances[0] - t).equals(0)
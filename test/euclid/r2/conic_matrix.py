@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import numpy as np
+from sympy.core.numbers import Rational
+from sympy.core.symbol import Symbol
+
+from g.euclid.r2.conic_matrix import (CIRCLE, DEGENERATE, ELLIPSE, HYPERBOLA,
+                                      IMAGINARY, PARABOLA, centers, classify,
+                                      evaluate, from_coefficients,
+                                      from_focus_vertex_eccentricity,
+                                      principal_axes, tangents,
+                                      to_focus_vertex_eccentricity)
+
+
+class TestConicMatrix:
+    def classify_test(self):
+        matrices: np.ndarray = from_coefficients(
+            [1, 1, 1, 0, 1, 1, 1], [0, 0, 0, 0, 0, 0, 0], [1, 4, 1, 1, -1, -1, 1],  # noqa: E501
+            [0, 0, 0, -1, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0], [-1, -1, 1, 0, -1, 0, 0])  # noqa: E501
+
+        assert classify(matrices).tolist() == [CIRCLE, ELLIPSE, IMAGINARY,
+                                               PARABOLA, HYPERBOLA,
+                                               DEGENERATE, DEGENERATE]
+
+    def round_trip_test(self):
+        rng: np.random.Generator = np.random.default_rng(0)
+        foci: np.ndarray = rng.normal(size=(100, 2))
+        vertices: np.ndarray = rng.normal(size=(100, 2))
+        eccentricities: np.ndarray = rng.uniform(.1, 3, 100)
+        eccentricities[::5] = 1
+
+        matrices: np.ndarray = from_focus_vertex_eccentricity(foci, vertices, eccentricities)  # noqa: E501
+        assert np.allclose(evaluate(matrices, vertices), 0)
+
+        f, v, e = to_focus_vertex_eccentricity(matrices)
+        assert np.allclose(e, eccentricities)
+
+        # central conics' foci may be either focus
+        c: np.ndarray = centers(matrices)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c: np.ndarray = c[:, :2] / c[:, 2:]
+        flipped: np.ndarray = (np.abs(f - foci).max(axis=-1) > 1e-6)[:, np.newaxis]  # noqa: E501
+        assert np.allclose(np.where(flipped, 2 * c - f, f), foci)
+        assert np.allclose(np.where(flipped, 2 * c - v, v), vertices)
+
+    def single_matrix_test(self):
+        f, v, e = to_focus_vertex_eccentricity(from_coefficients(1, 0, 1, 0, 0, -1))  # noqa: E501
+        assert np.allclose(f, (0, 0)) and np.allclose(v, (1, 0)) and e == 0
+
+        for matrix, focus, vertex, eccentricity in (
+                (from_coefficients(1 / 4, 0, 1, 0, 0, -1), (3 ** .5, 0), (2, 0), 3 ** .5 / 2),  # noqa: E501
+                (from_coefficients(1, 0, -1, 0, 0, -1), (2 ** .5, 0), (1, 0), 2 ** .5),  # noqa: E501
+                (from_focus_vertex_eccentricity((1, 0), (0, 0), 1), (1, 0), (0, 0), 1)):  # noqa: E501
+            f, v, e = to_focus_vertex_eccentricity(matrix)
+
+            assert f.shape == v.shape == (2,) and np.ndim(e) == 0
+            assert np.isclose(e, eccentricity)
+
+            # central conics' foci may be either focus
+            sign: float = np.sign(v[0]) or 1
+            assert np.allclose(sign * f, focus) and np.allclose(sign * v, vertex)  # noqa: E501
+
+        f, v, e = to_focus_vertex_eccentricity(from_coefficients(1, 0, -1, 0, 0, 0))  # noqa: E501
+        assert np.isnan(f).all() and np.isnan(v).all() and np.isnan(e)
+
+    def axes_and_tangents_test(self):
+        ellipse: np.ndarray = from_coefficients(1 / 4, 0, 1, 0, 0, -1)
+
+        directions, lengths = principal_axes(ellipse)
+        assert np.allclose(np.abs(directions), np.eye(2))
+        assert np.allclose(lengths, (2, 1))
+
+        assert np.allclose(centers(ellipse), (0, 0, 1 / 4))
+        assert np.allclose(tangents(ellipse, (2, 0)), (1 / 2, 0, -1))
+
+        # parabolas' centers are at infinity along their axes
+        parabola: np.ndarray = from_focus_vertex_eccentricity((1, 0), (0, 0), 1)
+        assert classify(parabola) == PARABOLA
+        assert centers(parabola)[2] == 0
+        assert np.isnan(principal_axes(parabola)[1]).any()
+
+    def symbolic_test(self):
+        s: Symbol = Symbol('s')
+
+        matrix: np.ndarray = from_focus_vertex_eccentricity((0, 0), (s, 0), Rational(1, 2))  # noqa: E501
+        p: np.ndarray = np.array((s, 0, 1), dtype=object)
+
+        assert matrix.dtype == object and matrix[0, 0] == Rational(3, 4)
+        assert (p @ matrix @ p).expand() == 0
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+import numpy as np
+from sympy.geometry.ellipse import Circle
+
+from g.euclid.r2.intersect import (COINCIDENT, CONTAINED, DISJOINT,
+                                   EXTERNALLY_TANGENT, INTERNALLY_TANGENT,
+                                   INTERSECTING, CircleBatch,
+                                   CircleIntersections)
+
+
+class TestCircleBatch:
+    def relations_test(self):
+        circles: CircleBatch = CircleBatch.from_arrays(
+            [(0, 0), (3, 0), (2, 0), (1, 0), (.5, 0), (0, 0), (0, 0)],
+            [1, 1, 1, 1, .5, .5, 1])
+
+        result: CircleIntersections = circles.intersect_pairs(
+            [(0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6)])
+
+        assert result.relations.tolist() == [DISJOINT, EXTERNALLY_TANGENT,
+                                             INTERSECTING, INTERNALLY_TANGENT,
+                                             CONTAINED, COINCIDENT]
+        assert np.allclose(result.points[1], ((1, 0), (1, 0)))
+        assert np.allclose(result.points[2], ((.5, -np.sqrt(.75)), (.5, np.sqrt(.75))))  # noqa: E501
+        assert np.isnan(result.points[[0, 4, 5]]).all()
+
+    def candidate_pairs_test(self):
+        rng: np.random.Generator = np.random.default_rng(0)
+        centers: np.ndarray = rng.uniform(0, 100, (2000, 2))
+        radii: np.ndarray = rng.uniform(0, 2, 2000)
+        radii[:3] = 20, 0, 0
+
+        i, j = np.triu_indices(2000, 1)
+        brute_force: np.ndarray = np.stack((i, j), axis=-1)[
+            np.hypot(*(centers[j] - centers[i]).T) <= radii[i] + radii[j]]
+
+        pairs: np.ndarray = CircleBatch.from_arrays(centers, radii).candidate_pairs()  # noqa: E501
+        assert np.array_equal(pairs, brute_force)
+
+    def outlier_radius_test(self):
+        rng: np.random.Generator = np.random.default_rng(2)
+        centers: np.ndarray = rng.uniform(0, 100, (1000, 2))
+        radii: np.ndarray = rng.uniform(0, 2, 1000)
+        radii[500], radii[600] = 5000, 60
+
+        i, j = np.triu_indices(1000, 1)
+        brute_force: np.ndarray = np.stack((i, j), axis=-1)[
+            np.hypot(*(centers[j] - centers[i]).T) <= radii[i] + radii[j]]
+
+        # oversized circles do not cover (R / median radius)^2 grid cells
+        start: float = perf_counter()
+        pairs: np.ndarray = CircleBatch.from_arrays(centers, radii).candidate_pairs()  # noqa: E501
+        assert perf_counter() - start < 1
+        assert np.array_equal(pairs, brute_force)
+
+    def intersection_points_test(self):
+        rng: np.random.Generator = np.random.default_rng(1)
+        circles: CircleBatch = CircleBatch.from_arrays(rng.normal(size=(300, 2)),  # noqa: E501
+                                                       rng.uniform(.1, 1, 300))
+
+        result: CircleIntersections = circles.intersect_all()
+        meeting: np.ndarray = result.relations == INTERSECTING
+        assert meeting.any()
+
+        i, j = result.pairs[meeting].T
+        points: np.ndarray = result.points[meeting]
+        for k in (i, j):
+            distances: np.ndarray = np.linalg.norm(points - circles.centers[k, np.newaxis], axis=-1)  # noqa: E501
+            assert np.allclose(distances, circles.radii[k, np.newaxis])
+
+        # intersection points have zero powers & lie on radical axes
+        axes: np.ndarray = circles.radical_axes(result.pairs[meeting])
+        assert np.allclose((points @ axes[:, :2, np.newaxis])[..., 0] + axes[:, 2:], 0)  # noqa: E501
+
+    def power_and_radical_center_test(self):
+        circles: CircleBatch = CircleBatch.from_circles(
+            [Circle((0, 0), 1), Circle((4, 0), 2), Circle((0, 3), 1)])
+
+        assert np.allclose(circles.power([(0, 0), (1, 1)]),
+                           ((-1, 12, 8), (1, 6, 4)))
+
+        center: np.ndarray = circles.radical_centers([(0, 1, 2)])[0]
+        powers: np.ndarray = circles.power(center[:2] / center[2])
+        assert np.allclose(powers, powers[0])
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import numpy as np
+from sympy.core.numbers import Rational
+from sympy.core.symbol import Symbol
+from sympy.functions.elementary.miscellaneous import sqrt
+from sympy.geometry.line import Line2D, Ray2D, Segment2D
+
+from g.euclid.r2.conic_matrix import (evaluate, from_coefficients,
+                                      from_focus_vertex_eccentricity)
+from g.euclid.r2.intersect import (SEGMENT, ConicIntersections,
+                                   ConicLineIntersections, LinearEntityBatch,
+                                   conic_cut_points, intersect_conic_lines,
+                                   intersect_conics)
+
+
+UNIT_CIRCLE: np.ndarray = from_coefficients(1, 0, 1, 0, 0, -1)
+
+
+class TestConicLineIntersections:
+    def kinds_test(self):
+        lines: LinearEntityBatch = LinearEntityBatch.from_arrays(
+            [(-2, 0), (-2, 1), (-2, 2), (0, 0)],
+            [(1, 0), (1, 0), (1, 0), (.5, 0)], [0, 0, 0, SEGMENT])
+
+        result: ConicLineIntersections = intersect_conic_lines(UNIT_CIRCLE, lines)  # noqa: E501
+
+        assert np.allclose(result.t[0], (1, 3)) and np.allclose(result.t[1], 2)  # noqa: E501
+        assert np.isnan(result.t[2]).all()
+        assert result.tangent.tolist() == [False, True, False, False]
+        assert result.intersects[3].tolist() == [False, False]
+        assert np.allclose(result.points[0], ((-1, 0), (1, 0)))
+
+    def batch_test(self):
+        rng: np.random.Generator = np.random.default_rng(0)
+        matrix: np.ndarray = from_focus_vertex_eccentricity((0, 0), (1, 0), 1.5)  # noqa: E501
+        lines: LinearEntityBatch = LinearEntityBatch.from_arrays(
+            rng.normal(size=(1000, 2)), rng.normal(size=(1000, 2)))
+
+        result: ConicLineIntersections = intersect_conic_lines(matrix, lines)
+        real: np.ndarray = ~np.isnan(result.t)
+
+        assert real.any()
+        assert np.allclose(evaluate(matrix, result.points[real]), 0, atol=1e-9)  # noqa: E501
+
+    def symbolic_test(self):
+        s: Symbol = Symbol('s')
+
+        assert conic_cut_points(UNIT_CIRCLE.astype(int).astype(object),
+                                Line2D((s, 0), (s, 1))) == \
+            [(s, -sqrt(1 - s ** 2)), (s, sqrt(1 - s ** 2))]
+
+    def symbolic_ranges_test(self):
+        unit_circle: np.ndarray = UNIT_CIRCLE.astype(int).astype(object)
+        r: Symbol = Symbol('r', positive=True)
+
+        # both roots t = -5/3 & -1/3 outside of segment
+        result: ConicLineIntersections = intersect_conic_lines(
+            unit_circle, LinearEntityBatch.from_entities(
+                [Segment2D((Rational(3, 2), 0), (3, 0)),
+                 Segment2D((Rational(1, 3), 0), (3, 0))]))
+
+        assert result.t[0].tolist() == [Rational(-5, 3), Rational(-1, 3)]
+        assert result.intersects.tolist() == [[False, False], [False, True]]
+        assert result.points[1, 1].tolist() == [1, 0]
+
+        # only root t = r of ray, from circle of radius r's center
+        result: ConicLineIntersections = intersect_conic_lines(
+            np.diag(np.array([1, 1, -r ** 2], dtype=object)),
+            LinearEntityBatch.from_entities([Ray2D((0, 0), (1, 0))]))
+
+        assert result.t[0].tolist() == [-r, r]
+        assert result.intersects.tolist() == [[False, True]]
+
+
+class TestConicIntersections:
+    def cases_test(self):
+        result: ConicIntersections = intersect_conics(
+            UNIT_CIRCLE,
+            [from_coefficients(1 / 4, 0, 1, 0, 0, -1),    # ellipse: 2 points
+             from_coefficients(1, 0, 1, -4, 0, 3),         # tangent circle
+             from_coefficients(0, 1, 0, 0, 0, 0),          # line pair xy = 0
+             from_coefficients(1, 0, 1, -6, 0, 8),         # disjoint circle
+             -2 * UNIT_CIRCLE])                            # same circle
+
+        assert result.real.sum(axis=-1).tolist() == [2, 1, 4, 0, 0]
+        assert result.coincident.tolist() == [False, False, False, False, True]
+        assert np.allclose(np.sort(np.abs(result.points[0][result.real[0]]), axis=0), ((0, 1), (0, 1)))  # noqa: E501
+        assert np.allclose(result.points[1][result.real[1]], ((1, 0),))
+
+    def batch_test(self):
+        rng: np.random.Generator = np.random.default_rng(0)
+        a, b = from_focus_vertex_eccentricity(rng.normal(size=(2, 500, 2)),
+                                              rng.normal(size=(2, 500, 2)),
+                                              rng.uniform(0, 2, (2, 500)))
+
+        result: ConicIntersections = intersect_conics(a, b)
+        points: np.ndarray = np.where(result.real[..., np.newaxis], result.points, 0)  # noqa: E501
+        scales: np.ndarray = (1 + np.abs(points).max(axis=-1)) ** 2
+
+        assert result.real.sum(axis=-1).max() == 4
+        for m in (a, b):
+            assert np.allclose(np.where(result.real, evaluate(m[:, np.newaxis], points) / scales, 0), 0, atol=1e-9)  # noqa: E501
+
+    def segment_cut_test(self):
+        assert conic_cut_points(UNIT_CIRCLE, Segment2D((0, 0), (2, 0))) == [(1, 0)]  # noqa: E501
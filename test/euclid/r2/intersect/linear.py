@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+from sympy.core.numbers import Rational
+from sympy.core.symbol import Symbol
+from sympy.geometry.line import Line2D, Ray2D, Segment2D
+
+from g.euclid.r2.intersect import (LinearEntityBatch, LinearIntersections,
+                                   intersect_all, intersect_pairwise)
+
+
+class TestLinearIntersections:
+    def kinds_test(self):
+        a: LinearEntityBatch = LinearEntityBatch.from_entities(
+            [Line2D((0, 0), (1, 1)), Ray2D((0, 0), (1, 1)),
+             Segment2D((0, 0), (1, 1)), Line2D((0, 0), (1, 1))])
+        b: LinearEntityBatch = LinearEntityBatch.from_entities(
+            [Line2D((0, -2), (1, -2)), Line2D((0, -2), (1, -2)),
+             Segment2D((0, 2), (2, 0)), Line2D((0, 1), (1, 2))])
+
+        result: LinearIntersections = intersect_pairwise(a, b)
+
+        assert np.allclose(result.points[:3], ((-2, -2), (-2, -2), (1, 1)))
+        assert result.intersects.tolist() == [True, False, True, False]
+        assert result.parallel.tolist() == [False, False, False, True]
+        assert not result.coincident.any()
+        assert np.allclose(result.t[2], 1) and np.allclose(result.u[2], .5)
+
+    def all_pairs_test(self):
+        lines: LinearEntityBatch = LinearEntityBatch.from_arrays(
+            [(0, 0), (0, 1), (5, 5)], [(1, 0), (1, 0), (1, 1)])
+
+        result: LinearIntersections = intersect_all(lines)
+
+        assert result.parallel.shape == (3, 3)
+        assert result.coincident.tolist() == [[True, False, False],
+                                              [False, True, False],
+                                              [False, False, True]]
+        assert np.allclose(result.points[0, 2], (0, 0))
+
+    def symbolic_test(self):
+        s: Symbol = Symbol('s')
+        a: LinearEntityBatch = LinearEntityBatch.from_arrays([(s, 0)], [(0, 1)])  # noqa: E501
+        b: LinearEntityBatch = LinearEntityBatch.from_arrays([(0, 3)], [(1, 0)])  # noqa: E501
+
+        result: LinearIntersections = intersect_pairwise(a, b)
+
+        assert a.symbolic and result.intersects.tolist() == [True]
+        assert result.points[0, 0] == s and float(result.points[0, 1]) == 3
+
+    def exact_ranges_test(self):
+        third: Rational = Rational(1, 3)
+        a: LinearEntityBatch = LinearEntityBatch.from_entities(
+            [Segment2D((0, 0), (1, 1))] * 2)
+        b: LinearEntityBatch = LinearEntityBatch.from_entities(
+            [Segment2D((third, 0), (third, 1)), Segment2D((1 + third, 0), (1 + third, 1))])  # noqa: E501
+
+        result: LinearIntersections = intersect_pairwise(a, b)
+
+        assert b.symbolic and result.intersects.tolist() == [True, False]
+        assert result.points[0].tolist() == [third, third]
+
+        # ray from origin meets line x = -s behind its origin
+        s: Symbol = Symbol('s', positive=True)
+        result: LinearIntersections = intersect_pairwise(
+            LinearEntityBatch.from_entities([Ray2D((0, 0), (1, 0))]),
+            LinearEntityBatch.from_arrays([(-s, 0)], [(0, 1)]))
+
+        assert result.t.tolist() == [-s] and result.intersects.tolist() == [False]  # noqa: E501
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from itertools import combinations
+import random
+
+from sympy.geometry.line import Segment2D
+
+from g.euclid.r2.intersect import segment_intersections
+
+
+def _brute_force(segments):
+    def on(point, segment):
+        (x0, y0), (x1, y1) = segment
+        x, y = point
+        return ((x1 - x0) * (y - y0) == (y1 - y0) * (x - x0) and
+                min(x0, x1) <= x <= max(x0, x1) and
+                min(y0, y1) <= y <= max(y0, y1))
+
+    candidates = {tuple(map(Fraction, p)) for segment in segments for p in segment}  # noqa: E501
+
+    # overlaps of collinear segments are only reported at their endpoints
+    for a, b in combinations(segments, 2):
+        ((px, py), (p2x, p2y)), ((qx, qy), (q2x, q2y)) = a, b
+        dx, dy, ex, ey = p2x - px, p2y - py, q2x - qx, q2y - qy
+        if denominator := dx * ey - dy * ex:
+            t = Fraction((qx - px) * ey - (qy - py) * ex, denominator)
+            if on(point := (px + t * dx, py + t * dy), a) and on(point, b):
+                candidates.add(point)
+
+    results = {}
+    for point in candidates:
+        if len(indices := tuple(i for i, segment in enumerate(segments) if on(point, segment))) > 1:  # noqa: E501
+            results[point] = indices
+
+    return results
+
+
+class TestSegmentIntersections:
+    def simple_test(self):
+        results = list(segment_intersections([((0, 0), (2, 2)),
+                                              ((0, 2), (2, 0)),
+                                              ((3, 0), (4, 1))]))
+
+        assert results == [((1.0, 1.0), (0, 1))]
+
+    def degeneracies_test(self):
+        segments = [((0, 0), (4, 0)),     # horizontal
+                    ((2, -1), (2, 3)),    # vertical, crossing 0
+                    ((4, 0), (5, 5)),     # sharing endpoint with 0
+                    ((1, 0), (3, 0)),     # collinear overlap with 0
+                    ((2, 0), (2, 0)),     # zero-length, at crossing
+                    ((0, 2), (4, 2))]     # crossing vertical only
+
+        results = dict(segment_intersections(
+            [Segment2D(*segment) for segment in segments[:4]] + segments[4:],
+            exact=True))
+
+        assert results == {(1, 0): (0, 3), (2, 0): (0, 1, 3, 4),
+                           (3, 0): (0, 3), (4, 0): (0, 2), (2, 2): (1, 5)}
+
+    def random_test(self):
+        rng = random.Random(0)
+
+        for _ in range(30):
+            segments = [((rng.randint(0, 6), rng.randint(0, 6)),
+                         (rng.randint(0, 6), rng.randint(0, 6)))
+                        for _ in range(12)]
+
+            assert dict(segment_intersections(segments, exact=True)) == \
+                _brute_force(segments)
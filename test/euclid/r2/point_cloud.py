@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import numpy as np
+
+from g import Pt
+from g.euclid.r2.point_cloud import PointCloudR2
+from g.euclid.r3.point_cloud import PointCloudR3
+
+
+class TestPointCloud:
+    def vectorized_operations_test(self):
+        cloud: PointCloudR2 = PointCloudR2([(0, 0), (2, 0), (2, 4), (0, 4)])
+
+        assert len(cloud) == 4
+        assert np.allclose(cloud.centroid, (1, 2))
+        assert np.allclose(cloud.distances((0, 0)), (0, 2, 20 ** .5, 4))
+
+        lo, hi = (cloud + (1, -1)).bounding_box
+        assert np.allclose(lo, (1, -1)) and np.allclose(hi, (3, 3))
+
+        assert isinstance(cloud[1:3], PointCloudR2) and len(cloud[1:3]) == 2
+
+    def from_points_test(self):
+        cloud: PointCloudR3 = PointCloudR3.from_points(
+            [Pt(1, 2, 3), Pt(4, 5, 6)])
+
+        assert cloud.coords.shape == (2, 3)
+        assert np.allclose((cloud - (1, 2, 3)).coords, ((0, 0, 0), (3, 3, 3)))  # noqa: E501
+
+    def lazy_points_test(self):
+        cloud: PointCloudR2 = PointCloudR2([(0, 1), (2, 3)])
+
+        assert cloud[1] == Pt(2, 3) and cloud[-1] == Pt(2, 3)
+        assert list(cloud) == [Pt(0, 1), Pt(2, 3)]
+        assert list(PointCloudR3([(1, 2, 3)])) == [Pt(1, 2, 3)]
+
+    def empty_test(self):
+        cloud: PointCloudR2 = PointCloudR2([])
+
+        assert len(cloud) == 0 and list(cloud) == []
+        assert np.isnan(cloud.centroid).all() and cloud.centroid.shape == (2,)
+
+        lo, hi = cloud.bounding_box
+        assert (lo == np.inf).all() and (hi == -np.inf).all()
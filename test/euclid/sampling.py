@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from math import pi
+
+import numpy as np
+from sympy.core.symbol import Symbol
+from sympy.functions.elementary.trigonometric import cos, sin
+
+from g.euclid.sampling import (compile_parametric, sample_adaptive,
+                               sample_parametric)
+
+
+X, Y, Z = Symbol('x', real=True), Symbol('y', real=True), Symbol('z', real=True)  # noqa: E501
+T, U, V = Symbol('t', real=True), Symbol('u', real=True), Symbol('v', real=True)  # noqa: E501
+
+
+class TestSampleParametric:
+    def circle_test(self):
+        r: Symbol = Symbol('r', positive=True)
+        residuals = X - 1 - r * cos(T), Y - r * sin(T)
+
+        misses: int = compile_parametric.cache_info().misses
+
+        for radius in (1, 2, 3):
+            samples: np.ndarray = sample_parametric(residuals, (X, Y), (T,), 9,
+                                                    ((-pi, pi),), bindings={r: radius})  # noqa: E501
+
+            assert samples.shape == (9, 2)
+            assert np.allclose(np.hypot(samples[:, 0] - 1, samples[:, 1]), radius)  # noqa: E501
+
+        # compiled once, whatever the bindings
+        assert compile_parametric.cache_info().misses == misses + 1
+
+    def given_values_and_constants_test(self):
+        samples: np.ndarray = sample_parametric((X - T, Y - 2), (X, Y), (T,),
+                                                [0, .5, 1])
+
+        assert samples.tolist() == [[0, 2], [.5, 2], [1, 2]]
+
+    def surface_test(self):
+        samples: np.ndarray = sample_parametric(
+            (X - U, Y - V, Z - U - V), (X, Y, Z), (U, V), 3, ((0, 1), (0, 1)))
+
+        assert samples.shape == (9, 3)
+        assert np.allclose(samples[:, 2], samples[:, 0] + samples[:, 1])
+
+    def unbound_test(self):
+        try:
+            sample_parametric((X - Symbol('a') * T, Y), (X, Y), (T,), 3)
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError('unbound symbol not detected')
+
+
+class TestSampleAdaptive:
+    def circle_test(self):
+        residuals = X - cos(T), Y - sin(T)
+
+        chunks: list[np.ndarray] = list(sample_adaptive(residuals, (X, Y), T, (-pi, pi), .5, scale=100))  # noqa: E501
+        points: np.ndarray = np.concatenate(chunks)
+
+        assert np.allclose(np.hypot(points[:, 0], points[:, 1]), 1)
+
+        # chords' sagittas within tolerance of .5 / 100
+        for chunk in chunks:
+            midpoints: np.ndarray = (chunk[:-1] + chunk[1:]) / 2
+            assert (1 - np.hypot(midpoints[:, 0], midpoints[:, 1]) <= .005).all()  # noqa: E501
+
+        # sizes grow with visual complexity, not with fixed resolution
+        assert sum(len(chunk) for chunk in sample_adaptive(residuals, (X, Y), T, (-pi, pi), .5, scale=1000)) > len(points)  # noqa: E501
+        assert sum(len(chunk) for chunk in sample_adaptive((X - T, Y - 2 * T), (X, Y), T, (-pi, pi), .5, scale=1000)) < 50  # noqa: E501
+
+    def hyperbola_test(self):
+        # focus-centered polar form of hyperbola, whose radius diverges
+        r = 1 / (1 - 2 * cos(T))
+
+        chunks: list[np.ndarray] = list(sample_adaptive(
+            (X - r * cos(T), Y - r * sin(T)), (X, Y), T, (-pi, pi),
+            bounds=((-10, -10), (10, 10)), scale=100))
+        points: np.ndarray = np.concatenate(chunks)
+
+        assert (np.abs(points) <= 10).all()
+        assert np.allclose(points[:, 0] ** 2 + points[:, 1] ** 2, (1 + 2 * points[:, 0]) ** 2)  # noqa: E501
+
+        # both branches (signs of 1 + 2x), without polylines across asymptotes
+        branches: list[set[float]] = [set(np.sign(1 + 2 * chunk[:, 0]).tolist()) for chunk in chunks]  # noqa: E501
+        assert set.union(*branches) == {-1, 1}
+        assert all(len(branch) == 1 for branch in branches)